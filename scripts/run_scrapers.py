@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Run many venue scrapers in one warm interpreter instead of one workflow each.
+
+Every script in SCHEDULED (the sources that have a scheduled workflow) is
+executed as `__main__` (exactly what `python scripts/<file>.py` does), but
+inside a shared process where supabase.create_client and requests.get/post are
+routed through scrapekit.runtime — one Supabase client, one pooled HTTP
+transport and one set of run-scoped caches for all of them. `--only` can also
+name any other scripts/scrape*.py or scripts/upsert_*.py.
+
+Usage:
+  python scripts/run_scrapers.py                          # every scheduled source
+  python scripts/run_scrapers.py --only bok tattooed-mom  # subset
+  python scripts/run_scrapers.py --workers 6 --budget 1500
+  python scripts/run_scrapers.py --executor process --workers 3
+  python scripts/run_scrapers.py --list
+
+--executor thread (default) runs sources on worker threads of this process.
+--executor process spreads them over a pool of long-lived worker processes,
+each with its own warm imports and shared client; use it for CPU-heavy parsing
+or browser sources. --budget is the total wall-clock allowance in seconds:
+sources not started by then are skipped and ones still running are abandoned.
+"""
+
+import os
+import sys
+import glob
+import time
+import queue
+import runpy
+import argparse
+import threading
+import multiprocessing
+from dataclasses import dataclass
+from typing import List, Optional, TextIO
+
+from scrapekit import runtime
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATTERNS = ("scrape*.py", "upsert_*.py")
+DEFAULT_WORKERS = 4
+
+# Scripts run by a scheduled workflow in .github/workflows; keep in step with them.
+SCHEDULED = (
+    "scrape-black-squirrel.py",
+    "scrape-bok.py",
+    "scrape-brooklyn.py",
+    "scrape-cellar-dog.py",
+    "scrape-cherrystreetpier.py",
+    "scrape-citywinery.py",
+    "scrape-club624.py",
+    "scrape-craftcoven.py",
+    "scrape-dolphin.py",
+    "scrape-ensemble-arts.py",
+    "scrape-helium.py",
+    "scrape-heyday.py",
+    "scrape-kung-fu-necktie.py",
+    "scrape-milkboy.py",
+    "scrape-national-mechanics.py",
+    "scrape-nikki-lopez.py",
+    "scrape-orchestra.py",
+    "scrape-philamoca.py",
+    "scrape-philly700.py",
+    "scrape-punchline-philly.py",
+    "scrape-riot-nerd.py",
+    "scrape-silkcity.py",
+    "scrape-south-street.py",
+    "scrape-stateside-live.py",
+    "scrape-tattooed-mom.py",
+    "scrape-temple-performing-arts.py",
+    "scrape-the-ave-live.py",
+    "scrape-tufas.py",
+    "scrape-underground.py",
+    "scrape-union-transfer.py",
+    "scrape-velvet-whip.py",
+    "scrape-worldcafelive.py",
+    "scrape-wow-philly.py",
+    "scrape-xfinity-comedy.py",
+    "scrape-xfinity-concerts.py",
+    "scrape_chris_jazz.py",
+    "scrape_fillmore.py",
+    "scrape_foundry.py",
+    "scrape_latinvibes.py",
+    "scrape_met.py",
+    "scrape_vinyl.py",
+    "upsert_ansp_to_supabase.py",
+)
+
+@dataclass
+class SourceResult:
+    name: str
+    status: str             # ok | failed | skipped | timeout
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+# ── Discovery ──────────────────────────────────────────────────────────────────
+def source_name(path: str) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for prefix in ("scrape-", "scrape_"):
+        if stem.startswith(prefix):
+            return stem[len(prefix):]
+    return stem
+
+def discover_sources(only: Optional[List[str]] = None, skip: Optional[List[str]] = None) -> List[str]:
+    """SCHEDULED by default; `only` picks from every scrape*/upsert_* script on disk."""
+    paths = sorted({p for pat in SOURCE_PATTERNS for p in glob.glob(os.path.join(SCRIPTS_DIR, pat))})
+
+    def matches(path: str, wanted: List[str]) -> bool:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return source_name(path) in wanted or stem in wanted
+
+    if only:
+        paths = [p for p in paths if matches(p, only)]
+    else:
+        paths = [p for p in paths if os.path.basename(p) in SCHEDULED]
+    if skip:
+        paths = [p for p in paths if not matches(p, skip)]
+    return paths
+
+# ── Per-source stdout prefixing ────────────────────────────────────────────────
+_current = threading.local()
+
+class SourceTaggedStream:
+    """Prefix each line with the source name of the thread that wrote it."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, s: str) -> int:
+        name = getattr(_current, "name", None)
+        if not name:
+            with self._lock:
+                return self._stream.write(s)
+        buf = getattr(_current, "buf", "") + s
+        *lines, rest = buf.split("\n")
+        _current.buf = rest
+        if lines:
+            with self._lock:
+                self._stream.write("".join(f"[{name}] {ln}\n" for ln in lines))
+        return len(s)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._stream.flush()
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+# ── Running one source ─────────────────────────────────────────────────────────
+def run_source(path: str) -> SourceResult:
+    name = source_name(path)
+    _current.name = name
+    started = time.monotonic()
+    status, error = "ok", None
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status, error = "failed", f"exit {e.code}"
+    except Exception as e:
+        status, error = "failed", f"{type(e).__name__}: {e}"
+    finally:
+        if getattr(_current, "buf", ""):
+            print()  # flush a trailing partial line under this source's prefix
+        _current.name = None
+    return SourceResult(name, status, time.monotonic() - started, error)
+
+def _init_worker() -> None:
+    sys.argv = sys.argv[:1]
+    runtime.install()
+    sys.stdout = SourceTaggedStream(sys.__stdout__)
+
+# ── Executors ──────────────────────────────────────────────────────────────────
+def _remaining(deadline: float) -> Optional[float]:
+    if deadline == float("inf"):
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+def run_threads(paths: List[str], workers: int, deadline: float) -> List[SourceResult]:
+    jobs: "queue.Queue[str]" = queue.Queue()
+    results: "queue.Queue[SourceResult]" = queue.Queue()
+    for p in paths:
+        jobs.put(p)
+
+    def worker() -> None:
+        while True:
+            try:
+                path = jobs.get_nowait()
+            except queue.Empty:
+                return
+            if time.monotonic() >= deadline:
+                results.put(SourceResult(source_name(path), "skipped", error="budget exhausted"))
+                continue
+            results.put(run_source(path))
+
+    # Daemon threads so a source that overruns the budget can be abandoned.
+    for _ in range(max(1, min(workers, len(paths)))):
+        threading.Thread(target=worker, daemon=True).start()
+
+    out: List[SourceResult] = []
+    while len(out) < len(paths):
+        try:
+            out.append(results.get(timeout=_remaining(deadline)))
+        except queue.Empty:
+            break
+    return out
+
+def run_processes(paths: List[str], workers: int, deadline: float) -> List[SourceResult]:
+    out: List[SourceResult] = []
+    pool = multiprocessing.Pool(processes=max(1, min(workers, len(paths))), initializer=_init_worker)
+    try:
+        it = pool.imap_unordered(run_source, paths)
+        while len(out) < len(paths):
+            try:
+                out.append(it.next(timeout=_remaining(deadline)))
+            except multiprocessing.TimeoutError:
+                break
+    finally:
+        pool.terminate()
+        pool.join()
+    return out
+
+# ── Main ───────────────────────────────────────────────────────────────────────
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Run venue scrapers in one process.")
+    ap.add_argument("--only", nargs="+",
+                    help="source names to run, scheduled or not (e.g. bok tattooed-mom upsert_fi_events)")
+    ap.add_argument("--skip", nargs="+", help="source names to leave out")
+    ap.add_argument("--workers", type=int, default=int(os.getenv("SCRAPE_WORKERS", DEFAULT_WORKERS)))
+    ap.add_argument("--executor", choices=("thread", "process"), default="thread")
+    ap.add_argument("--budget", type=float, default=float(os.getenv("SCRAPE_BUDGET_SECONDS", 0)) or None,
+                    help="total wall-clock seconds for the whole run")
+    ap.add_argument("--list", action="store_true", help="print the sources that would run and exit")
+    args = ap.parse_args()
+
+    paths = discover_sources(args.only, args.skip)
+    if args.list:
+        for p in paths:
+            print(source_name(p))
+        return 0
+    if not paths:
+        print("No matching sources.")
+        return 1
+
+    print(f"🚀 Running {len(paths)} sources ({args.executor} x{args.workers}"
+          f"{f', budget {args.budget:.0f}s' if args.budget else ''})")
+    started = time.monotonic()
+    deadline = started + args.budget if args.budget else float("inf")
+
+    if args.executor == "process":
+        results = run_processes(paths, args.workers, deadline)
+    else:
+        _init_worker()
+        results = run_threads(paths, args.workers, deadline)
+
+    reported = {r.name for r in results}
+    abandoned = [source_name(p) for p in paths if source_name(p) not in reported]
+    results += [SourceResult(n, "timeout", error="budget exhausted") for n in abandoned]
+
+    sys.stdout = sys.__stdout__
+    print(f"\n🧾 Summary ({time.monotonic() - started:.1f}s wall clock)")
+    for r in sorted(results, key=lambda r: (r.status != "ok", r.name)):
+        icon = {"ok": "✅", "failed": "❌", "skipped": "⏭️ ", "timeout": "⏱️ "}[r.status]
+        print(f"{icon} {r.name:<28} {r.seconds:6.1f}s  {r.error or ''}")
+
+    failed = sum(r.status != "ok" for r in results)
+    print(f"🏁 {len(results) - failed}/{len(results)} sources ok")
+    code = 1 if failed else 0
+    if abandoned and args.executor == "thread":
+        # Sources still running hold non-daemon helper threads (executors,
+        # browsers); don't wait on them past the budget.
+        sys.stdout.flush()
+        os._exit(code)
+    return code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,18 @@ import re
 from datetime import date, datetime
 from urllib.parse import urljoin, urlparse, urlunparse
 
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
 
+from scrapekit.dates import infer_year, month_number, parse_time_range
+from scrapekit.dom import parse_html
+from scrapekit.fetch import fetch_text
+from scrapekit.groupevents import write_group_events
+from scrapekit.tags import get_tags
+from scrapekit.taggings import reconcile_taggings
+
 # ── Static config ───────────────────────────────────────────────────────────────
 GROUP_ID = "2874ddaa-7c44-4c47-bcb1-77b4283e4da7"  # Black Squirrel Club
 USER_ID = "26f671a4-2f54-4377-9518-47c7f21663c7"   # same user as others
@@ -37,10 +43,6 @@ HEADERS = {
 }
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
-MONTHS = {
-    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
-    "JUL": 7, "AUG": 8, "SEP": 9, "SEPT": 9, "OCT": 10, "NOV": 11, "DEC": 12
-}
 _slug_non_alnum = re.compile(r"[^a-z0-9]+")
 
 def slugify(text: str) -> str:
@@ -59,48 +61,11 @@ def canon_link(u: str) -> str | None:
 
 def fetch(url: str) -> BeautifulSoup | None:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
+        return parse_html(fetch_text(url, headers=HEADERS, timeout=30))
     except Exception as e:
         print(f"⚠️  Fetch failed {url}: {e}")
         return None
 
-def coerce_year(month: int, day: int, explicit_year: int | None = None) -> int:
-    if explicit_year:
-        return explicit_year
-    today = date.today()
-    try:
-        candidate = date(today.year, month, day)
-    except Exception:
-        return today.year
-    # If the date this year is >60 days in the past, assume it's next year
-    return today.year + 1 if (today - candidate).days > 60 else today.year
-
-_time_re = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*([AP]M)", re.I)
-def parse_time_12h(t: str) -> str | None:
-    if not t:
-        return None
-    m = _time_re.search(t)
-    if not m:
-        return None
-    hour = int(m.group(1))
-    minute = int(m.group(2) or 0)
-    ampm = m.group(3).upper()
-    if ampm == "PM" and hour != 12:
-        hour += 12
-    if ampm == "AM" and hour == 12:
-        hour = 0
-    return f"{hour:02d}:{minute:02d}:00"
-
-def parse_time_range(text: str) -> tuple[str | None, str | None]:
-    if not text:
-        return (None, None)
-    parts = re.split(r"\s*[-–]\s*", text.strip())
-    start = parse_time_12h(parts[0]) if parts else None
-    end = parse_time_12h(parts[1]) if len(parts) > 1 else None
-    return (start, end)
-
 _year_in_url_re = re.compile(r"(20\d{2})")
 _md_in_url_re = re.compile(r"/([A-Za-z]{3,})-(\d{1,2})-(20\d{2})", re.I)  # .../Oct-05-2025...
 
@@ -123,7 +88,7 @@ def parse_month_day(block_text: str) -> tuple[int | None, int | None]:
     m = re.search(r"\b([A-Z]{3,})\b\s+(\d{1,2})\b", txt)
     if not m:
         return (None, None)
-    mon = MONTHS.get(m.group(1).upper())
+    mon = month_number(m.group(1))
     day = int(m.group(2))
     return (mon, day)
 
@@ -131,39 +96,11 @@ def parse_month_day(block_text: str) -> tuple[int | None, int | None]:
 def get_music_tag_id() -> int | None:
     """Fetch the ID of the Music tag (prefer slug='music')."""
     try:
-        got = sb.table("tags").select("id,name,slug").eq("slug", "music").execute()
-        if got.data:
-            return got.data[0]["id"]
-        got2 = sb.table("tags").select("id,name,slug").eq("name", "Music").execute()
-        if got2.data:
-            return got2.data[0]["id"]
+        return get_tags(sb).id("music")
     except APIError as e:
         print(f"⚠️  Could not fetch Music tag id: {e}")
     return None
 
-def ensure_music_tagging(event_id: str, tag_id: int) -> None:
-    """Create taggings row if not already present."""
-    try:
-        existing = (
-            sb.table("taggings")
-            .select("id")
-            .eq("tag_id", tag_id)
-            .eq("taggable_type", "group_events")
-            .eq("taggable_id", str(event_id))
-            .execute()
-        )
-        if existing.data:
-            print("🏷️  Already tagged: Music")
-            return
-        sb.table("taggings").insert({
-            "tag_id": tag_id,
-            "taggable_type": "group_events",
-            "taggable_id": str(event_id),
-        }).execute()
-        print("🏷️  Tagged with Music")
-    except APIError as e:
-        print(f"⚠️  Tagging failed (Music): {e}")
-
 # ── Scraper ────────────────────────────────────────────────────────────────────
 def scrape() -> list[dict]:
     soup = fetch(LISTING_URL)
@@ -203,7 +140,7 @@ def scrape() -> list[dict]:
         # year: try URL, else infer
         explicit_year = year_from_href(full_href or "")
         if mon and day:
-            year = coerce_year(mon, day, explicit_year)
+            year = infer_year(mon, day, explicit_year)
             try:
                 start_date = date(year, mon, day).isoformat()
             except Exception:
@@ -252,8 +189,8 @@ def upsert_group_events(rows: list[dict]) -> None:
     if not music_tag_id:
         print("⚠️  Skipping tagging: could not resolve 'Music' tag id.")
 
-    for ev in rows:
-        payload = {
+    payloads = [
+        {
             "group_id": ev["group_id"],
             "user_id": USER_ID,              # REQUIRED (NOT NULL)
             "title": ev["title"],
@@ -268,41 +205,13 @@ def upsert_group_events(rows: list[dict]) -> None:
             "image_url": ev.get("image_url"),
             "slug": ev.get("slug"),
         }
+        for ev in rows
+    ]
+    ids = write_group_events(sb, payloads)
 
-        gid = None
-        try:
-            sel = sb.table("group_events").select("id").eq("slug", payload["slug"]).execute()
-            existing = sel.data if hasattr(sel, "data") else []
-        except APIError as e:
-            print(f"❌ Select failed for {payload['slug']}: {e}")
-            existing = []
-
-        if existing:
-            gid = existing[0]["id"]
-            try:
-                # return updated row (works across client versions)
-                sb.table("group_events") \
-                  .update(payload, returning="representation") \
-                  .eq("id", gid) \
-                  .execute()
-                print(f"♻️  Updated: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Update failed for {payload['slug']}: {e}")
-        else:
-            try:
-                # insert and return row (get id)
-                ins = sb.table("group_events") \
-                        .insert(payload, returning="representation") \
-                        .execute()
-                if ins.data:
-                    gid = ins.data[0]["id"]
-                print(f"➕ Inserted: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Insert failed for {payload['slug']}: {e}")
-
-        # Always ensure Music tagging, if we have both pieces
-        if music_tag_id and gid:
-            ensure_music_tagging(gid, music_tag_id)
+    # Always ensure Music tagging, if we have both pieces
+    if music_tag_id:
+        reconcile_taggings(sb, {("group_events", str(gid)): [music_tag_id] for gid in ids if gid})
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
@@ -18,16 +18,17 @@ Taggings rows are written as:
 
 import os
 import re
-import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
 
+from scrapekit.fetch import fetch_text
+from scrapekit.jsonld import iter_blocks
+from scrapekit.tags import get_tags
+
 # ── Config ───────────────────────────────────────────────────────────
 URL = "https://tockify.com/buildingbok/agenda"
 VENUE_NAME = "Bok Building"
@@ -112,9 +113,7 @@ def slugify(text: str) -> str:
 
 def fetch_html(url: str) -> Optional[str]:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return r.text
+        return fetch_text(url, headers=HEADERS, timeout=30)
     except Exception as e:
         print(f"⚠️  Fetch failed: {e}")
         return None
@@ -196,20 +195,10 @@ def scrape_events() -> List[Dict[str, Any]]:
     html = fetch_html(URL)
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
-
     events: List[Dict[str, Any]] = []
     seen: set[str] = set()
 
-    for script in soup.find_all("script", type="application/ld+json"):
-        try:
-            raw = script.string
-            if not raw:
-                continue
-            data = json.loads(raw)
-        except Exception:
-            continue
-
+    for data in iter_blocks(html):
         for ev in _extract_events_from_jsonld(data):
             if ev["link"] in seen:
                 continue
@@ -261,11 +250,16 @@ def _ensure_tags_by_slugs(slugs: List[str]) -> List[Dict[str, Any]]:
     if not uniq:
         return []
     try:
-        resp = sb.table("tags").select("id, slug").in_("slug", uniq).execute()
-        return resp.data or []
+        tags = get_tags(sb)
     except APIError as e:
         print(f"⚠️  Tag fetch failed: {e}")
         return []
+    rows = []
+    for slug in uniq:
+        tid = tags.id(slug)
+        if tid:
+            rows.append({"id": tid, "slug": slug})
+    return rows
 
 def attach_tags_via_taggings(event_id: Any, tag_rows: List[Dict[str, Any]]) -> None:
     """Insert rows into public.taggings for this event, skipping existing ones."""
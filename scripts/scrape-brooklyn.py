@@ -1,11 +1,12 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -32,7 +33,7 @@ def scrape_events():
     URL = "https://www.brooklynbowl.com/philadelphia/shows/all"
     res = requests.get(URL, headers=HEADERS)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     events = []
     for wrapper in soup.select("div.eventList__wrapper .eventItem.entry"):
@@ -69,7 +70,7 @@ def scrape_events():
 def scrape_detail(event_url: str):
     res = requests.get(event_url, headers=HEADERS)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     # Image
     img_tag = soup.select_one("div#branding img.img-responsive")
@@ -15,10 +15,13 @@ import re
 from datetime import datetime
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.tags import get_tags
+from scrapekit.venues import resolve_venue
+
 # ──────────────────────────────────────────────────────────────
 # CONFIG
 # ──────────────────────────────────────────────────────────────
@@ -63,17 +66,11 @@ def ensure_venue():
         "latitude": VENUE_LAT,
         "longitude": VENUE_LNG,
     }
-    res = supabase.table("venues").upsert(payload, on_conflict=["name"], returning="representation").execute()
-    return (res.data or [{}])[0].get("id")
+    return resolve_venue(supabase, payload)
 
 def get_tag_id(tag_name):
     """Find the tag by name (case-insensitive)."""
-    res = supabase.table("tags").select("id,name").execute()
-    tag_id = None
-    for row in res.data:
-        if row["name"].lower() == tag_name.lower():
-            tag_id = row["id"]
-            break
+    tag_id = get_tags(supabase).id(tag_name)
     if tag_id:
         print(f"🎵 Found tag '{tag_name}' (id={tag_id})")
     else:
@@ -100,7 +97,7 @@ def reset_and_insert_taggings(event_id, tag_id):
 def parse_event_list():
     url = f"{BASE_URL}{EVENTS_PATH}"
     html = requests.get(url, headers=HEADERS, timeout=30).text
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     events = []
 
     for art in soup.select("article.eventlist-event"):
@@ -2,19 +2,21 @@
 import os
 import re
 import html
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, date
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from typing import List, Dict, Optional, Tuple, Set
 
+from scrapekit.dom import parse_html, strip_tags
+from scrapekit.enrich import enrich_rows
+from scrapekit.fetch import fetch_text
+from scrapekit.taggings import reconcile_taggings
+
 # ── Config ──────────────────────────────────────────────────────────────
 LISTING_URL = "https://www.cherrystreetpier.com/events/"
 VENUE_ID = 665
 SOURCE = "cherrystreetpier"
 
-TAGGINGS_TABLE = "taggings"
 TAGGABLE_TYPE = "all_events"  # change to "events" if that's your convention
 
 HEADERS = {
@@ -218,9 +220,7 @@ def parse_date_range(date_str: str) -> Tuple[Optional[str], Optional[str]]:
 
 # ── Scrape listing ──────────────────────────────────────────────────────
 def fetch_listing() -> List[Dict]:
-    r = requests.get(LISTING_URL, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(fetch_text(LISTING_URL, headers=HEADERS, timeout=30))
 
     events = []
     cards = soup.select("div.card-event a.card-hit")
@@ -256,12 +256,8 @@ def fetch_listing() -> List[Dict]:
 # ── Detail fetch (times + page text for tagging) ────────────────────────
 def fetch_detail_text(url: str) -> str:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-        return soup.get_text(" ", strip=True)
+        # only the visible text is used (times, tag keywords); no tree needed
+        return strip_tags(fetch_text(url, headers=HEADERS, timeout=30))
     except Exception:
         return ""
 
@@ -274,49 +270,29 @@ def upsert_event(row: Dict) -> Optional[int]:
     data = res.data[0] if res.data else None
     return data["id"] if data and "id" in data else None
 
-def get_existing_tag_ids(event_id: int) -> Set[int]:
-    res = (
-        sb.table(TAGGINGS_TABLE)
-        .select("tag_id")
-        .eq("taggable_type", TAGGABLE_TYPE)
-        .eq("taggable_id", str(event_id))
-        .execute()
-    )
-    if getattr(res, "error", None) or not res.data:
-        return set()
-    return {row["tag_id"] for row in res.data}
-
-def insert_missing_taggings(event_id: int, tag_ids: Set[int]) -> None:
-    if not tag_ids:
-        return
-    existing = get_existing_tag_ids(event_id)
-    to_add = sorted(t for t in tag_ids if t not in existing)
-    if not to_add:
-        return
-    payload = [{"tag_id": t, "taggable_type": TAGGABLE_TYPE, "taggable_id": str(event_id)} for t in to_add]
-    res = sb.table(TAGGINGS_TABLE).insert(payload).execute()
-    if getattr(res, "error", None):
-        print(f"⚠️  Taggings insert issue for event_id={event_id}: {res.error}")
-
 # ── Main ───────────────────────────────────────────────────────────────
 def main():
     print("🔎 Fetching Cherry Street Pier listing…")
     listing = fetch_listing()
     print(f"Found {len(listing)} cards")
 
+    # Single-day events get their times (and tagging text) from the detail page
+    def with_detail_text(it: Dict) -> Dict:
+        if it["start_date"] and it["end_date"] and it["start_date"] == it["end_date"]:
+            it["detail_text"] = fetch_detail_text(it["link"])
+        return it
+
+    listing = enrich_rows(listing, with_detail_text, url=lambda it: it["link"])
+
+    desired: Dict[Tuple[str, str], Set[int]] = {}
     for it in listing:
         title = it["title"]
         link = it["link"]
         start_date = it["start_date"]
         end_date = it["end_date"]
 
-        detail_text = ""
-        start_time = None
-        end_time = None
-        if start_date and end_date and start_date == end_date:
-            detail_text = fetch_detail_text(link)
-            st, et = parse_detail_times(detail_text)
-            start_time, end_time = st, et
+        detail_text = it.get("detail_text") or ""
+        start_time, end_time = parse_detail_times(detail_text)
 
         description = None
         tag_ids = classify_tags(title or "", description, link, detail_text, start_date)
@@ -338,12 +314,13 @@ def main():
         print(f"⏳ Upserting: {title} [{start_date}{' '+(start_time or '') if start_time else ''}]")
         event_id = upsert_event(rec)
         if event_id:
-            insert_missing_taggings(event_id, tag_ids)
             if tag_ids:
-                print(f"   ↳ tags added (new only): {sorted(tag_ids)}")
+                desired[(TAGGABLE_TYPE, str(event_id))] = tag_ids
         else:
             print("   ↳ skipped taggings (no event id)")
 
+    # Add-only: tags curated by hand in the DB are kept
+    reconcile_taggings(sb, desired)
     print("✅ Done.")
 
 if __name__ == "__main__":
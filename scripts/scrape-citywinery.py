@@ -1,19 +1,17 @@
 #!/usr/bin/env python3
 import os
-import json
-import html
-import time
 import re
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from supabase import create_client, Client
 
+from scrapekit.embedded import astro_islands
+from scrapekit.ladder import climb
+from scrapekit.settle import settle_count
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -44,39 +42,30 @@ def get_or_create_venue(client: Client, slug: str, name: str) -> int:
         return r.data[0]["id"]
     raise RuntimeError(f"Could not get or create venue {slug}")
 
+def find_events_props(html_src: str):
+    """Props of the first <astro-island> that carries "events", or None."""
+    return next(astro_islands(html_src, has_key="events"), None)
+
 def scrape_events():
     URL = "https://citywinery.com/philadelphia/events"
 
-    # fetch via Selenium (bypass CF/JS)
-    opts = Options()
-    opts.add_argument("--headless=new")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument(f"user-agent={HEADERS['User-Agent']}")
-    driver = webdriver.Chrome(options=opts)
-    driver.get(URL)
-    time.sleep(5)
-    html_src = driver.page_source
-    driver.quit()
-
-    soup = BeautifulSoup(html_src, "html.parser")
-
-    # find any <astro-island> whose props contain "events"
-    data = None
-    for ai in soup.find_all("astro-island"):
-        props = ai.get("props") or ai.get("data-props")
-        if not props:
-            continue
-        if '"events"' in props:
-            raw = html.unescape(props)
-            data = json.loads(raw)
-            break
+    # headless Chromium is the last tier (bypass CF/JS)
+    async def grab(page):
+        await page.goto(URL, wait_until="domcontentloaded", timeout=60000)
+        # islands appear once any CF interstitial has passed and the page hydrated
+        await settle_count(page, "astro-island", stable_ms=700, timeout_ms=20000)
+        return await page.content()
+
+    # the events live in the page's own HTML, so any tier that gets the page will do
+    html_src = climb(URL, headers=HEADERS, timeout=60, browse=grab, har="citywinery",
+                     accept=lambda text: find_events_props(text) is not None)
+    data = find_events_props(html_src) if html_src else None
 
-    if not data or "events" not in data:
+    raw_ev = data.get("events") if data else None
+    if raw_ev is None:
         print("❌ Could not locate events JSON on the page.")
         return []
 
-    raw_ev = data["events"]
     # shape is often [1, [ [0,obj], [0,obj], ... ]]
     if isinstance(raw_ev, list) and len(raw_ev) >= 2 and isinstance(raw_ev[1], list):
         pairs = raw_ev[1]
@@ -5,12 +5,13 @@ import os
 import re
 import time
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from dateutil import parser as dtparser
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+
 # ──────────────────────────────────────────────────────────────
 # Config
 # ──────────────────────────────────────────────────────────────
@@ -124,7 +125,7 @@ def extract_image(img):
 def extract_description(event_url):
     """Open event detail page and scrape full description HTML→cleaned text."""
     html = fetch_html(event_url)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
 
     body = (
         soup.select_one(".sqs-html-content") or
@@ -191,7 +192,7 @@ def ensure_tags(event_id, tag_ids):
 # ──────────────────────────────────────────────────────────────
 def parse_events():
     html = fetch_html(LIST_URL)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     events = []
 
     for art in soup.select("article.eventlist-event"):
@@ -21,15 +21,24 @@ import json
 import hashlib
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Tuple
-from datetime import date, datetime, timedelta
+from datetime import datetime
 from urllib.parse import urlparse, urlunparse
 
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+from playwright.async_api import TimeoutError as PWTimeout
+
+from scrapekit.browser import with_page
+from scrapekit.dates import parse_span
+from scrapekit.dom import parse_html
+from scrapekit.enrich import enrich_rows
+from scrapekit.fetch import fetch_text
+from scrapekit.groupevents import write_group_events
+from scrapekit.harvest import harvest
+from scrapekit.tags import get_tags
+from scrapekit.taggings import reconcile_taggings
 
 # ── Config ─────────────────────────────────────────────────────────────────────
 SITE_URL  = "https://www.thecraftcoven.org/"
@@ -66,10 +75,6 @@ def get_sb_client() -> Optional[Client]:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
-MONTHS = {
-    "jan":1,"feb":2,"mar":3,"apr":4,"may":5,"jun":6,
-    "jul":7,"aug":8,"sep":9,"sept":9,"oct":10,"nov":11,"dec":12
-}
 _slug_non_alnum = re.compile(r"[^a-z0-9]+")
 
 def slugify(text: str) -> str:
@@ -95,22 +100,6 @@ def short_hash(s: str) -> str:
 def normalize_ws(s: str) -> str:
     return re.sub(r"[ \t]+", " ", (s or "").strip())
 
-# time like "6:30 PM" or "6 PM"
-_TIME_RE = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*([AP]M)\b", re.I)
-
-def parse_time_12h(t: str) -> Optional[str]:
-    if not t: return None
-    m = _TIME_RE.search(t)
-    if not m: return None
-    hour = int(m.group(1))
-    minute = int(m.group(2) or 0)
-    ampm = m.group(3).upper()
-    if ampm == "PM" and hour != 12:
-        hour += 12
-    if ampm == "AM" and hour == 12:
-        hour = 0
-    return f"{hour:02d}:{minute:02d}:00"
-
 _ORD = r"(?:st|nd|rd|th)"
 # Matches:
 # "Sun Oct 5th 12:00 AM - 4:00 PM"
@@ -125,41 +114,13 @@ _DT_RE = re.compile(
     re.I
 )
 
-def coerce_year(month: int, day: int, explicit_year: Optional[int]) -> int:
-    if explicit_year:
-        return explicit_year
-    today = date.today()
-    try:
-        candidate = date(today.year, month, day)
-    except Exception:
-        return today.year
-    return today.year + 1 if (today - candidate).days > 60 else today.year
-
 def parse_dt_from_text(text: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
     if not text:
         return (None, None, None, None)
     m = _DT_RE.search(text)
     if not m:
         return (None, None, None, None)
-    mon_txt = (m.group(2) or "").lower()[:4].strip()
-    mon = MONTHS.get(mon_txt if mon_txt != "sept" else "sept") or MONTHS.get(mon_txt[:3])
-    if not mon:
-        return (None, None, None, None)
-    day = int(m.group(3))
-    year = int(m.group(4)) if m.group(4) else None
-    start_t_raw = m.group(5)
-    end_t_raw = m.group(6) if m.group(6) else None
-    start_time = parse_time_12h(start_t_raw)
-    end_time = parse_time_12h(end_t_raw) if end_t_raw else None
-    year2 = coerce_year(mon, day, year)
-    start_dt = date(year2, mon, day)
-    end_dt = start_dt
-    if start_time and end_time:
-        st = datetime.strptime(f"{start_time}", "%H:%M:%S")
-        et = datetime.strptime(f"{end_time}", "%H:%M:%S")
-        if et <= st:
-            end_dt = start_dt + timedelta(days=1)
-    return (start_dt.isoformat(), end_dt.isoformat(), start_time, end_time)
+    return tuple(parse_span(m.group(0)))
 
 @dataclass
 class Row:
@@ -181,42 +142,16 @@ class Row:
 # ── Tagging helpers ────────────────────────────────────────────────────────────
 def get_tag_id(sb: Client, slug: str, name: str) -> Optional[int]:
     try:
-        got = sb.table("tags").select("id").eq("slug", slug).execute()
-        if getattr(got, "data", None):
-            return got.data[0]["id"]
-        got2 = sb.table("tags").select("id").eq("name", name).execute()
-        if getattr(got2, "data", None):
-            return got2.data[0]["id"]
+        tags = get_tags(sb)
+        return tags.id(slug) or tags.id(name)
     except APIError as e:
         print(f"⚠️  Could not fetch tag id for '{slug}': {e}")
     return None
 
-def ensure_tagging(sb: Client, event_id: str, tag_id: int) -> None:
-    try:
-        existing = (
-            sb.table("taggings")
-            .select("id")
-            .eq("tag_id", tag_id)
-            .eq("taggable_type", "group_events")
-            .eq("taggable_id", str(event_id))
-            .execute()
-        )
-        if getattr(existing, "data", None):
-            return
-        sb.table("taggings").insert({
-            "tag_id": tag_id,
-            "taggable_type": "group_events",
-            "taggable_id": str(event_id),
-        }).execute()
-    except APIError as e:
-        print(f"⚠️  Tagging failed for event {event_id}: {e}")
-
 # ── HTTP helpers for enrichment ────────────────────────────────────────────────
 def fetch_html(url: str) -> Optional[BeautifulSoup]:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
+        return parse_html(fetch_text(url, headers=HEADERS, timeout=30))
     except Exception as e:
         print(f"⚠️  Fetch failed {url}: {e}")
         return None
@@ -423,27 +358,12 @@ JS_HARVEST = """
 }
 """
 
-def collect_events_from_frame(frame) -> List[Row]:
-    anchors: List[Dict[str, str]] = []
-    seen = set()
-    for sel in EVENT_LINK_SELECTORS:
-        try:
-            elts = frame.query_selector_all(sel)
-            for el in elts:
-                try:
-                    a = el.evaluate(JS_HARVEST)
-                except Exception:
-                    continue
-                href = (a.get("href") or "").strip()
-                if not href:
-                    continue
-                key = href.split("#")[0]
-                if key in seen:
-                    continue
-                seen.add(key)
-                anchors.append(a)
-        except Exception:
-            pass
+async def collect_events_from_frame(frame) -> List[Row]:
+    try:
+        anchors: List[Dict[str, str]] = await harvest(frame, EVENT_LINK_SELECTORS, JS_HARVEST)
+    except Exception as e:
+        print(f"⚠️  Could not read event links from the frame: {e}")
+        anchors = []
 
     rows: List[Row] = []
     for a in anchors:
@@ -493,60 +413,53 @@ def collect_events_from_frame(frame) -> List[Row]:
             dedup[key] = ev
     return list(dedup.values())
 
-def scrape() -> List[Row]:
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(user_agent=UA, viewport={"width": 1280, "height": 1800})
-        page = context.new_page()
-        try:
-            page.goto(SITE_URL, wait_until="domcontentloaded", timeout=30000)
-        except PWTimeout:
-            print(f"⚠️  Timed out loading {SITE_URL}")
-            browser.close()
-            return []
-
-        try: page.wait_for_load_state("networkidle", timeout=15000)
-        except PWTimeout: pass
+async def scrape_page(page) -> List[Row]:
+    try:
+        await page.goto(SITE_URL, wait_until="domcontentloaded", timeout=30000)
+    except PWTimeout:
+        print(f"⚠️  Timed out loading {SITE_URL}")
+        return []
 
-        # find an events/tickets iframe
-        target_frame = None
-        try:
-            for fh in page.query_selector_all('iframe[title]'):
-                title = (fh.get_attribute("title") or "").strip()
-                if IFRAME_TITLE_PAT.search(title):
-                    cf = fh.content_frame()
-                    if cf:
-                        target_frame = cf
-                        break
-            if not target_frame:
-                for fh in page.query_selector_all("iframe"):
-                    cf = fh.content_frame()
-                    if cf:
-                        target_frame = cf
-                        break
-        except Exception:
-            pass
+    try: await page.wait_for_load_state("networkidle", timeout=15000)
+    except PWTimeout: pass
 
+    # find an events/tickets iframe
+    target_frame = None
+    try:
+        for fh in await page.query_selector_all('iframe[title]'):
+            title = (await fh.get_attribute("title") or "").strip()
+            if IFRAME_TITLE_PAT.search(title):
+                cf = await fh.content_frame()
+                if cf:
+                    target_frame = cf
+                    break
         if not target_frame:
-            print("⚠️  Could not find an event/ticket iframe on the page.")
-            browser.close()
-            return []
+            for fh in await page.query_selector_all("iframe"):
+                cf = await fh.content_frame()
+                if cf:
+                    target_frame = cf
+                    break
+    except Exception:
+        pass
 
-        try: target_frame.wait_for_load_state("domcontentloaded", timeout=15000)
-        except PWTimeout: pass
-        try: target_frame.wait_for_load_state("networkidle", timeout=15000)
-        except PWTimeout: pass
+    if not target_frame:
+        print("⚠️  Could not find an event/ticket iframe on the page.")
+        return []
 
-        rows = collect_events_from_frame(target_frame)
-        browser.close()
-        return rows
+    try: await target_frame.wait_for_load_state("domcontentloaded", timeout=15000)
+    except PWTimeout: pass
+    try: await target_frame.wait_for_load_state("networkidle", timeout=15000)
+    except PWTimeout: pass
+
+    return await collect_events_from_frame(target_frame)
+
+def scrape() -> List[Row]:
+    return with_page(scrape_page, har="craftcoven", user_agent=UA, viewport={"width": 1280, "height": 1800})
 
 # ── Upsert ─────────────────────────────────────────────────────────────────────
 def upsert_rows(rows: List[Row]) -> None:
     # Enrich each row by visiting its event page
-    enriched: List[Row] = []
-    for r in rows:
-        enriched.append(enrich_from_event_page(r))
+    enriched: List[Row] = enrich_rows(rows, enrich_from_event_page, url=lambda r: r.link)
 
     # Filter out rows missing start_date to satisfy NOT NULL constraint
     filtered = [r for r in enriched if r.start_date]
@@ -572,8 +485,8 @@ def upsert_rows(rows: List[Row]) -> None:
 
     print(f"🔎 Writing {len(filtered)} events to DB...")
 
-    for ev in filtered:
-        payload = {
+    payloads = [
+        {
             "group_id": ev.group_id,
             "user_id": USER_ID,
             "title": ev.title,
@@ -589,37 +502,12 @@ def upsert_rows(rows: List[Row]) -> None:
             "slug": ev.slug,
             "link": ev.link,  # remove if your table doesn't have this column
         }
+        for ev in filtered
+    ]
+    ids = write_group_events(sb, payloads)
 
-        gid = None
-        try:
-            sel = sb.table("group_events").select("id").eq("slug", payload["slug"]).execute()
-            existing = sel.data if hasattr(sel, "data") else []
-        except APIError as e:
-            print(f"❌ Select failed for {payload['slug']}: {e}")
-            existing = []
-
-        if existing:
-            gid = existing[0]["id"]
-            try:
-                sb.table("group_events").update(payload).eq("id", gid).execute()
-                print(f"♻️  Updated: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Update failed for {payload['slug']}: {e}")
-        else:
-            try:
-                ins = sb.table("group_events").insert(payload).execute()
-                if getattr(ins, "data", None) and len(ins.data) > 0 and "id" in ins.data[0]:
-                    gid = ins.data[0]["id"]
-                else:
-                    sel2 = sb.table("group_events").select("id").eq("slug", payload["slug"]).execute()
-                    if getattr(sel2, "data", None):
-                        gid = sel2.data[0]["id"]
-                print(f"➕ Inserted: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Insert failed for {payload['slug']}: {e}")
-
-        if gid and tag_id:
-            ensure_tagging(sb, gid, tag_id)
+    if tag_id:
+        reconcile_taggings(sb, {("group_events", str(gid)): [tag_id] for gid in ids if gid})
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 def main() -> None:
@@ -2,12 +2,13 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 from urllib.parse import urljoin
 
+from scrapekit.dom import parse_html
+
 # ── Env / Supabase ─────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -97,14 +98,14 @@ def scrape_events():
 
     r = requests.get(cal_url, headers=HEADERS, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(r.text)
 
     events = []
 
     # Prefer the <noscript> fallback which contains a clean, static list
     ns = soup.find("noscript")
     if ns:
-        cal_soup = BeautifulSoup(ns.decode_contents(), "html.parser")
+        cal_soup = parse_html(ns.decode_contents())
         for li in cal_soup.select("ul > li"):
             # Title and per-event page
             h1a = li.select_one("h1 a")
@@ -185,7 +186,7 @@ def scrape_events():
         list_url = f"{BASE_URL}{CAL_PATH}?view=list"
         r2 = requests.get(list_url, headers=HEADERS, timeout=30)
         r2.raise_for_status()
-        lsoup = BeautifulSoup(r2.text, "html.parser")
+        lsoup = parse_html(r2.text)
 
         for item in lsoup.select("div.event-list-item, div.sqs-event-summary"):
             a = item.find("a", href=True)
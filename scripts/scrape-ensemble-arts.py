@@ -3,20 +3,18 @@
 
 import os
 import re
-import time
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from typing import Optional
 
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
-# Selenium (headless Chrome)
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from scrapekit.browser import with_page
+from scrapekit.dates import infer_year
+from scrapekit.dom import parse_html
+from scrapekit.settle import settle_count
+from scrapekit.writer import bulk_upsert
 
 LIST_URL = "https://www.ensembleartsphilly.org/tickets-and-events/events"
 VENUE_SLUG = "kimmel-center"
@@ -49,16 +47,6 @@ def month_to_int(mon_str: str) -> Optional[int]:
     k = k[:4] if k.startswith(("sept",)) else k[:3]
     return MONTHS.get(k)
 
-def infer_year(m: int, d: int, explicit_year: Optional[int]) -> int:
-    if explicit_year:
-        return explicit_year
-    today = date.today()
-    try:
-        candidate = date(today.year, m, d)
-    except ValueError:
-        return today.year
-    return today.year + 1 if candidate < (today - timedelta(days=3)) else today.year
-
 def parse_first_date(text: str) -> Optional[str]:
     if not text:
         return None
@@ -71,7 +59,7 @@ def parse_first_date(text: str) -> Optional[str]:
     if not mon:
         return None
     try:
-        return date(infer_year(mon, day, yr), mon, day).isoformat()
+        return date(infer_year(mon, day, yr, rollover_days=3), mon, day).isoformat()
     except ValueError:
         return None
 
@@ -121,35 +109,33 @@ def find_venue_id() -> Optional[int]:
         print(f"⚠️  Venue lookup failed: {e}")
         return None
 
-# ── Selenium ───────────────────────────────────────────────────────────────────
-def build_driver() -> webdriver.Chrome:
-    opts = Options()
-    opts.add_argument("--headless=new")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--window-size=1400,1600")
-    opts.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/122.0.0.0 Safari/537.36")
-    return webdriver.Chrome(options=opts)
+# ── Headless browser ───────────────────────────────────────────────────────────
+BROWSER_CONTEXT = dict(
+    viewport={"width": 1400, "height": 1600},
+    user_agent=("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/122.0.0.0 Safari/537.36"),
+)
+
+CARD_SELECTOR = ".events-grid__item a.event-item"
+
+async def load_listing(page) -> str:
+    await page.goto(LIST_URL, wait_until="domcontentloaded", timeout=60000)
+    await page.wait_for_selector(CARD_SELECTOR, state="attached", timeout=25000)
+    # Scroll to load more results, stopping once a scroll brings nothing new
+    count = await page.locator(CARD_SELECTOR).count()
+    for _ in range(8):
+        await page.evaluate("window.scrollBy(0, 2000);")
+        grown = await settle_count(page, CARD_SELECTOR, stable_ms=400, timeout_ms=3000, min_count=count + 1)
+        if grown <= count:
+            break
+        count = grown
+    return await page.content()
 
 def scrape_events() -> list[dict]:
-    driver = build_driver()
-    try:
-        driver.get(LIST_URL)
-        WebDriverWait(driver, 25).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".events-grid__item a.event-item"))
-        )
-        # Scroll to load more results
-        for _ in range(8):
-            driver.execute_script("window.scrollBy(0, 2000);")
-            time.sleep(0.8)
-        html = driver.page_source
-    finally:
-        driver.quit()
-
-    soup = BeautifulSoup(html, "html.parser")
+    html = with_page(load_listing, har="ensemble-arts", **BROWSER_CONTEXT)
+
+    soup = parse_html(html)
     rows = []
 
     for card in soup.select(".events-grid__item a.event-item"):
@@ -205,8 +191,8 @@ def upsert_all_events(events: list[dict], venue_id: Optional[int]) -> None:
     if not events:
         print("No events to write.")
         return
-    for ev in events:
-        record = {
+    records = [
+        {
             "venue_id":    venue_id,
             "name":        ev["title"],
             "link":        ev["link"],
@@ -219,11 +205,9 @@ def upsert_all_events(events: list[dict], venue_id: Optional[int]) -> None:
             "slug":        ev["slug"],
             "source":      "ensemblearts",
         }
-        try:
-            sb.table("all_events").upsert(record, on_conflict=["link"]).execute()
-            print(f"✅ Upserted: {ev['title']} ({ev['start_date']})")
-        except Exception as e:
-            print(f"❌ Upsert failed for {ev['title']}: {e}")
+        for ev in events
+    ]
+    bulk_upsert(sb, "all_events", records, on_conflict="link")
 
 if __name__ == "__main__":
     evs = scrape_events()
@@ -19,16 +19,18 @@ ENV:
 
 import os
 import re
-import json
-import time
-import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from html import unescape
 
+from scrapekit.dates import local_parts
+from scrapekit.fetch import fetch_text
+from scrapekit.jsonld import iter_blocks, iter_nodes
+from scrapekit.venues import resolve_venue
+from scrapekit.writer import bulk_upsert
+
 # ── Config ────────────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -63,25 +65,6 @@ def slugify(text: str) -> str:
     s = _slug_non_alnum.sub("-", s)
     return s.strip("-")
 
-def parse_utc_to_et(dt_str: str | None) -> tuple[str | None, str | None]:
-    """
-    Parse ISO datetime ('2025-11-01T01:15:00Z' / '+00:00') and convert to ET.
-    Returns ('YYYY-MM-DD','HH:MM:SS') in America/New_York.
-    """
-    if not dt_str:
-        return (None, None)
-    try:
-        s = str(dt_str).replace("Z", "+00:00")
-        dt_utc = datetime.fromisoformat(s)
-        if dt_utc.tzinfo is None:
-            dt_utc = dt_utc.replace(tzinfo=ZoneInfo("UTC"))
-        else:
-            dt_utc = dt_utc.astimezone(ZoneInfo("UTC"))
-        dt_et = dt_utc.astimezone(ZoneInfo("America/New_York"))
-        return (dt_et.date().isoformat(), dt_et.strftime("%H:%M:%S"))
-    except Exception:
-        return (None, None)
-
 # Remove figures/images/hr entirely, then strip remaining tags to produce clean text
 _strip_blocks_re = re.compile(r"(?is)<(figure)\b.*?>.*?</\1>|<(img|hr)\b[^>]*>")
 _tag_re = re.compile(r"(?s)<[^>]+>")
@@ -97,15 +80,6 @@ def clean_description(html: str | None) -> str | None:
     s = re.sub(r"\n\s*\n+", "\n\n", s).strip()
     return s or None
 
-def get_soup(url: str) -> BeautifulSoup | None:
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=35)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
-    except Exception as e:
-        print(f"⚠️  Fetch failed {url}: {e}")
-        return None
-
 def coalesce(*vals):
     for v in vals:
         if v:
@@ -113,22 +87,6 @@ def coalesce(*vals):
     return None
 
 # ── JSON-LD harvest ───────────────────────────────────────────────────────────
-def load_json_lenient(raw: str) -> dict | list | None:
-    """
-    Helium sometimes ships malformed keys like '":@context"'.
-    Clean common issues and parse.
-    """
-    cleaned = re.sub(r'"\s*:@', '"@', raw)
-    try:
-        return json.loads(cleaned)
-    except Exception:
-        cleaned2 = re.sub(r",\s*([}\]])", r"\1", cleaned)
-        try:
-            return json.loads(cleaned2)
-        except Exception as e:
-            print(f"⚠️  JSON-LD parse failed: {e}")
-            return None
-
 def find_place_with_events(objs: list[dict]) -> dict | None:
     for o in objs:
         if not isinstance(o, dict):
@@ -147,7 +105,7 @@ def normalize_event(ev: dict) -> dict:
     link  = ev.get("url")
     img   = ev.get("image")
     desc  = clean_description(ev.get("description"))
-    start_date, start_time = parse_utc_to_et(ev.get("startDate") or ev.get("start_date"))
+    start_date, start_time = local_parts(ev.get("startDate") or ev.get("start_date"), assume=timezone.utc)
 
     tail = (link or "").rstrip("/").split("/")[-1] if link else ""
     tail = tail if (tail and not tail.isdigit()) else ""
@@ -175,20 +133,14 @@ def normalize_event(ev: dict) -> dict:
     }
 
 def scrape_listing() -> list[dict]:
-    soup = get_soup(LIST_URL)
-    if not soup:
+    try:
+        html = fetch_text(LIST_URL, headers=HEADERS, timeout=35)
+    except Exception as e:
+        print(f"⚠️  Fetch failed {LIST_URL}: {e}")
         return []
 
-    blocks = []
-    for s in soup.select('script[type="application/ld+json"]'):
-        raw = s.string or s.get_text()
-        data = load_json_lenient(raw)
-        if data is None:
-            continue
-        if isinstance(data, list):
-            blocks.extend(data)
-        else:
-            blocks.append(data)
+    # Helium's malformed '":@context"' keys are handled by the lenient loader
+    blocks = [node for data in iter_blocks(html) for node in iter_nodes(data)]
 
     place = find_place_with_events(blocks)
     if not place:
@@ -221,15 +173,11 @@ def scrape_listing() -> list[dict]:
 # ── Supabase upserts ───────────────────────────────────────────────────────────
 def get_or_upsert_venue(name: str) -> int:
     slug = slugify(name)
-    resp = sb.table("venues").upsert(
-        {"name": name, "slug": slug, "address": VENUE_ADDR},
-        on_conflict=["slug"],
-        returning="representation",
-    ).execute()
-    return resp.data[0]["id"]
+    return resolve_venue(sb, {"name": name, "slug": slug, "address": VENUE_ADDR}, on_conflict="slug")
 
 def upsert_all_events(rows: list[dict]) -> None:
     venue_id = get_or_upsert_venue(VENUE_NAME)
+    recs = []
     for ev in rows:
         rec = {
             "name": ev.get("title"),
@@ -246,12 +194,8 @@ def upsert_all_events(rows: list[dict]) -> None:
         if not rec["start_date"]:
             print(f"⚠️  Skipping (no date): {rec['name']}")
             continue
-        try:
-            sb.table("all_events").upsert(rec, on_conflict=["link"]).execute()
-            print(f"✅ Upserted: {rec['name']} ({rec['start_date']} {rec['start_time'] or ''})")
-        except Exception as e:
-            print(f"❌ Upsert failed for {rec['name']}: {e}")
-        time.sleep(0.1)
+        recs.append(rec)
+    bulk_upsert(sb, "all_events", recs, on_conflict="link")
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
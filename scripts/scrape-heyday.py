@@ -2,10 +2,11 @@
 
 import os
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from scrapekit.dom import parse_html
+
 load_dotenv()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -17,7 +18,7 @@ URL = "https://philadelphia.leaguelab.com/leagues"
 
 def scrape_heyday_leagues():
     res = requests.get(URL)
-    soup = BeautifulSoup(res.text, 'html.parser')
+    soup = parse_html(res.text)
     leagues = []
 
     rows = soup.find_all('tr', class_='widget-league-listing')
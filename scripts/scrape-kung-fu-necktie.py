@@ -2,11 +2,13 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
@@ -99,7 +101,7 @@ def scrape_events():
     print(f"🔗 Using listing: {LISTING_URL}")
     res = requests.get(LISTING_URL, headers=HEADERS, timeout=30)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     cards = soup.select(".rhpSingleEvent.rhp-event__single-event--list")
     print(f"🔎 Found {len(cards)} KFN cards (raw)")
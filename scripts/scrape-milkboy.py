@@ -1,11 +1,12 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -33,7 +34,7 @@ def scrape_events():
     URL = "https://milkboyphilly.com/"
     res = requests.get(URL, headers=HEADERS)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     events = []
     for wrapper in soup.select("div.sg-events__event"):
@@ -3,12 +3,15 @@ import os
 import re
 import time
 import requests
-from bs4 import BeautifulSoup
 from dateutil import parser as dtparser
 from urllib.parse import urljoin
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.stream import prefetch, upsert_batches
+from scrapekit.taggings import reconcile_taggings
+
 # ───────────────────────────────────────────────
 # CONFIG
 # ───────────────────────────────────────────────
@@ -18,6 +21,7 @@ BASE_URL = "https://www.amrevmuseum.org"
 LIST_URL = f"{BASE_URL}/at-the-museum/events"
 VENUE_NAME = "Museum of the American Revolution"
 SOURCE_KEY = "amrevmuseum"
+BATCH_SIZE = 25         # about one listing page, so rows land while the crawl runs
 
 TAG_MAP = {
     "Concerts & Performances": 6,          # Music
@@ -121,90 +125,88 @@ def parse_date_range(date_text):
 # ───────────────────────────────────────────────
 # SCRAPER
 # ───────────────────────────────────────────────
-def parse_events():
-    events = []
+def parse_card(card):
+    title = card.select_one(".m-card__title")
+    title = title.get_text(strip=True) if title else None
+    date_text = card.select_one(".m-card__subtitle")
+    date_text = date_text.get_text(strip=True) if date_text else None
+    desc = card.select_one(".m-card__text")
+    desc = desc.get_text(strip=True) if desc else None
+    link = card.select_one(".m-card__content a.a-cta")
+    link = urljoin(BASE_URL, link["href"]) if link else None
+    img = card.select_one(".m-card__image img")
+    image = urljoin(BASE_URL, img["src"]) if img and img.has_attr("src") else None
+    cats = [c.get_text(strip=True) for c in card.select(".m-card__labels a")]
+
+    tag_id = None
+    for c in cats:
+        if c in TAG_MAP:
+            tag_id = TAG_MAP[c]
+            break
+
+    if not title or not link:
+        return None
+
+    return {
+        "name": title,
+        "link": link,
+        "image": image,
+        "start_date": parse_date_range(date_text or ""),
+        "description": desc,
+        "tag_id": tag_id,
+    }
+
+
+def parse_pages():
+    """Each listing page's events, fetched one ?page=N at a time."""
     page = 1
     while True:
         url = LIST_URL if page == 1 else f"{LIST_URL}?page={page}"
-        html = fetch_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(fetch_html(url))
         cards = soup.select(".m-card.m-card--date")
         if not cards:
-            break
-
-        for card in cards:
-            title = card.select_one(".m-card__title")
-            title = title.get_text(strip=True) if title else None
-            date_text = card.select_one(".m-card__subtitle")
-            date_text = date_text.get_text(strip=True) if date_text else None
-            desc = card.select_one(".m-card__text")
-            desc = desc.get_text(strip=True) if desc else None
-            link = card.select_one(".m-card__content a.a-cta")
-            link = urljoin(BASE_URL, link["href"]) if link else None
-            img = card.select_one(".m-card__image img")
-            image = urljoin(BASE_URL, img["src"]) if img and img.has_attr("src") else None
-            cats = [c.get_text(strip=True) for c in card.select(".m-card__labels a")]
-
-            tag_id = None
-            for c in cats:
-                if c in TAG_MAP:
-                    tag_id = TAG_MAP[c]
-                    break
-
-            start_date = parse_date_range(date_text or "")
-
-            if not title or not link:
-                continue
-
-            events.append(
-                {
-                    "name": title,
-                    "link": link,
-                    "image": image,
-                    "start_date": start_date,
-                    "description": desc,
-                    "tag_id": tag_id,
-                }
-            )
-
+            return
+        yield [ev for ev in map(parse_card, cards) if ev]
         if len(cards) < 10:
-            break
+            return
         page += 1
-    return events
 
 
 # ───────────────────────────────────────────────
 # SUPABASE UPSERT
 # ───────────────────────────────────────────────
+def to_record(ev, venue_id):
+    return {
+        "name": ev["name"],
+        "link": ev["link"],
+        "image": ev.get("image"),
+        "start_date": ev.get("start_date"),
+        "venue_id": venue_id,
+        "source": SOURCE_KEY,
+        "slug": slugify(ev["name"]),
+        "long_description": ev.get("description"),
+    }
+
+
 def upsert_data(events):
+    """Write `events` (any iterable, consumed lazily) in batches; returns how many were seen."""
     venue_id = get_or_create_venue_id()
     print(f"🏛 Venue ID: {venue_id}")
-    for ev in events:
-        slug = slugify(ev["name"])
-        record = {
-            "name": ev["name"],
-            "link": ev["link"],
-            "image": ev.get("image"),
-            "start_date": ev.get("start_date"),
-            "venue_id": venue_id,
-            "source": SOURCE_KEY,
-            "slug": slug,
-            "long_description": ev.get("description"),
-        }
-        res = supabase.table("all_events").upsert(record, on_conflict="link").execute()
-        if not res.data:
-            print(f"⚠️ Failed to upsert {ev['name']}")
-            continue
-
-        print(f"✅ Upserted {ev['name']}")
-        if ev.get("tag_id"):
-            tag = {
-                "tag_id": ev["tag_id"],
-                "taggable_type": "all_events",
-                "taggable_id": res.data[0]["id"],
-            }
-            supabase.table("taggings").upsert(tag).execute()
-            print(f"🏷️ Tagged with {ev['tag_id']}")
+    seen = 0
+    for batch, saved in upsert_batches(supabase, "all_events", events, on_conflict="link",
+                                       size=BATCH_SIZE, to_row=lambda ev: to_record(ev, venue_id)):
+        seen += len(batch)
+        desired = {}
+        for ev, row in zip(batch, saved):
+            if not row:
+                print(f"⚠️ Failed to upsert {ev['name']}")
+                continue
+            print(f"✅ Upserted {ev['name']}")
+            if ev.get("tag_id"):
+                desired[("all_events", str(row["id"]))] = {ev["tag_id"]}
+        if desired:
+            reconcile_taggings(supabase, desired)
+    return seen
 
 
 # ───────────────────────────────────────────────
@@ -212,12 +214,11 @@ def upsert_data(events):
 # ───────────────────────────────────────────────
 def run():
     print("🎨 Scraping Museum of the American Revolution...")
-    events = parse_events()
-    print(f"📅 Found {len(events)} events.")
-    if events:
-        upsert_data(events)
+    # the next listing page is fetched while the current one is being written
+    events = (ev for page in prefetch(parse_pages()) for ev in page)
+    count = upsert_data(events)
+    print(f"📅 Found {count} events.")
     print("🎉 Done!")
 
-
 if __name__ == "__main__":
     run()
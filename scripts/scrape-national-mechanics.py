@@ -8,10 +8,13 @@ URL: https://nationalmechanics.com/philadelphia-national-mechanics-events
 import os, re, hashlib
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.tags import get_tags
+from scrapekit.venues import resolve_venue
+
 # ───────────────────────────────
 # CONFIG
 # ───────────────────────────────
@@ -42,24 +45,21 @@ def slugify(text):
     return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
 
 def ensure_venue():
-    res = supabase.table("venues").upsert(
+    return resolve_venue(
+        supabase,
         {
             "name": VENUE_NAME,
             "address": VENUE_ADDR,
             "latitude": VENUE_LAT,
             "longitude": VENUE_LNG,
         },
-        on_conflict=["name"],
-        returning="representation",
-    ).execute()
-    return (res.data or [{}])[0].get("id")
+    )
 
 def get_tag_id(tag_name):
-    res = supabase.table("tags").select("id,name").execute()
-    for row in (res.data or []):
-        if row["name"].lower() == tag_name.lower():
-            print(f"🏷️ Found tag '{tag_name}' (id={row['id']})")
-            return row["id"]
+    tag_id = get_tags(supabase).id(tag_name)
+    if tag_id:
+        print(f"🏷️ Found tag '{tag_name}' (id={tag_id})")
+        return tag_id
     print(f"⚠️ Tag '{tag_name}' not found.")
     return None
 
@@ -103,7 +103,7 @@ def make_unique_link(base_url, event):
 # ───────────────────────────────
 def parse_events():
     html = requests.get(BASE_URL, headers=HEADERS, timeout=30).text
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     events = []
 
     for section in soup.select(".events-holder section"):
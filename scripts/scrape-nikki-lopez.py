@@ -18,6 +18,10 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.tags import get_tags
+from scrapekit.venues import resolve_venue
+
 # ─────────────────────────────────────────────
 # CONFIG
 # ─────────────────────────────────────────────
@@ -61,19 +65,13 @@ def slugify(text: str) -> str:
     return re.sub(r"-{2,}", "-", text).strip("-")
 
 def ensure_venue():
-    res = supabase.table("venues").upsert(
-        {"name": VENUE_NAME, "address": VENUE_ADDR, "latitude": VENUE_LAT, "longitude": VENUE_LNG},
-        on_conflict=["name"],
-        returning="representation"
-    ).execute()
-    return (res.data or [{}])[0].get("id")
+    return resolve_venue(supabase, {"name": VENUE_NAME, "address": VENUE_ADDR, "latitude": VENUE_LAT, "longitude": VENUE_LNG})
 
 def get_tag_id(tag_name: str) -> int | None:
-    res = supabase.table("tags").select("id,name").execute()
-    for row in (res.data or []):
-        if row["name"].lower() == tag_name.lower():
-            print(f"🎵 Found tag '{tag_name}' (id={row['id']})")
-            return row["id"]
+    tag_id = get_tags(supabase).id(tag_name)
+    if tag_id:
+        print(f"🎵 Found tag '{tag_name}' (id={tag_id})")
+        return tag_id
     print(f"⚠️ Tag '{tag_name}' not found — events will be saved without taggings.")
     return None
 
@@ -143,7 +141,7 @@ def parse_date_from_text(text: str) -> str | None:
 
 def parse_events() -> list[dict]:
     html = requests.get(BASE_URL, headers=HEADERS, timeout=30).text
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
 
     events: list[dict] = []
     for section in soup.select("section.s-section"):
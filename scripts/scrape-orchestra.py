@@ -2,11 +2,12 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+
 # ── Load env & init Supabase (service-role first) ─────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -31,7 +32,7 @@ def scrape_events():
     URL = "https://www.ensembleartsphilly.org/tickets-and-events/philadelphia-orchestra/2024-25-season"
     res = requests.get(URL, headers=HEADERS)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     events = []
     for item in soup.select("div.events-grid__item a.event-item"):
@@ -1,11 +1,12 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -38,7 +39,7 @@ def scrape_events():
     URL = "https://www.philamoca.org/"
     res = requests.get(URL, headers=HEADERS)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     events = []
     for a in soup.select("a.event.event--tickets-available"):
@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
-import os, re, json, html as htmllib
+import os, re, html as htmllib
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import html_text
+from scrapekit.fingerprint import is_changed, remember
+from scrapekit.jsonld import iter_events
+from scrapekit.tags import get_tags
+from scrapekit.venues import resolve_venues
+from scrapekit.taggings import CHUNK_SIZE as TAGGING_CHUNK, reconcile_taggings
+
 # ── Env & Supabase ────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -53,8 +59,10 @@ def text_clean(raw: Optional[str]) -> Optional[str]:
     if not raw:
         return None
     unescaped = htmllib.unescape(raw)
-    clean = BeautifulSoup(unescaped, "html.parser").get_text(" ", strip=True)
-    return clean or None
+    if "<" not in unescaped:
+        # plain text (the usual case): no document needed
+        return unescaped.strip() or None
+    return html_text(unescaped) or None
 
 def first_nonempty(*vals) -> Optional[str]:
     for v in vals:
@@ -62,25 +70,6 @@ def first_nonempty(*vals) -> Optional[str]:
             return v
     return None
 
-# ── Tag cache (LOOKUP ONLY — no creation) ─────────────────────────────────────
-class TagCache:
-    def __init__(self, client: Client):
-        self.client = client
-        self.cache: Dict[str, Optional[int]] = {}
-
-    def get_id(self, slug: str) -> Optional[int]:
-        if slug in self.cache:
-            return self.cache[slug]
-        # lookup only
-        res = (
-            self.client.table("tags").select("id").eq("slug", slug).limit(1).execute()
-        )
-        tid = res.data[0]["id"] if res.data else None
-        self.cache[slug] = tid
-        return tid
-
-tag_cache = TagCache(supabase)
-
 # ── Tag inference rules ───────────────────────────────────────────────────────
 COMEDY_PAT = re.compile(r"\b(comedy|stand[-\s]*up|standup|open\s*mic)\b", re.I)
 MUSIC_WORD_PAT = re.compile(r"\bmusic\b", re.I)
@@ -114,34 +103,7 @@ def fetch_html(url: str) -> str:
     return resp.text
 
 def parse_jsonld_events(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
-    blocks = soup.find_all("script", {"type": "application/ld+json"})
-    out: List[Dict[str, Any]] = []
-    for b in blocks:
-        raw = (b.string or "").strip()
-        if not raw:
-            continue
-        try:
-            data = json.loads(raw)
-        except Exception:
-            raw2 = raw.replace("&quot;", '"')
-            try:
-                data = json.loads(raw2)
-            except Exception:
-                continue
-        items = data if isinstance(data, list) else [data]
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            typ = item.get("@type", "")
-            if isinstance(typ, list):
-                is_event = any(t.lower().endswith("event") for t in typ if isinstance(t, str))
-            else:
-                is_event = isinstance(typ, str) and typ.lower().endswith("event")
-            if not is_event:
-                continue
-            out.append(item)
-    return out
+    return [ev["raw"] for ev in iter_events(html)]
 
 def normalize_event(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     # Clean title/description
@@ -220,28 +182,25 @@ def scrape_events() -> List[Dict[str, Any]]:
     return events
 
 # ── DB upserts ────────────────────────────────────────────────────────────────
-def get_or_create_venue_id(venue_name: Optional[str], addr: Optional[str], lat: Any, lon: Any) -> Optional[str]:
-    if not venue_name:
+def venue_payload(ev: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not ev.get("venue_name"):
         return None
-    payload = {"name": venue_name}
-    if addr:
-        payload["address"] = addr
-    if lat:
-        payload["latitude"] = lat
-    if lon:
-        payload["longitude"] = lon
-    res = supabase.table("venues").upsert(payload, on_conflict=["name"], returning="representation").execute()
-    return res.data[0]["id"] if res.data else None
-
-def upsert_event(ev: Dict[str, Any]) -> Optional[int]:
-    venue_id = get_or_create_venue_id(ev["venue_name"], ev["venue_address"], ev["venue_latitude"], ev["venue_longitude"])
+    payload = {"name": ev["venue_name"]}
+    if ev.get("venue_address"):
+        payload["address"] = ev["venue_address"]
+    if ev.get("venue_latitude"):
+        payload["latitude"] = ev["venue_latitude"]
+    if ev.get("venue_longitude"):
+        payload["longitude"] = ev["venue_longitude"]
+    return payload
+
+def build_record(ev: Dict[str, Any]) -> Dict[str, Any]:
     rec: Dict[str, Any] = {
         "name": ev["title"],
         "link": ev["link"],
         "image": ev["image"],
         "start_date": ev["start_date"],
         "description": ev["description"],
-        "venue_id": venue_id,
         "source": "philly700",
         "slug": ev["slug"],
     }
@@ -249,51 +208,74 @@ def upsert_event(ev: Dict[str, Any]) -> Optional[int]:
         rec["start_time"] = ev["start_time"]
     if ev.get("end_time"):
         rec["end_time"] = ev["end_time"]
+    return rec
+
+def upsert_event(ev: Dict[str, Any], venue_ids: Dict[str, Any]) -> Optional[int]:
+    rec = build_record(ev)
+    if ev.get("venue_name"):
+        rec["venue_id"] = venue_ids[ev["venue_name"]]
     res = supabase.table("all_events").upsert(rec, on_conflict=["link"], returning="representation").execute()
     if not res.data:
         return None
     return res.data[0]["id"]
 
-def upsert_taggings_for_type(taggable_type: str, taggable_id: str, tag_ids: List[int]) -> None:
-    if not tag_ids:
-        return
-    existing = (
-        supabase.table("taggings")
-        .select("tag_id")
-        .eq("taggable_type", taggable_type)
-        .eq("taggable_id", taggable_id)
-        .in_("tag_id", tag_ids)
-        .execute()
-    ).data or []
-    have = {row["tag_id"] for row in existing}
-    to_insert = [
-        {"tag_id": tid, "taggable_type": taggable_type, "taggable_id": taggable_id}
-        for tid in tag_ids if tid not in have
-    ]
-    if to_insert:
-        supabase.table("taggings").insert(to_insert).execute()
-
-def mirror_tags_to_recurring(slug: str, link: str, tag_ids: List[int]) -> None:
-    if not tag_ids:
-        return
-    rec = supabase.table("recurring_events").select("id, slug, link").or_(
-        f"slug.eq.{slug},link.eq.{link}"
-    ).limit(1).execute()
-    if rec.data:
-        rid = str(rec.data[0]["id"])
-        upsert_taggings_for_type("recurring_events", rid, tag_ids)
+def recurring_ids(column: str, values: List[str]) -> Dict[str, str]:
+    """{value: recurring_events.id} for the rows whose `column` is in `values`."""
+    out: Dict[str, str] = {}
+    for i in range(0, len(values), TAGGING_CHUNK):
+        res = (
+            supabase.table("recurring_events")
+            .select(f"id, {column}")
+            .in_(column, values[i:i + TAGGING_CHUNK])
+            .execute()
+        )
+        for row in res.data or []:
+            out.setdefault(row[column], str(row["id"]))
+    return out
+
+def mirror_tags_to_recurring(tagged: List[tuple], desired: Dict[tuple, Set[int]]) -> Dict[str, tuple]:
+    """
+    Adds each (slug, link, tag_ids) to the recurring_events row matching its slug, else its link.
+    Returns {link: recurring taggable key} for the events that were mirrored.
+    """
+    mirrored: Dict[str, tuple] = {}
+    if not tagged:
+        return mirrored
+    by_slug = recurring_ids("slug", sorted({slug for slug, _, _ in tagged if slug}))
+    by_link = recurring_ids("link", sorted({link for _, link, _ in tagged if link}))
+    for slug, link, tag_ids in tagged:
+        rid = by_slug.get(slug) or by_link.get(link)
+        if rid:
+            desired.setdefault(("recurring_events", rid), set()).update(tag_ids)
+            mirrored[link] = ("recurring_events", rid)
+    return mirrored
 
 def upsert_data(events: List[Dict[str, Any]]):
-    # resolve base tags if present (lookup only)
+    # resolve base tags if present (lookup only — no creation)
+    tag_cache = get_tags(supabase)
     base_tag_ids = {
-        "music": tag_cache.get_id("music"),
-        "comedy": tag_cache.get_id("comedy"),
-        "arts": tag_cache.get_id("arts"),
+        "music": tag_cache.id("music"),
+        "comedy": tag_cache.id("comedy"),
+        "arts": tag_cache.id("arts"),
     }
 
-    for ev in events:
+    written: List[Dict[str, Any]] = []
+    desired: Dict[tuple, Set[int]] = {}
+    tagged: List[tuple] = []   # (slug, link, tag_ids) to mirror onto recurring_events
+    keys_by_link: Dict[str, List[tuple]] = {}   # link -> taggables its tags went to
+    changed = [ev for ev in events if is_changed("all_events", build_record(ev))]
+    skipped = len(events) - len(changed)
+
+    # Every distinct venue in one batch before the event writes
+    venue_ids = resolve_venues(supabase, [p for p in map(venue_payload, changed) if p])
+
+    for ev in changed:
         print(f"⏳ Processing: {ev['title']}")
-        event_id = upsert_event(ev)
+        if ev.get("venue_name") and venue_ids.get(ev["venue_name"]) is None:
+            # retried next run; a NULL venue_id would wipe the row's venue
+            print(f"   ⚠️ Skipped (venue {ev['venue_name']!r} not resolved).")
+            continue
+        event_id = upsert_event(ev, venue_ids)
         if not event_id:
             print("   ⚠️ Skipped (no id returned).")
             continue
@@ -309,7 +291,7 @@ def upsert_data(events: List[Dict[str, Any]]):
                 tag_ids.append(base_tag_ids[slug])  # type: ignore
                 continue
             # series or other slugs — only if they ALREADY exist
-            tid = tag_cache.get_id(slug)
+            tid = tag_cache.id(slug)
             if tid:
                 tag_ids.append(tid)
 
@@ -317,12 +299,24 @@ def upsert_data(events: List[Dict[str, Any]]):
         tag_ids = list(dict.fromkeys(tag_ids))
 
         # Apply to all_events
-        upsert_taggings_for_type("all_events", str(event_id), tag_ids)
-
-        # Mirror to recurring_events if a matching row exists
-        mirror_tags_to_recurring(ev["slug"], ev["link"], tag_ids)
-
-        print(f"✅ Upserted event + existing tags: {ev['title']}")
+        if tag_ids:
+            key = ("all_events", str(event_id))
+            desired.setdefault(key, set()).update(tag_ids)
+            tagged.append((ev["slug"], ev["link"], tag_ids))
+            keys_by_link[ev["link"]] = [key]
+
+        written.append(build_record(ev))
+        print(f"✅ Upserted event: {ev['title']}")
+
+    # Mirror to matching recurring_events rows (one lookup per column), then
+    # add-only, for all_events and the mirrored recurring_events together
+    for link, key in mirror_tags_to_recurring(tagged, desired).items():
+        keys_by_link[link].append(key)
+    failed = reconcile_taggings(supabase, desired).failed
+    # rows whose taggings didn't land stay "changed" so the next run retries them
+    remember("all_events", [r for r in written if failed.isdisjoint(keys_by_link.get(r["link"], ()))])
+    if skipped:
+        print(f"♻️  Skipped {skipped} unchanged events")
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
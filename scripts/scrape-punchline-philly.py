@@ -3,11 +3,11 @@ import os
 import re
 import json
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
-from datetime import datetime
-from zoneinfo import ZoneInfo
+
+from scrapekit.dates import local_parts
+from scrapekit.dom import parse_html
 
 # ── Load env & init Supabase ───────────────────────────────────────────────────
 load_dotenv()
@@ -22,7 +22,6 @@ supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 URL = "https://www.punchlinephilly.com/shows"
 VENUE_NAME = "Punch Line Philly"
 SOURCE = "punchlinephilly"
-LOCAL_TZ = ZoneInfo("America/New_York")
 
 HEADERS = {
     "User-Agent": (
@@ -41,18 +40,6 @@ def slugify(text: str) -> str:
     slug = re.sub(r'[^a-z0-9]+', '-', slug)
     return slug.strip('-')
 
-def to_local_date_time(iso_str: str):
-    """
-    Parse ISO 8601 datetimes that already include an offset (e.g. 2025-11-01T21:15:00-04:00)
-    and convert to America/New_York. Returns (YYYY-MM-DD, HH:MM:SS).
-    """
-    dt = datetime.fromisoformat(iso_str)
-    if dt.tzinfo is None:
-        # Treat naive as local (shouldn't happen here, but safe)
-        dt = dt.replace(tzinfo=LOCAL_TZ)
-    dt_local = dt.astimezone(LOCAL_TZ)
-    return dt_local.date().isoformat(), dt_local.time().isoformat()
-
 def clean_text(s):
     if s is None:
         return None
@@ -62,7 +49,7 @@ def clean_text(s):
 def scrape_events():
     res = requests.get(URL, headers=HEADERS, timeout=30)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     scripts = soup.find_all("script", {"type": "application/ld+json"})
     events = []
@@ -122,7 +109,9 @@ def scrape_events():
                 continue
 
             # Local date/time
-            start_date, start_time = to_local_date_time(startDate)
+            start_date, start_time = local_parts(startDate)
+            if not start_date:
+                continue
 
             # Build slug: punchline-<title>-YYYYMMDD
             ymd = start_date.replace("-", "")
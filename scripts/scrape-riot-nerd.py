@@ -11,11 +11,12 @@ import re
 from datetime import date
 from urllib.parse import urljoin, urlparse, urlunparse
 
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
-from postgrest.exceptions import APIError
+
+from scrapekit.dom import parse_html
+from scrapekit.fetch import fetch_text
+from scrapekit.groupevents import write_group_events
 
 # ── Static config ───────────────────────────────────────────────────────────────
 GROUP_ID = "41bc9e93-7550-4519-80e0-0cfacfa06b68"           # Riot Nerd Philly group
@@ -86,9 +87,7 @@ def absolute_img_src(img_tag, base: str) -> str | None:
 
 def fetch(url: str):
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
+        return parse_html(fetch_text(url, headers=HEADERS, timeout=30))
     except Exception as e:
         print(f"⚠️  Fetch failed {url}: {e}")
         return None
@@ -152,8 +151,8 @@ def upsert_group_events(rows: list[dict]) -> None:
         print("No events to write.")
         return
 
-    for ev in rows:
-        payload = {
+    payloads = [
+        {
             "group_id": ev["group_id"],
             "user_id": USER_ID,              # REQUIRED (NOT NULL)
             "title": ev["title"],
@@ -168,30 +167,9 @@ def upsert_group_events(rows: list[dict]) -> None:
             "image_url": ev.get("image_url"),
             "slug": ev.get("slug"),
         }
-
-        # 1) Does a row with this slug already exist?
-        try:
-            sel = sb.table("group_events").select("id").eq("slug", payload["slug"]).execute()
-            existing = sel.data if hasattr(sel, "data") else []
-        except APIError as e:
-            print(f"❌ Select failed for {payload['slug']}: {e}")
-            existing = []
-
-        if existing:
-            # 2) UPDATE existing row by id
-            gid = existing[0]["id"]
-            try:
-                sb.table("group_events").update(payload).eq("id", gid).execute()
-                print(f"♻️  Updated: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Update failed for {payload['slug']}: {e}")
-        else:
-            # 3) INSERT new row
-            try:
-                sb.table("group_events").insert(payload).execute()
-                print(f"➕ Inserted: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Insert failed for {payload['slug']}: {e}")
+        for ev in rows
+    ]
+    write_group_events(sb, payloads)
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
@@ -9,6 +9,10 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.enrich import enrich_rows
+from scrapekit.venues import resolve_venue
+
 # ── Config ─────────────────────────────────────────────────────────────────────
 BASE = "https://www.silkcityphilly.com"
 LISTING_URL = f"{BASE}/events"
@@ -110,7 +114,7 @@ def abs_href(href: str) -> str:
 def scrape_listing() -> list[dict]:
     r = requests.get(LISTING_URL, headers=HEADERS, timeout=20)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(r.text)
 
     events = []
     for a in soup.select("a.event"):
@@ -147,7 +151,7 @@ def enrich_from_detail(ev: dict) -> dict:
         r = requests.get(ev["link"], headers=HEADERS, timeout=20)
         if r.status_code != 200:
             return ev
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = parse_html(r.text)
 
         # Time + (optional) date
         start_date, start_time = extract_detail_datetime(soup, ev.get("start_date"))
@@ -169,8 +173,7 @@ def enrich_from_detail(ev: dict) -> dict:
 # ── Upsert ────────────────────────────────────────────────────────────────────
 def ensure_venue(name: str) -> str | None:
     try:
-        res = sb.table("venues").upsert({"name": name}, on_conflict=["name"], returning="representation").execute()
-        return res.data[0]["id"] if res and res.data else None
+        return resolve_venue(sb, name)
     except Exception:
         return None
 
@@ -188,10 +191,11 @@ def upsert_all_events(rows: list[dict]) -> None:
             "start_date":  ev.get("start_date"),
             "start_time":  ev.get("start_time"),  # 'HH:MM:SS' or None
             "description": ev.get("description"),
-            "venue_id":    venue_id,
             "source":      SOURCE,
             "slug":        ev.get("slug"),
         }
+        if venue_id:                # unresolved: keep whatever venue the row has
+            rec["venue_id"] = venue_id
         try:
             sb.table("all_events").upsert(rec, on_conflict=["link"]).execute()
             print(f"✅ Upserted: {ev['title']} | {ev.get('start_date')} {ev.get('start_time')}")
@@ -202,7 +206,7 @@ def upsert_all_events(rows: list[dict]) -> None:
 if __name__ == "__main__":
     evs = scrape_listing()
     print(f"🔎 Found {len(evs)} events on listing")
-    enriched = [enrich_from_detail(e) for e in evs]
+    enriched = enrich_rows(evs, enrich_from_detail, url=lambda e: e["link"])
     print(f"🧾 Ready to upsert {len(enriched)} Silk City events (with start_time when available)")
     upsert_all_events(enriched)
     print("🏁 Done.")
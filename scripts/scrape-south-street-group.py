@@ -7,23 +7,29 @@ South Street Headhouse District -> public.group_events (Playwright, MEC-only)
 - Waits for MEC cards to render
 - Expands month dividers
 - Clicks "Load More" until no new items (or cap)
+  (the events page and MEC's load-more replies are recorded, and later runs
+  replay them over plain HTTP, only opening the browser when that fails)
 - Parses and upserts into group_events
 """
 
-import os, re, html, json, asyncio
+import os, re, html, json
 from urllib.parse import urljoin, urlparse, urlunparse
-from datetime import date as d
 
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
-from postgrest.exceptions import APIError
-from playwright.async_api import async_playwright
+
+from scrapekit.browser import with_page
+from scrapekit.dates import parse_date, parse_time
+from scrapekit.dom import parse_html
+from scrapekit.endpoints import record, replay
+from scrapekit.settle import settle_count, settle_dom, wait_for_xhr
+from scrapekit.groupevents import write_group_events
 
 # ── Config ────────────────────────────────────────────────────────────────────
 GROUP_ID = "bec42575-dd24-484e-9c93-f9dd1cdf5e19"
 USER_ID  = "26f671a4-2f54-4377-9518-47c7f21663c7"
 URL_MEC  = "https://southstreet.com/events/"
+SOURCE   = "south-street-group"
 
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -34,7 +40,6 @@ sb: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 _SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
-MONTH = {"Jan":1,"Feb":2,"Mar":3,"Apr":4,"May":5,"Jun":6,"Jul":7,"Aug":8,"Sep":9,"Oct":10,"Nov":11,"Dec":12}
 
 def slugify(s: str) -> str:
     s = (s or "").lower().replace("&", " and ")
@@ -50,25 +55,6 @@ def canon_link(u: str) -> str | None:
     path = (p.path or "/").rstrip("/") or "/"
     return urlunparse((scheme, netloc, path, "", "", ""))
 
-def parse_time_12h(s: str) -> str | None:
-    if not s: return None
-    m = re.match(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)", s.strip().lower())
-    if not m: return None
-    hh = int(m.group(1)); mm = int(m.group(2) or 0); ap = m.group(3)
-    if ap == "pm" and hh != 12: hh += 12
-    if ap == "am" and hh == 12: hh = 0
-    return f"{hh:02d}:{mm:02d}:00"
-
-def parse_card_date(txt: str) -> str | None:
-    m = re.search(r"(\d{1,2})\s+([A-Za-z]{3})", txt or "")
-    if not m: return None
-    day = int(m.group(1)); mon = MONTH.get(m.group(2).title())
-    if not mon: return None
-    today = d.today()
-    cand = d(today.year, mon, day)
-    year = today.year + 1 if (cand - today).days < -60 else today.year
-    return d(year, mon, day).isoformat()
-
 def dedupe(rows):
     seen, out = set(), []
     for ev in rows:
@@ -79,7 +65,7 @@ def dedupe(rows):
 
 # ── MEC parser ────────────────────────────────────────────────────────────────
 def parse_mec(html_text: str, base_url: str):
-    soup = BeautifulSoup(html_text, "html.parser")
+    soup = parse_html(html_text)
     out = []
     for art in soup.select("article.mec-event-article"):
         classes = art.get("class") or []
@@ -105,12 +91,12 @@ def parse_mec(html_text: str, base_url: str):
             img_url = urljoin(base_url, img_url)
 
         date_el = art.select_one(".mec-date-details .mec-start-date-label")
-        sd = parse_card_date(date_el.get_text(strip=True)) if date_el else None
+        sd = parse_date(date_el.get_text(strip=True)) if date_el else None
 
         st_el = art.select_one(".mec-time-details .mec-start-time")
         et_el = art.select_one(".mec-time-details .mec-end-time")
-        st = parse_time_12h(st_el.get_text(strip=True)) if st_el else None
-        et = parse_time_12h(et_el.get_text(strip=True)) if et_el else None
+        st = parse_time(st_el.get_text(strip=True)) if st_el else None
+        et = parse_time(et_el.get_text(strip=True)) if et_el else None
         if et == st: et = None
 
         venue_span = art.select_one(".mec-venue-details span")
@@ -129,8 +115,8 @@ def parse_mec(html_text: str, base_url: str):
 def upsert_group_events(rows):
     if not rows:
         print("No events to write."); return
-    for ev in rows:
-        payload = {
+    payloads = [
+        {
             "group_id": ev["group_id"], "user_id": USER_ID,
             "title": ev["title"], "description": ev.get("description"),
             "address": ev.get("address"), "latitude": ev.get("latitude"), "longitude": ev.get("longitude"),
@@ -138,106 +124,107 @@ def upsert_group_events(rows):
             "start_time": ev.get("start_time"), "end_time": ev.get("end_time"),
             "image_url": ev.get("image_url"), "slug": ev.get("slug"),
         }
-        try:
-            sel = sb.table("group_events").select("id").eq("slug", payload["slug"]).execute()
-            existing = sel.data if hasattr(sel, "data") else []
-        except APIError as e:
-            print(f"❌ Select failed for {payload['slug']}: {e}"); existing = []
-        if existing:
-            gid = existing[0]["id"]
-            try:
-                sb.table("group_events").update(payload).eq("id", gid).execute()
-                print(f"♻️  Updated: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Update failed for {payload['slug']}: {e}")
-        else:
-            try:
-                sb.table("group_events").insert(payload).execute()
-                print(f"➕ Inserted: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Insert failed for {payload['slug']}: {e}")
+        for ev in rows
+    ]
+    write_group_events(sb, payloads)
 
 # ── Playwright flow for MEC page ──────────────────────────────────────────────
-async def get_mec_full_html(play, url: str, max_load_more_clicks: int = 6) -> str | None:
-    browser = await play.chromium.launch(headless=True, args=["--disable-blink-features=AutomationControlled"])
-    ctx = await browser.new_context(
-        user_agent=("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/124.0.0.0 Safari/537.36"),
-        locale="en-US",
-        ignore_https_errors=True,
-    )
-    page = await ctx.new_page()
+BROWSER_CONTEXT = dict(
+    user_agent=("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/124.0.0.0 Safari/537.36"),
+    locale="en-US",
+    ignore_https_errors=True,
+)
 
+ARTICLE = "article.mec-event-article"
+
+async def get_mec_full_html(page, url: str, max_load_more_clicks: int = 6) -> str | None:
     # Reduce headless fingerprinting a bit
     await page.add_init_script("""
         Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
     """)
 
-    try:
-        # Warmup
-        await page.goto("https://southstreet.com/", wait_until="domcontentloaded", timeout=45000)
-        await page.wait_for_timeout(600)
+    # Warmup
+    await page.goto("https://southstreet.com/", wait_until="domcontentloaded", timeout=45000)
+    await settle_dom(page, quiet_ms=300, timeout_ms=3000)
 
-        # MEC page
-        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+    # MEC page
+    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-        # Some sites lazy-render; wait for the MEC container or any article
+    # Some sites lazy-render; wait for the MEC container or any article
+    try:
+        await page.wait_for_selector(f"{ARTICLE}, .mec-skin-list-events-container", timeout=30000)
+    except Exception:
+        # Try a small scroll to trigger lazy load
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await page.wait_for_selector(ARTICLE, timeout=10000)
+
+    # Expand month dividers if present
+    dividers = page.locator(".mec-month-divider i")
+    count = await dividers.count()
+    for i in range(count):
         try:
-            await page.wait_for_selector("article.mec-event-article, .mec-skin-list-events-container", timeout=30000)
+            await dividers.nth(i).click()
+            await settle_dom(page, quiet_ms=150, timeout_ms=1500)
         except Exception:
-            # Try a small scroll to trigger lazy load
+            pass
+
+    # Click "Load More" repeatedly until no growth or cap reached
+    prev_count = await page.locator(ARTICLE).count()
+    for _ in range(max_load_more_clicks):
+        btn = page.locator(".mec-load-more-button").first
+        if not await btn.is_visible():
+            break
+        try:
+            # MEC fetches the next batch from admin-ajax; then wait for the new articles to land
+            await wait_for_xhr(page, "admin-ajax.php", action=btn.click, timeout_ms=15000)
+            new_count = await settle_count(page, ARTICLE, stable_ms=400, timeout_ms=10000,
+                                           min_count=prev_count + 1)
+            # small scroll to trigger any lazy observers
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(800)
-            await page.wait_for_selector("article.mec-event-article", timeout=10000)
-
-        # Expand month dividers if present
-        dividers = page.locator(".mec-month-divider i")
-        count = await dividers.count()
-        for i in range(count):
-            try:
-                await dividers.nth(i).click()
-                await page.wait_for_timeout(200)
-            except Exception:
-                pass
-
-        # Click "Load More" repeatedly until no growth or cap reached
-        prev_count = await page.locator("article.mec-event-article").count()
-        for _ in range(max_load_more_clicks):
-            btn = page.locator(".mec-load-more-button").first
-            if not await btn.is_visible():
-                break
-            try:
-                await btn.click()
-                # Wait for network and DOM to settle and number of articles to increase
-                await page.wait_for_load_state("networkidle", timeout=30000)
-                await page.wait_for_timeout(900)
-                # small scroll to trigger any lazy observers
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(500)
-                new_count = await page.locator("article.mec-event-article").count()
-                if new_count <= prev_count:
-                    break
-                prev_count = new_count
-            except Exception:
+            await settle_dom(page, quiet_ms=300, timeout_ms=2000)
+            if new_count <= prev_count:
                 break
-
-        # Ensure we really have articles
-        total = await page.locator("article.mec-event-article").count()
-        print(f"🧭 MEC DOM shows {total} <article> nodes before parse")
-        return await page.content()
-
-    finally:
-        await ctx.close()
-        await browser.close()
+            prev_count = new_count
+        except Exception:
+            break
+
+    # Ensure we really have articles
+    total = await page.locator(ARTICLE).count()
+    print(f"🧭 MEC DOM shows {total} <article> nodes before parse")
+    return await page.content()
+
+# ── Endpoint replay ───────────────────────────────────────────────────────────
+def is_mec_data(url: str, body: str) -> bool:
+    if canon_link(url) == canon_link(URL_MEC):
+        return "mec-event-article" in body
+    return "admin-ajax.php" in url and '"html"' in body
+
+async def browse_mec(page) -> str | None:
+    async with record(page, SOURCE, keep=is_mec_data, resource_types=("document", "xhr", "fetch")):
+        return await get_mec_full_html(page, URL_MEC, max_load_more_clicks=8)
+
+def stitch_replay(bodies: list[str]) -> str | None:
+    """Events page followed by the article HTML from each load-more reply."""
+    if not bodies or "mec-event-article" not in bodies[0]:
+        return None
+    parts = [bodies[0]]
+    for body in bodies[1:]:
+        try:
+            parts.append(json.loads(body).get("html") or "")
+        except (ValueError, AttributeError):
+            return None
+    return "\n".join(parts)
 
 # ── Main ──────────────────────────────────────────────────────────────────────
-async def main():
-    async with async_playwright() as play:
-        html_doc = await get_mec_full_html(play, URL_MEC, max_load_more_clicks=8)
-        rows = parse_mec(html_doc, URL_MEC) if html_doc else []
-        print(f"🔎 Found {len(rows)} South Street events")
-        upsert_group_events(rows)
+def main():
+    html_doc = stitch_replay(replay(SOURCE) or [])
+    if not html_doc:
+        html_doc = with_page(browse_mec, har=SOURCE, **BROWSER_CONTEXT)
+    rows = parse_mec(html_doc, URL_MEC) if html_doc else []
+    print(f"🔎 Found {len(rows)} South Street events")
+    upsert_group_events(rows)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
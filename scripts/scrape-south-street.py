@@ -1,11 +1,11 @@
 import os
-import json
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 import html  # Added for decoding weird characters
 
+from scrapekit.jsonld import iter_events
+
 load_dotenv()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -18,20 +18,7 @@ URL = "https://southstreet.com/things-to-do/"
 
 def scrape_south_street_events():
     res = requests.get(URL)
-    soup = BeautifulSoup(res.text, 'html.parser')
-    events = []
-
-    for script in soup.find_all('script', type='application/ld+json'):
-        data = json.loads(script.string)
-
-        if isinstance(data, list):
-            for item in data:
-                if item.get('@type') == 'Event':
-                    events.append(parse_event(item))
-        elif data.get('@type') == 'Event':
-            events.append(parse_event(data))
-
-    return events
+    return [parse_event(ev["raw"]) for ev in iter_events(res.text) if ev["type"] == "Event"]
 
 
 def parse_event(event):
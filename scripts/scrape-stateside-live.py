@@ -4,7 +4,8 @@
 """
 Scrape Stateside Live! event details and upsert into all_events.
 
-- Discovers event detail URLs from the public sitemap (no xml parser dependency).
+- Discovers event detail URLs from the public sitemap and only fetches pages that are
+  new or whose <lastmod> changed since the last run (SCRAPE_SITEMAP_FULL=1 for all).
 - Parses __NEXT_DATA__ on each event page to pull title, image, ISO date/time.
 - Converts UTC times to America/New_York (prevents off-by-one date drift).
 - Forces description to NULL per current requirements.
@@ -13,22 +14,21 @@ Scrape Stateside Live! event details and upsert into all_events.
 
 import os
 import re
-import json
-from datetime import datetime
-from zoneinfo import ZoneInfo
 from urllib.parse import urlparse, urlunparse
 
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dates import local_parts
+from scrapekit.embedded import next_data
+from scrapekit.fetch import fetch_text
+from scrapekit.sitemap import Entry, changed, iter_entries, remember
+
 # ── Config ─────────────────────────────────────────────────────────────────────
 BASE = "https://statesidelive.com"
 SITEMAP_URL = f"{BASE}/sitemap.xml"
 SOURCE = "statesidelive"
 VENUE_NAME_DEFAULT = "Stateside Live!"
-TZ = ZoneInfo("America/New_York")
 
 HEADERS = {
     "User-Agent": (
@@ -67,151 +67,57 @@ def canon_link(u: str) -> str:
 
 def fetch(url: str) -> str | None:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return r.text
+        return fetch_text(url, headers=HEADERS, timeout=30)
     except Exception as e:
         print(f"⚠️  Fetch failed {url}: {e}")
         return None
 
-def to_local_parts(iso_utc: str) -> tuple[str | None, str | None]:
-    """
-    Convert an ISO8601 UTC string like '2025-10-04T00:00:00Z' to (YYYY-MM-DD, HH:MM:SS)
-    in America/New_York. Returns (date, time) or (None, None) if parsing fails.
-    """
-    try:
-        dt = datetime.fromisoformat(iso_utc.replace("Z", "+00:00")).astimezone(TZ)
-        return dt.date().isoformat(), dt.time().replace(microsecond=0).isoformat()
-    except Exception:
-        return None, None
-
 def pick_first(*vals) -> str | None:
     for v in vals:
         if isinstance(v, str) and v.strip():
             return v.strip()
     return None
 
-# ── Sitemap discovery (regex; no XML dependency) ───────────────────────────────
-def discover_event_urls() -> list[str]:
+# ── Sitemap discovery ──────────────────────────────────────────────────────────
+def is_event_url(u: str) -> bool:
+    """Concrete event pages: /Events-and-Entertainment/Events/<Page> (path depth >= 3)."""
+    if "/Events-and-Entertainment/Events/" not in u:
+        return False
+    p = urlparse(u)
+    if not p.scheme.startswith("http"):
+        return False
+    return len([pp for pp in p.path.split("/") if pp]) >= 3
+
+def discover_event_entries() -> list[Entry]:
     """
-    Pulls the sitemap and extracts event detail URLs under /Events-and-Entertainment/Events/.
-    Works with the HTML parser and a regex to avoid requiring lxml.
+    Streams the sitemap (and any child sitemaps) and keeps event detail pages,
+    one Entry per canonical link, with the <lastmod> the sitemap gives it.
     """
-    html = fetch(SITEMAP_URL)
-    if not html:
-        return []
-
-    # Grab all <loc> URL contents quickly
-    locs = re.findall(r"<loc>(.*?)</loc>", html, re.IGNORECASE)
-    urls = []
-    for u in locs:
-        if "/Events-and-Entertainment/Events/" not in u:
-            continue
-        # Exclude the listing page or non-detail buckets if they show up
-        # Keep anything that looks like a concrete event page
-        # (heuristic: path depth > 3, i.e., /Events-and-Entertainment/Events/<something>)
-        try:
-            p = urlparse(u)
-            if not p.scheme.startswith("http"):
-                continue
-            parts = [pp for pp in p.path.split("/") if pp]
-            if len(parts) >= 3:  # Events-and-Entertainment / Events / <Page>
-                urls.append(canon_link(u))
-        except Exception:
-            pass
-
-    # Unique preserve order
     seen, out = set(), []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
+    for e in iter_entries(SITEMAP_URL, headers=HEADERS):
+        if not is_event_url(e.loc):
+            continue
+        link = canon_link(e.loc)
+        if link not in seen:
+            seen.add(link)
+            out.append(Entry(link, e.lastmod))
     print(f"🔎 Discovered {len(out)} event URLs from sitemap")
     return out
 
 # ── __NEXT_DATA__ helpers ──────────────────────────────────────────────────────
-def extract_next_data(html: str) -> dict | None:
-    """
-    Pull the Next.js __NEXT_DATA__ JSON object from the page.
-    """
-    # Fast regex first
-    m = re.search(r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', html, re.S)
-    if m:
-        try:
-            return json.loads(m.group(1))
-        except Exception:
-            pass
-
-    # Fallback to BeautifulSoup if needed
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        tag = soup.find("script", id="__NEXT_DATA__", type="application/json")
-        if tag and tag.text:
-            return json.loads(tag.text)
-    except Exception:
-        pass
-    return None
-
-def get_route_fields(nxt: dict) -> dict:
-    """
-    Return route fields dict if present, else {}.
-    """
-    try:
-        return nxt["props"]["pageProps"]["layoutData"]["sitecore"]["route"]["fields"] or {}
-    except Exception:
-        return {}
-
-def get_route_display_name(nxt: dict) -> str | None:
-    try:
-        return nxt["props"]["pageProps"]["layoutData"]["sitecore"]["route"]["displayName"]
-    except Exception:
-        return None
-
-def get_field_value(fields: dict, field_name: str) -> str | None:
-    """
-    fields['SomeField'] may be {"value": "..."} or other shapes; try to extract string.
-    """
-    try:
-        v = fields.get(field_name)
-        if v is None:
-            return None
-        if isinstance(v, dict) and "value" in v:
-            # Many image-like fields have nested dict under value; handle strings only here
-            if isinstance(v["value"], str):
-                return v["value"]
-            # if not a string, ignore here
-            return None
-        if isinstance(v, str):
-            return v
-        return None
-    except Exception:
-        return None
+ROUTE_PATH = ("props", "pageProps", "layoutData", "sitecore", "route")
 
-def get_first_image_url(fields: dict) -> str | None:
+def route_field(fields: dict, names: tuple[str, ...], *path: str) -> str | None:
     """
-    Tries a few likely image fields in route fields for a usable image URL.
+    First non-empty string among fields[name]["value"] for `names`, in order.
+    Image fields nest one level deeper: route_field(fields, names, "src").
     """
-    # 1) Teaser Image
-    try:
-        ti = fields.get("Teaser Image", {})
-        if isinstance(ti, dict) and isinstance(ti.get("value"), dict):
-            src = ti["value"].get("src")
-            if src:
-                return src
-    except Exception:
-        pass
-
-    # 2) Social Share Image
-    try:
-        ssi = fields.get("Social Share Image", {})
-        if isinstance(ssi, dict) and isinstance(ssi.get("value"), dict):
-            src = ssi["value"].get("src")
-            if src:
-                return src
-    except Exception:
-        pass
-
-    # 3) Fall back: nothing
+    for name in names:
+        v = fields.get(name)
+        for k in ("value", *path):
+            v = v.get(k) if isinstance(v, dict) else None
+        if isinstance(v, str) and v.strip():
+            return v.strip()
     return None
 
 def parse_event_page(url: str) -> dict | None:
@@ -231,43 +137,34 @@ def parse_event_page(url: str) -> dict | None:
     if not html:
         return None
 
-    nxt = extract_next_data(html)
-    if not nxt:
+    state = next_data(html)
+    if state is None:
         print(f"⚠️  No __NEXT_DATA__ on {url}")
         return None
 
-    fields = get_route_fields(nxt)
+    # only the route subtree is decoded, not the whole page state
+    route = state.get(*ROUTE_PATH) or {}
+    fields = route.get("fields") or {}
 
     # Title: prefer "Long Title" -> "Short Title" -> route displayName
-    title = pick_first(
-        get_field_value(fields, "Long Title"),
-        get_field_value(fields, "Short Title"),
-        get_route_display_name(nxt),
-    ) or "Event"
+    title = pick_first(route_field(fields, ("Long Title", "Short Title")), route.get("displayName")) or "Event"
 
     # Image: first available image field
-    image = get_first_image_url(fields)
+    image = route_field(fields, ("Teaser Image", "Social Share Image"), "src")
 
     # ISO date/time (UTC) usually in "Date" or "StartDate" or similar
     # Known event detail templates often place it in fields["Date"]["value"]
-    iso_utc = pick_first(
-        get_field_value(fields, "Date"),
-        get_field_value(fields, "Start Date"),
-        get_field_value(fields, "StartDate"),
-    )
+    iso_utc = route_field(fields, ("Date", "Start Date", "StartDate"))
 
     start_date = start_time = None
     if iso_utc:
-        start_date, start_time = to_local_parts(iso_utc)
+        start_date, start_time = local_parts(iso_utc)
 
     # End date/time if present (rarely needed; we mostly need start date)
-    iso_end = pick_first(
-        get_field_value(fields, "End Date"),
-        get_field_value(fields, "EndDate"),
-    )
+    iso_end = route_field(fields, ("End Date", "EndDate"))
     end_time = None
     if iso_end:
-        _ed, _et = to_local_parts(iso_end)
+        _ed, _et = local_parts(iso_end)
         # We don't store end_date in all_events schema; keep end_time only if same day
         end_time = _et
 
@@ -292,10 +189,12 @@ def parse_event_page(url: str) -> dict | None:
     }
 
 # ── Upsert into all_events ─────────────────────────────────────────────────────
-def upsert_events(rows: list[dict]) -> None:
+def upsert_events(rows: list[dict]) -> set[str]:
+    """Upserts each row; returns the links that failed."""
+    failed: set[str] = set()
     if not rows:
         print("No events parsed.")
-        return
+        return failed
 
     # Ensure the venue exists (one-time per run)
     venue_id = None
@@ -332,29 +231,33 @@ def upsert_events(rows: list[dict]) -> None:
             print(f"✅ Upserted: {ev['title']}")
         except Exception as e:
             print(f"❌ Upsert failed for {ev['title']}: {e}")
+            failed.add(ev["link"])
+    return failed
 
 # ── Main ───────────────────────────────────────────────────────────────────────
-def scrape_events() -> list[dict]:
-    urls = discover_event_urls()
-    # Parse each event page
-    events = []
-    for u in urls:
-        row = parse_event_page(u)
-        if row and row.get("start_date"):
+def scrape_events() -> tuple[list[dict], list[Entry]]:
+    """
+    Parses only the event pages that are new or whose <lastmod> changed since
+    they were last handled. Returns the dated events and the entries whose
+    pages parsed (to remember once the upsert is done).
+    """
+    entries = discover_event_entries()
+    due = changed(SOURCE, entries)
+    print(f"🗺️  {len(due)} of {len(entries)} event pages new or modified since last run")
+
+    events, handled = [], []
+    for e in due:
+        row = parse_event_page(e.loc)
+        if row is None:
+            continue                    # fetch/parse failed: retried next run
+        handled.append(e)
+        if row.get("start_date"):
             events.append(row)
 
-    # de-dup within run by link
-    seen, out = set(), []
-    for ev in events:
-        k = ev["link"]
-        if k not in seen:
-            seen.add(k)
-            out.append(ev)
-
-    print(f"📋 Parsed {len(out)} events with dates")
-    return out
+    print(f"📋 Parsed {len(events)} events with dates")
+    return events, handled
 
 if __name__ == "__main__":
-    evs = scrape_events()
-    if evs:
-        upsert_events(evs)
+    evs, handled = scrape_events()
+    failed = upsert_events(evs) if evs else set()
+    remember(SOURCE, [e for e in handled if e.loc not in failed])
@@ -19,6 +19,13 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import html_text, parse_html, parse_region
+from scrapekit.enrich import enrich_rows
+from scrapekit.fingerprint import is_changed, remember
+from scrapekit.tags import get_tags
+from scrapekit.taggings import reconcile_taggings
+from scrapekit.venues import VenueError, resolve_venue
+
 # ──────────────────────────────────────────────────────────────────────────────
 # ENV & SUPABASE
 # ──────────────────────────────────────────────────────────────────────────────
@@ -130,11 +137,9 @@ def parse_date(text: str, year_hint: Optional[int] = None) -> Optional[str]:
             pass
     return None
 
-def clean_text(html_fragment: str) -> str:
-    soup = BeautifulSoup(html_fragment, "html.parser")
-    for tag in soup(["script", "style"]):
-        tag.decompose()
-    txt = soup.get_text(separator="\n")
+def clean_text(content) -> str:
+    """Text of an HTML fragment or of an already-parsed element (not re-parsed)."""
+    txt = html_text(content, separator="\n", strip=False)
     txt = html.unescape(txt)
     txt = re.sub(r"\n\s*\n\s*\n+", "\n\n", txt)
     return txt.strip()
@@ -159,20 +164,19 @@ def trim_tmoms_footer(desc_text: str) -> str:
 def fetch(url: str) -> BeautifulSoup:
     r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    return parse_html(r.text)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # TAGS
 # ──────────────────────────────────────────────────────────────────────────────
 
 def load_allowed_tags() -> Dict[str, int]:
-    data = supabase.table("tags").select("id,name").execute().data or []
+    tags = get_tags(supabase)
     allowed = {}
-    target = {n.lower() for n in ALLOWED_TAG_NAMES}
-    for row in data:
-        nm = (row.get("name") or "").strip().lower()
-        if nm in target:
-            allowed[nm] = row["id"]
+    for name in ALLOWED_TAG_NAMES:
+        tid = tags.id(name)
+        if tid:
+            allowed[name.lower()] = tid
     print(f"✅ Loaded {len(allowed)} allowed tags (present in DB)")
     return allowed
 
@@ -211,24 +215,11 @@ def get_or_create_venue_id() -> Optional[str]:
     if VENUE_LONGITUDE is not None:
         payload["longitude"] = VENUE_LONGITUDE
 
-    r = supabase.table("venues").upsert(
-        payload,
-        on_conflict=["name"],
-        returning="representation"
-    ).execute()
-    return r.data[0]["id"] if r.data else None
-
-def reset_event_taggings(event_id: str | int, tag_ids: List[int]):
-    ev_id = str(event_id)
-    supabase.table("taggings") \
-        .delete() \
-        .eq("taggable_type", TAGGABLE_TYPE) \
-        .eq("taggable_id", ev_id) \
-        .execute()
-    if not tag_ids:
-        return
-    rows = [{"taggable_type": TAGGABLE_TYPE, "taggable_id": ev_id, "tag_id": int(tid)} for tid in tag_ids]
-    supabase.table("taggings").insert(rows).execute()
+    try:
+        return resolve_venue(supabase, payload)
+    except VenueError as e:
+        print(f"⚠️  {e}; events keep their current venue")
+        return None
 
 # ──────────────────────────────────────────────────────────────────────────────
 # SCRAPE
@@ -292,12 +283,12 @@ def parse_list_page(url: str) -> List[Dict[str, Any]]:
     return events
 
 def parse_detail_description(url: str) -> str:
-    soup = fetch(url)
-    content = soup.select_one(".tribe-events-single-event-description") or soup.select_one(".tribe-events-content")
-    if not content:
-        content = soup.select_one("div.entry-content") or soup
-    raw_html = str(content)
-    text = clean_text(raw_html)
+    r = SESSION.get(url, timeout=30)
+    r.raise_for_status()
+    # parse just the description block; the whole page only if none of them is there
+    content = parse_region(r.text, ".tribe-events-single-event-description", ".tribe-events-content",
+                           "div.entry-content") or parse_html(r.text)
+    text = clean_text(content)
     return trim_tmoms_footer(text)
 
 def dedupe_by_link(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -330,15 +321,16 @@ def run():
     print("🔎 Scraping Tattooed Mom list…")
     list_rows = parse_list_page(LIST_URL)
 
-    events = []
-    for r in list_rows:
-        try:
-            desc = parse_detail_description(r["link"])
-        except Exception as e:
-            print(f"⚠️  Failed to fetch detail for {r['link']}: {e}")
-            desc = None
-        r["description"] = desc
-        events.append(r)
+    def with_description(r: Dict[str, Any]) -> Dict[str, Any]:
+        r["description"] = parse_detail_description(r["link"])
+        return r
+
+    def without_description(r: Dict[str, Any], e: BaseException) -> Dict[str, Any]:
+        print(f"⚠️  Failed to fetch detail for {r['link']}: {e}")
+        r["description"] = None
+        return r
+
+    events = enrich_rows(list_rows, with_description, url=lambda r: r["link"], on_error=without_description)
 
     events = dedupe_by_link(events)
     print(f"✅ Parsed {len(events)} events")
@@ -348,6 +340,9 @@ def run():
     allowed = load_allowed_tags()  # {tag_name_lower: id}
 
     upserted = 0
+    skipped = 0
+    written: Dict[tuple, Dict[str, Any]] = {}   # taggable key -> record
+    desired: Dict[tuple, List[int]] = {}
     for ev in events:
         tag_names = collect_tag_names_for_event(
             title=ev["title"],
@@ -373,15 +368,24 @@ def run():
         if venue_id:
             record["venue_id"] = venue_id
 
+        if not is_changed("all_events", record):
+            skipped += 1
+            continue
+
         event_id = upsert_event(record)
         if event_id:
-            reset_event_taggings(event_id, tag_ids)
+            key = (TAGGABLE_TYPE, str(event_id))
+            desired[key] = tag_ids
+            written[key] = record
             upserted += 1
             print(f"⬆️  Upserted: {ev['title']} (id={event_id}) tags={tag_ids}")
         else:
             print(f"❌ Failed upsert: {ev['title']}")
 
-    print(f"🎉 Done. Upserted {upserted}/{len(events)} events.")
+    # rows whose taggings didn't land stay "changed" so the next run retries them
+    failed = reconcile_taggings(supabase, desired, prune=True).failed
+    remember("all_events", [r for k, r in written.items() if k not in failed])
+    print(f"🎉 Done. Upserted {upserted}/{len(events)} events ({skipped} unchanged, skipped).")
 
 if __name__ == "__main__":
     run()
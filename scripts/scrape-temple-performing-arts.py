@@ -2,13 +2,14 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from dateutil import parser as dtparser
 from datetime import datetime
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+
 # ───────────────────────────────────────────────
 # CONFIG
 # ───────────────────────────────────────────────
@@ -101,7 +102,7 @@ def get_or_create_venue_id():
 # ───────────────────────────────────────────────
 def parse_events():
     html = fetch_html(LIST_URL)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     events = []
 
     for li in soup.select("li.views-row"):
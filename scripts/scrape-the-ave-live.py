@@ -15,14 +15,17 @@ ENV:
 
 import os
 import re
-import json
 import time
-import requests
 from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+from scrapekit.httpcache import CachedPage, fetch_page
+from scrapekit.jsonld import iter_events
+from scrapekit.venues import resolve_venue
+
 # ── Setup ──────────────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -54,11 +57,9 @@ def slugify(text: str) -> str:
     s = _slug_non_alnum.sub("-", s)
     return s.strip("-")
 
-def get_soup(url: str) -> BeautifulSoup | None:
+def get_page(url: str) -> CachedPage | None:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
+        return fetch_page(url, headers=HEADERS, timeout=30)
     except Exception as e:
         print(f"⚠️  Fetch failed {url}: {e}")
         return None
@@ -131,27 +132,9 @@ def harvest_cards(soup: BeautifulSoup) -> list[dict]:
     return out
 
 # ── JSON-LD enrichment (Tixr) ──────────────────────────────────────────────────
-def fetch_jsonld_from_url(url: str) -> dict | None:
-    soup = get_soup(url)
-    if not soup:
-        return None
-    objs = []
-    for s in soup.select('script[type="application/ld+json"]'):
-        try:
-            data = json.loads(s.string or s.get_text(strip=True))
-            if isinstance(data, list): objs.extend(data)
-            elif isinstance(data, dict): objs.append(data)
-        except Exception:
-            continue
-
-    for o in objs:
-        t = o.get("@type")
-        is_event = (isinstance(t, str) and t.lower().endswith("event")) or (
-            isinstance(t, list) and any(str(x).lower().endswith("event") for x in t)
-        )
-        if not is_event:
-            continue
-
+def parse_jsonld_detail(html: str, url: str) -> dict | None:
+    for ev in iter_events(html):
+        o = ev["raw"]
         title = o.get("name")
         desc  = o.get("description")
         url2  = o.get("url") or url
@@ -195,17 +178,23 @@ def fetch_jsonld_from_url(url: str) -> dict | None:
     return None
 
 # ── Core scrape ────────────────────────────────────────────────────────────────
-def scrape_shows() -> list[dict]:
-    soup = get_soup(LIST_URL)
-    if not soup:
-        return []
+def scrape_shows() -> tuple[list[dict], list[CachedPage]]:
+    """Rows plus every page they came from (commit those after a successful write)."""
+    listing = get_page(LIST_URL)
+    if not listing:
+        return [], []
 
-    base = harvest_cards(soup)
+    base = listing.parse(lambda html: harvest_cards(parse_html(html)))
     print(f"🔎 Found {len(base)} cards on /calendar")
 
+    pages = [listing]
     out = []
     for ev in base:
-        detail = fetch_jsonld_from_url(ev["link"]) or {}
+        detail = {}
+        page = get_page(ev["link"])
+        if page:
+            pages.append(page)
+            detail = page.parse(lambda html, url=ev["link"]: parse_jsonld_detail(html, url)) or {}
         merged = {
             "title": detail.get("title"),
             "link": ev["link"],
@@ -221,25 +210,23 @@ def scrape_shows() -> list[dict]:
         slug = tail or slugify(f"the-ave-live-{merged.get('title','')}-{ymd}" if ymd else f"the-ave-live-{merged.get('title','')}")
         merged["slug"] = slug
         out.append(merged)
-        time.sleep(0.25)
+        if page and page.status != 304:
+            time.sleep(0.25)
     dedup = {}
     for ev in out:
         k = ev["link"]
         if k not in dedup:
             dedup[k] = ev
-    return list(dedup.values())
+    return list(dedup.values()), pages
 
 # ── Supabase upserts ───────────────────────────────────────────────────────────
 def get_or_upsert_venue(name: str) -> int:
     slug = slugify(name)
-    resp = sb.table("venues").upsert(
-        {"name": name, "slug": slug},
-        on_conflict=["slug"],
-        returning="representation",
-    ).execute()
-    return resp.data[0]["id"]
+    return resolve_venue(sb, {"name": name, "slug": slug}, on_conflict="slug")
 
-def upsert_all_events(rows: list[dict]) -> None:
+def upsert_all_events(rows: list[dict]) -> set[str]:
+    """Upserts each row; returns the links that failed."""
+    failed: set[str] = set()
     venue_id = get_or_upsert_venue(VENUE_NAME)
     for ev in rows:
         rec = {
@@ -262,12 +249,23 @@ def upsert_all_events(rows: list[dict]) -> None:
             print(f"✅ Upserted: {rec['name']} ({rec['start_date']} {rec['start_time'] or ''})")
         except Exception as e:
             print(f"❌ Upsert failed for {rec['name']}: {e}")
+            failed.add(rec["link"])
+    return failed
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    rows = scrape_shows()
+    rows, pages = scrape_shows()
     print(f"🧾 Keeping {len(rows)} rows after dedup")
-    if rows:
-        upsert_all_events(rows)
+    if pages and not any(p.changed for p in pages):
+        print("♻️  Calendar and event pages unchanged since last run; nothing to write.")
+    elif rows:
+        failed = upsert_all_events(rows)
+        # the calendar feeds every row, a detail page only its own
+        for p in pages:
+            if p.url in failed or (p.url == LIST_URL and failed):
+                continue
+            p.commit()
+        if failed:
+            print(f"↩️  {len(failed)} row(s) failed; their pages will be re-written next run")
     else:
         print("No rows to write.")
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import os, re, requests, html
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+from scrapekit.venues import resolve_venue
+
 # ── Env & Supabase ───────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -108,7 +110,7 @@ def parse_date_time_line(s: str, default_year: int | None = None) -> tuple[str|N
 def scrape_events():
     r = requests.get(PAGE_URL, headers=HEADERS, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(r.text)
 
     blocks = soup.select("div.wp-block-media-text")
     events = []
@@ -191,8 +193,7 @@ def scrape_events():
 # ── Upsert ──────────────────────────────────────────────────────────────
 def upsert_data(events):
     # Ensure venue
-    v = sb.table("venues").upsert({"name": VENUE_NAME}, on_conflict=["name"], returning="representation").execute()
-    venue_id = v.data[0]["id"] if v.data else None
+    venue_id = resolve_venue(sb, VENUE_NAME)
 
     for ev in events:
         rec = {
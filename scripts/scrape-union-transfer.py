@@ -3,13 +3,15 @@ import os
 import re
 import html
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from urllib.parse import urljoin
-from typing import Dict, Any, List, Optional, Iterable, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+from scrapekit.dom import parse_html
+from scrapekit.feedplan import FeedPlan, Field
 
 # ── Load env ────────────────────────────────────────────────────────────
 load_dotenv()
@@ -54,7 +56,7 @@ def discover_events_json_url() -> str:
     try:
         r = requests.get(CALENDAR_URL, headers=HEADERS, timeout=20)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = parse_html(r.text)
         container = soup.select_one(".js-axs-events-section")
         if container and container.has_attr("data-file"):
             return container["data-file"]
@@ -76,72 +78,36 @@ def get_nested(d: Dict[str, Any], *path, default=None):
         cur = cur[k]
     return cur
 
-def iter_all_strings(obj: Any) -> Iterable[str]:
-    if isinstance(obj, dict):
-        for v in obj.values():
-            yield from iter_all_strings(v)
-    elif isinstance(obj, list):
-        for v in obj:
-            yield from iter_all_strings(v)
-    elif isinstance(obj, str):
-        yield obj
-
 # ── Extractors ──────────────────────────────────────────────────────────
-def extract_link(ev: Dict[str, Any]) -> Optional[str]:
-    for ck in [
-        ("ticketing", "eventUrl"),
-        "eventUrl", "url", "ticketUrl", "purchaseUrl", "detailsUrl",
-        ("links", "eventUrl"), ("links", "url"),
-    ]:
-        v = get_nested(ev, *ck) if isinstance(ck, tuple) else ev.get(ck)
-        if isinstance(v, str):
-            u = to_full_url(v.strip())
-            if u:
-                return u
-    maybe = get_nested(ev, "eventUrl", "url") or get_nested(ev, "url", "href")
-    if isinstance(maybe, str):
-        u = to_full_url(maybe.strip())
-        if u:
-            return u
-    for s in iter_all_strings(ev):
-        s2 = s.strip()
-        if s2.startswith(("http://", "https://")):
-            return s2
-        if "/event/" in s2 or s2.startswith("/calendar/"):
-            u = to_full_url(s2)
-            if u:
-                return u
-    return None
-
 IMG_PAT = re.compile(r"https?://\S+\.(?:jpg|jpeg|png|webp)(?:\?\S+)?", re.I)
 
-def extract_image(ev: Dict[str, Any]) -> Optional[str]:
-    for ck in [
-        ("image", "imageUrl"),
-        "imageUrl",
-        "image",
-        ("heroImage", "imageUrl"),
-        "heroImageUrl",
-    ]:
-        v = get_nested(ev, *ck) if isinstance(ck, tuple) else ev.get(ck)
-        if isinstance(v, str):
-            m = IMG_PAT.search(v)
-            if m:
-                return m.group(0)
-    imgs = ev.get("images")
-    if isinstance(imgs, list):
-        for it in imgs:
-            for key in ("imageUrl", "url", "src"):
-                vv = (it or {}).get(key)
-                if isinstance(vv, str):
-                    m = IMG_PAT.search(vv)
-                    if m:
-                        return m.group(0)
-    for s in iter_all_strings(ev):
-        m = IMG_PAT.search(s)
-        if m:
-            return m.group(0)
-    return None
+def link_url(v: Any) -> Optional[str]:
+    return to_full_url(v.strip()) if isinstance(v, str) else None
+
+def looks_like_link(s: str) -> bool:
+    s = s.strip()
+    return s.startswith(("http://", "https://", "/calendar/")) or "/event/" in s
+
+def image_url(v: Any) -> Optional[str]:
+    m = IMG_PAT.search(v) if isinstance(v, str) else None
+    return m.group(0) if m else None
+
+IMAGE_ITEMS = 10   # entries of `images` tried, in order, before falling back to a scan
+
+# Candidate paths in priority order; when none hits, the feed plan learns where
+# a link/image-looking string sits in this feed.
+FIELDS = {
+    "link": Field(
+        [("ticketing", "eventUrl"), "eventUrl", "url", "ticketUrl", "purchaseUrl", "detailsUrl",
+         ("links", "eventUrl"), ("links", "url"), ("eventUrl", "url"), ("url", "href")],
+        accept=link_url, scan=looks_like_link,
+    ),
+    "image": Field(
+        [("image", "imageUrl"), "imageUrl", "image", ("heroImage", "imageUrl"), "heroImageUrl"]
+        + [("images", i, key) for i in range(IMAGE_ITEMS) for key in ("imageUrl", "url", "src")],
+        accept=image_url, scan=image_url,
+    ),
+}
 
 def _fmt(dt: datetime) -> Tuple[str, str]:
     return dt.date().isoformat(), dt.time().strftime("%H:%M:%S")
@@ -250,18 +216,18 @@ def extract_title(ev: Dict[str, Any]) -> Optional[str]:
     return None
 
 # ── Mapper ──────────────────────────────────────────────────────────────
-def map_event(ev: Dict[str, Any], venue_id: Optional[str]) -> Optional[Dict[str, Any]]:
+def map_event(ev: Dict[str, Any], venue_id: Optional[str], plan: FeedPlan) -> Optional[Dict[str, Any]]:
     title = extract_title(ev)
     start_date, start_time = extract_datetime(ev)
     if not title or not start_date:
         return None
 
-    link = extract_link(ev)
+    link = plan.get(ev, "link")
     if not link:
         slug = ev.get("slug") or slugify(title)
         link = f"{BASE_URL}/event/{slug}"
 
-    image = extract_image(ev)
+    image = plan.get(ev, "image")
 
     description = (
         get_nested(ev, "description", "shortDescription")
@@ -329,13 +295,14 @@ def main():
     print(f"🔎 Found {len(raw_events)} Union Transfer events (raw)")
 
     venue_id = ensure_venue()
+    plan = FeedPlan(feed_url, FIELDS)
 
     mapped: List[Dict[str, Any]] = []
     skipped_no_title = 0
     skipped_no_date = 0
 
     for ev in raw_events:
-        row = map_event(ev, venue_id=venue_id)
+        row = map_event(ev, venue_id=venue_id, plan=plan)
         if row:
             mapped.append(row)
         else:
@@ -2,11 +2,12 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from dateutil import parser as dtparser
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from scrapekit.dom import parse_html
+
 # ── Config ───────────────────────────────────────────────────────────────
 URL = "https://velvetwhipphilly.com/events"
 VENUE_NAME = "Velvet Whip Arts & Social Club"
@@ -85,7 +86,7 @@ def get_or_create_venue_id():
 def parse_events():
     r = requests.get(URL, headers=HEADERS, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(r.text)
 
     events = []
     for block in soup.select(".eventlist-event--upcoming"):
@@ -1,8 +1,5 @@
 import os
-import re
-import json
 import uuid
-from datetime import datetime, timezone
 
 import psycopg2
 import psycopg2.extras
@@ -10,6 +7,9 @@ import pytz
 import requests
 from slugify import slugify  # pip install python-slugify
 
+from scrapekit.dates import local_parts
+from scrapekit.embedded import State, next_data
+
 # --- CONFIG ---
 GROUP_ID = "e987c463-14e3-4ed2-96db-b571fb048146"  # Philly Girls Who Walk
 # You can use either the vanity URL or the communityId form:
@@ -23,21 +23,17 @@ PG_DSN = os.getenv(
 )
 
 # --- HELPERS ---
-def fetch_next_data(url: str) -> dict:
-    html = requests.get(url, timeout=30).text
-    m = re.search(
-        r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-        html, re.S
-    )
-    if not m:
+def fetch_next_data(url: str) -> State:
+    state = next_data(requests.get(url, timeout=30).text)
+    if state is None:
         raise RuntimeError("Could not find __NEXT_DATA__ JSON on the page.")
-    return json.loads(m.group(1))
+    return state
 
-def extract_events(next_data: dict):
-    q = (
-        next_data["props"]["pageProps"]["dehydratedState"]["queries"][0]
-        ["state"]["data"]
-    )
+def extract_events(state: State):
+    # only the first query's data is decoded, not the whole page state
+    q = state.get("props", "pageProps", "dehydratedState", "queries", 0, "state", "data")
+    if not q:
+        raise RuntimeError("No community query in __NEXT_DATA__.")
     profile = q["communityProfile"]
     tz_str = profile.get("timezone", "America/New_York")
     tz = pytz.timezone(tz_str)
@@ -45,11 +41,7 @@ def extract_events(next_data: dict):
     events_out = []
     for ev in q.get("events", []):
         # Timestamp is epoch milliseconds (UTC)
-        start_utc = datetime.fromtimestamp(ev["timestamp"] / 1000, tz=timezone.utc)
-        start_local = start_utc.astimezone(tz)
-
-        start_date = start_local.date().isoformat()
-        start_time = start_local.time().replace(microsecond=0).isoformat()
+        start_date, start_time = local_parts(ev["timestamp"], tz=tz)
 
         # Create a stable, readable slug; keep it <= 120 chars
         slug = slugify(f'{ev["name"]}-{start_date}-{ev["id"]}')[:120]
@@ -2,17 +2,18 @@
 import os
 import re
 import html
-import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 
+from scrapekit.dom import parse_html, parse_region, strip_tags
+from scrapekit.enrich import enrich_rows
+from scrapekit.venues import resolve_venue
+
 # ── Config ─────────────────────────────────────────────────────────────────────
 LISTING_URL = "https://wowphilly.com/events/"
 SOURCE = "wowphilly"
@@ -99,9 +100,9 @@ def to_24h(h: int, m: int, ap: str) -> str:
         h += 12
     return f"{h:02d}:{m:02d}:00"
 
-def extract_start_time(soup: BeautifulSoup) -> tuple[str | None, str | None]:
+def extract_start_time(page_text: str) -> tuple[str | None, str | None]:
     """Return (start_time, source_label) where source_label is 'show' or 'doors'."""
-    text = soup.get_text(" ", strip=True).lower()
+    text = page_text.lower()
     # 1) Try SHOW/START
     for pat in TIME_PATTERNS_SHOW:
         m = re.search(pat, text)
@@ -133,7 +134,7 @@ def scrape_listing() -> list[dict]:
         print("❌ Failed to get listing page.")
         return []
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(r.text)
     cards = soup.select(".rhp-event-series .rhpSingleEvent")
     print(f"🔎 Found {len(cards)} WOW cards (raw)")
 
@@ -176,11 +177,10 @@ def enrich_event(ev: dict) -> dict:
         ev["description"] = None
         ev["_time_source"] = None
     else:
-        soup = BeautifulSoup(r.text, "html.parser")
-        start_time, source_label = extract_start_time(soup)
+        start_time, source_label = extract_start_time(strip_tags(r.text))
         ev["start_time"] = start_time
         ev["_time_source"] = source_label
-        desc = soup.select_one(".rhp-event-info") or soup.find("article")
+        desc = parse_region(r.text, ".rhp-event-info", "article")
         if desc:
             txt = " ".join(desc.get_text(" ", strip=True).split())
             ev["description"] = txt[:5000]
@@ -193,38 +193,18 @@ def enrich_event(ev: dict) -> dict:
     return ev
 
 def enrich_all(events: list[dict]) -> list[dict]:
-    total = len(events)
-    if total == 0:
-        return []
-    print(f"🌐 Fetching {total} detail pages (concurrent, timeout={TIMEOUT}s)...")
-    out = []
-    done = 0
-    last = time.time()
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-        futs = {ex.submit(enrich_event, ev): ev for ev in events}
-        for fut in as_completed(futs):
-            try:
-                item = fut.result()
-                if item.get("_time_source") == "doors":
-                    print(f"⏰ Fallback to Doors time for: {item['title']}")
-                out.append(item)
-            except Exception:
-                pass
-            done += 1
-            now = time.time()
-            if now - last >= 1.0 or done == total:
-                print(f"   … {done}/{total} done")
-                last = now
+    # A failed detail fetch drops the event (no slug/time to write)
+    out = enrich_rows(events, enrich_event, url=lambda ev: ev["link"],
+                      workers=MAX_WORKERS, per_host=MAX_WORKERS, on_error=lambda ev, e: None)
+    for item in out:
+        if item.get("_time_source") == "doors":
+            print(f"⏰ Fallback to Doors time for: {item['title']}")
     return out
 
 # ── Venue ensure ───────────────────────────────────────────────────────────────
 def ensure_venue(name: str) -> str | None:
     try:
-        res = sb.table("venues").upsert(
-            {"name": name}, on_conflict=["name"], returning="representation"
-        ).execute()
-        if res.data:
-            return res.data[0]["id"]
+        return resolve_venue(sb, name)
     except Exception as e:
         print(f"⚠️ Could not upsert venue '{name}': {e}")
     return None
@@ -245,10 +225,11 @@ def upsert_all_events(rows: list[dict]) -> None:
             "start_date":  ev.get("start_date"),
             "start_time":  ev.get("start_time"),  # may be None
             "description": ev.get("description"),
-            "venue_id":    venue_id,
             "source":      SOURCE,
             "slug":        ev.get("slug"),
         }
+        if venue_id:                # unresolved: keep whatever venue the row has
+            rec["venue_id"] = venue_id
         if DRY_RUN:
             print(f"🧪 DRY RUN — {rec['name']} | slug={rec['slug']} | time={rec['start_time']} ({ev.get('_time_source')})")
             continue
@@ -10,10 +10,14 @@ import os
 import re
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.tags import get_tags
+from scrapekit.venues import resolve_venue
+from scrapekit.writer import bulk_upsert
+
 # ─────────────────────────────────────────────
 # CONFIG
 # ─────────────────────────────────────────────
@@ -45,24 +49,21 @@ def slugify(text: str) -> str:
     return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
 
 def ensure_venue():
-    res = supabase.table("venues").upsert(
+    return resolve_venue(
+        supabase,
         {
             "name": VENUE_NAME,
             "address": VENUE_ADDR,
             "latitude": VENUE_LAT,
             "longitude": VENUE_LNG,
         },
-        on_conflict=["name"],
-        returning="representation",
-    ).execute()
-    return (res.data or [{}])[0].get("id")
+    )
 
 def get_tag_id(tag_name: str) -> int | None:
-    res = supabase.table("tags").select("id,name").execute()
-    for row in (res.data or []):
-        if row["name"].lower() == tag_name.lower():
-            print(f"🏷️ Found tag '{tag_name}' (id={row['id']})")
-            return row["id"]
+    tag_id = get_tags(supabase).id(tag_name)
+    if tag_id:
+        print(f"🏷️ Found tag '{tag_name}' (id={tag_id})")
+        return tag_id
     print(f"⚠️ Tag '{tag_name}' not found — events will be saved without tagging.")
     return None
 
@@ -97,7 +98,7 @@ def parse_date(text: str) -> str | None:
 
 def parse_events():
     html = requests.get(BASE_URL, headers=HEADERS, timeout=30).text
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
 
     events = []
     for div in soup.select(".eventItem.entry"):
@@ -138,8 +139,8 @@ def run():
     events   = parse_events()
     print(f"📅 Found {len(events)} events")
 
-    for ev in events:
-        record = {
+    records = [
+        {
             "name": ev["title"],
             "slug": slugify(ev["title"]),
             "link": ev["link"],
@@ -148,16 +149,16 @@ def run():
             "source": SOURCE_NAME,
             "venue_id": venue_id
         }
-        res = supabase.table("all_events").upsert(
-            record, on_conflict=["link"], returning="representation"
-        ).execute()
+        for ev in events
+    ]
+    saved = bulk_upsert(supabase, "all_events", records, on_conflict="link")
 
-        if not res.data:
+    for ev, row in zip(events, saved):
+        if not row:
             print(f"❌ Failed: {ev['title']}")
             continue
 
-        eid = res.data[0]["id"]
-        reset_and_insert_taggings(eid, tag_id)
+        reset_and_insert_taggings(row["id"], tag_id)
         print(f"✅ Upserted {ev['title']} ({ev['start_date']})")
 
     print("🎉 Done.")
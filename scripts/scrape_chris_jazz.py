@@ -9,6 +9,9 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+from scrapekit.venues import resolve_venue
+
 # ── Config ─────────────────────────────────────────────────────────────────────
 SITE_BASE   = "https://www.chrisjazzcafe.com"
 LISTING_URL = f"{SITE_BASE}/events"
@@ -91,7 +94,7 @@ def extract_date_from_text(s: str) -> str | None:
 def fetch_listing() -> BeautifulSoup:
     r = requests.get(LISTING_URL, headers=HEADERS, timeout=20)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    return parse_html(r.text)
 
 def parse_card(card: BeautifulSoup) -> dict | None:
     # Title & link
@@ -164,8 +167,7 @@ def scrape_events() -> list[dict]:
 # ── Upsert ────────────────────────────────────────────────────────────────────
 def ensure_venue(name: str) -> str | None:
     try:
-        r = sb.table("venues").upsert({"name": name}, on_conflict=["name"], returning="representation").execute()
-        return r.data[0]["id"] if r and r.data else None
+        return resolve_venue(sb, name)
     except Exception as e:
         print(f"⚠️ venue upsert failed: {e}")
         return None
@@ -183,10 +185,11 @@ def upsert_all_events(rows: list[dict]) -> None:
             "start_date":  ev.get("start_date"),
             "start_time":  ev.get("start_time"),
             "description": ev.get("description"),
-            "venue_id":    venue_id,
             "source":      ev["source"],
             "slug":        ev["slug"],
         }
+        if venue_id:                # unresolved: keep whatever venue the row has
+            rec["venue_id"] = venue_id
         try:
             sb.table("all_events").upsert(rec, on_conflict=["link"]).execute()
             print(f"✅ {rec['name']} | {rec.get('start_date')} {rec.get('start_time')}")
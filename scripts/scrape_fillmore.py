@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 import os
 import re
-import json
-import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from urllib.parse import urlparse, parse_qs, unquote
 
+from scrapekit.dom import parse_html
+from scrapekit.fetch import fetch_text
+from scrapekit.httpcache import fetch_page
+from scrapekit.jsonld import iter_events
+
 # ── Config ─────────────────────────────────────────────────────────────────────
 FILLMORE_URL = "https://www.thefillmorephilly.com/shows/rooms/the-fillmore-philadelphia"
 DEFAULT_VENUE_NAME = os.getenv("VENUE_NAME", "The Fillmore Philadelphia")
@@ -62,16 +64,13 @@ def get_first_image(image_field):
 
 # ── Scraping ───────────────────────────────────────────────────────────────────
 def fetch_html(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    return r.text
+    return fetch_text(url, headers=HEADERS, timeout=30)
 
 def parse_events_from_jsonld(html: str, venue_name_filter: str = "The Fillmore Philadelphia"):
     """
     Parse <script type="application/ld+json"> blocks and collect MusicEvent/Event items.
     Filters to events whose location.name matches the venue (when present).
     """
-    soup = BeautifulSoup(html, "html.parser")
     events = []
     seen_links = set()
 
@@ -116,22 +115,9 @@ def parse_events_from_jsonld(html: str, venue_name_filter: str = "The Fillmore P
             }
         )
 
-    # Walk all ld+json scripts
-    for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        text = tag.string or tag.get_text(strip=True)
-        if not text:
-            continue
-        try:
-            data = json.loads(text)
-        except Exception:
-            # ignore illegible JSON-LD blocks
-            continue
-
-        if isinstance(data, list):
-            for item in data:
-                maybe_add(item)
-        else:
-            maybe_add(data)
+    # Walk all ld+json Event nodes (illegible blocks are skipped)
+    for ev in iter_events(html):
+        maybe_add(ev["raw"])
 
     return events
 
@@ -139,7 +125,7 @@ def parse_events_from_dom(html: str, venue_name: str = "The Fillmore Philadelphi
     """
     Fallback parser (if needed). Attempts to read server-side card markup (rarely present).
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     events = []
     for card in soup.select("div.chakra-linkbox"):
         overlay = card.select_one("a.chakra-linkbox__overlay")
@@ -171,8 +157,9 @@ def parse_events_from_dom(html: str, venue_name: str = "The Fillmore Philadelphi
             )
     return events
 
-def scrape_events():
-    html = fetch_html(FILLMORE_URL)
+def scrape_events(html: str | None = None):
+    if html is None:
+        html = fetch_html(FILLMORE_URL)
 
     events = parse_events_from_jsonld(html, venue_name_filter=DEFAULT_VENUE_NAME)
     if not events:
@@ -233,7 +220,12 @@ def upsert_data(events):
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    evs = scrape_events()
+    page = fetch_page(FILLMORE_URL, headers=HEADERS, timeout=30)
+    if not page.changed:
+        print("♻️  Listing unchanged since last successful run; nothing to write.")
+        raise SystemExit(0)
+    evs = page.parse(scrape_events)
     print(f"🔎 Found {len(evs)} events")
     if evs:
         upsert_data(evs)
+    page.commit()
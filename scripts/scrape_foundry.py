@@ -1,12 +1,13 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs, unquote
 
+from scrapekit.dom import parse_html
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -36,7 +37,7 @@ def scrape_events():
     URL = "https://www.thefillmorephilly.com/shows/rooms/the-foundry"
     res = requests.get(URL, headers=HEADERS)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     events = []
     # each show is inside a .chakra-linkbox wrapper
@@ -16,15 +16,19 @@ USAGE:
 
 import os
 import re
-from datetime import date
 from urllib.parse import urljoin, urlparse, urlunparse
 
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from postgrest.exceptions import APIError
 
+from scrapekit.dates import parse_span
+from scrapekit.dom import parse_html
+from scrapekit.groupevents import write_group_events
+from scrapekit.httpcache import CachedPage, fetch_page
+from scrapekit.tags import get_tags
+from scrapekit.taggings import reconcile_taggings
+
 # ── Static config ───────────────────────────────────────────────────────────────
 GROUP_ID = "f778824e-a130-44fc-ad24-af0420bfd657"  # Latin Vibes Group
 USER_ID  = "26f671a4-2f54-4377-9518-47c7f21663c7"
@@ -56,10 +60,6 @@ HEADERS = {
 }
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
-MONTHS = {
-    "jan":1,"feb":2,"mar":3,"apr":4,"may":5,"jun":6,
-    "jul":7,"aug":8,"sep":9,"oct":10,"nov":11,"dec":12
-}
 _slug_non_alnum = re.compile(r"[^a-z0-9]+")
 
 def slugify(text: str) -> str:
@@ -82,58 +82,12 @@ def absolute_img_src(img_tag, base: str) -> str | None:
     if not src: return None
     return src if src.startswith(("http://","https://")) else urljoin(base, src)
 
-def fetch(url: str):
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
-    except Exception as e:
-        print(f"⚠️  Fetch failed {url}: {e}")
-        return None
-
 def clean_text(html_text: str | None) -> str:
     t = (html_text or "").strip()
     t = re.sub(r"[ \t]+", " ", t)
     t = t.replace("\u2013", "-", 1).replace("\u2014", "-", 1)
     return t
 
-def parse_time_token(token: str) -> tuple[int,int]:
-    m = re.match(r"(\d{1,2}):(\d{2})\s*([ap]m)", token.strip(), re.I)
-    if not m:
-        raise ValueError(f"Unrecognized time '{token}'")
-    hh = int(m.group(1)); mm = int(m.group(2)); ampm = m.group(3).lower()
-    if ampm == "pm" and hh != 12: hh += 12
-    if ampm == "am" and hh == 12: hh = 0
-    return hh, mm
-
-def parse_datetime_block(block: str) -> tuple[str|None, str|None, str|None, str|None]:
-    """
-    'Fri. Oct 3, 2025 at 10:00pm - Sat. Oct 4, 2025 at 2:00am EDT'
-      → ('2025-10-03','2025-10-04','22:00','02:00')
-    """
-    txt = clean_text(block)
-    parts = [p.strip() for p in re.split(r"\s*-\s*", txt) if p.strip()]
-    if not parts: return (None, None, None, None)
-
-    def parse_one(side: str) -> tuple[str|None, str|None]:
-        m = re.search(
-            r"(?P<mon>[A-Za-z]{3,})\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})\s+at\s+(?P<time>\d{1,2}:\d{2}\s*[ap]m)",
-            side, re.I
-        )
-        if not m: return (None, None)
-        mon = MONTHS.get(m.group("mon").lower()[:3]); day = int(m.group("day")); year = int(m.group("year"))
-        try:
-            dt = date(year, mon, day)
-            hh, mm = parse_time_token(m.group("time"))
-            return (dt.isoformat(), f"{hh:02d}:{mm:02d}")
-        except Exception:
-            return (None, None)
-
-    s_date, s_time = parse_one(parts[0])
-    e_date, e_time = (None, None)
-    if len(parts) > 1: e_date, e_time = parse_one(parts[1])
-    return (s_date, e_date, s_time, e_time)
-
 # ── Philly-only filter ─────────────────────────────────────────────────────────
 PHILLY_OK = re.compile(r"\b(philadelphia|phila)\b", re.I)
 ZIP_191 = re.compile(r"\b191\d{2}(?:-\d{4})?\b")
@@ -153,39 +107,11 @@ def is_philly_address(text: str) -> bool:
 def get_music_tag_id() -> int | None:
     """Fetch the ID of the Music tag (prefer slug='music', else name='Music')."""
     try:
-        got = sb.table("tags").select("id,slug,name").eq("slug", "music").execute()
-        if got.data:
-            return got.data[0]["id"]
-        got2 = sb.table("tags").select("id,slug,name").eq("name", "Music").execute()
-        if got2.data:
-            return got2.data[0]["id"]
+        return get_tags(sb).id("music")
     except APIError as e:
         print(f"⚠️  Could not fetch Music tag id: {e}")
     return None
 
-def ensure_music_tagging(event_id: str, tag_id: int) -> None:
-    """Create taggings row if not already present."""
-    try:
-        existing = (
-            sb.table("taggings")
-            .select("id")
-            .eq("tag_id", tag_id)
-            .eq("taggable_type", "group_events")
-            .eq("taggable_id", str(event_id))
-            .execute()
-        )
-        if existing.data:
-            print("🏷️  Already tagged: Music")
-            return
-        sb.table("taggings").insert({
-            "tag_id": tag_id,
-            "taggable_type": "group_events",
-            "taggable_id": str(event_id),
-        }).execute()
-        print("🏷️  Tagged with Music")
-    except APIError as e:
-        print(f"⚠️  Tagging failed (Music): {e}")
-
 # ── Core scraping (venue-first) ────────────────────────────────────────────────
 def extract_card_from_column(col, base_url: str) -> dict | None:
     # Title
@@ -203,7 +129,11 @@ def extract_card_from_column(col, base_url: str) -> dict | None:
             break
     start_date = end_date = start_time = end_time = None
     if dt_el:
-        start_date, end_date, start_time, end_time = parse_datetime_block(dt_el.get_text(" ", strip=True))
+        start_date, end_date, start_time, end_time = parse_span(
+            clean_text(dt_el.get_text(" ", strip=True)), rollover=False
+        )
+        if not end_time:
+            end_date = None   # only cards with an end side carry an end date
 
     # Address (look for .venuename holder)
     addr_p = None
@@ -263,11 +193,8 @@ def extract_card_from_column(col, base_url: str) -> dict | None:
         "_link": canon_link(ticket_url) if ticket_url else None,
     }
 
-def scrape_listing_page(url: str) -> list[dict]:
-    soup = fetch(url)
-    if not soup:
-        return []
-
+def parse_listing_page(html: str, url: str) -> list[dict]:
+    soup = parse_html(html)
     rows = []
     seen_cols = 0
     for col in soup.select("div.elementor-top-column, div.elementor-column"):
@@ -281,94 +208,47 @@ def scrape_listing_page(url: str) -> list[dict]:
     print(f"• Scanned {seen_cols} venue columns on {url}; kept {len(rows)} Philadelphia cards")
     return rows
 
-def scrape_all() -> list[dict]:
-    all_rows = []
+def scrape_all() -> tuple[list[dict], list[CachedPage]]:
+    """Rows from listing pages whose HTML differs from the last written run."""
+    all_rows, pages = [], []
     for u in LISTING_URLS:
-        all_rows.extend(scrape_listing_page(u))
+        try:
+            page = fetch_page(u, headers=HEADERS, timeout=30)
+        except Exception as e:
+            print(f"⚠️  Fetch failed {u}: {e}")
+            continue
+        if not page.changed:
+            print(f"♻️  Unchanged since last run: {u}")
+            continue
+        rows = page.parse(lambda html, u=u: parse_listing_page(html, u))
+        all_rows.extend({**ev, "_page": u} for ev in rows)
+        pages.append(page)
+    return dedupe_rows(all_rows), pages
 
-    # In-run de-dup: prefer canonical link, else slug
+def dedupe_rows(all_rows: list[dict]) -> list[dict]:
+    # In-run de-dup: prefer canonical link, else slug; remember every page it was on
     dedup: dict[str, dict] = {}
     for ev in all_rows:
         key = ev.get("_link") or ev["slug"]
         if key not in dedup:
-            dedup[key] = ev
+            dedup[key] = {**ev, "_pages": []}
+        if ev.get("_page"):
+            dedup[key]["_pages"].append(ev["_page"])
     return list(dedup.values())
 
 # ── Upsert (idempotent) + Music tagging ───────────────────────────────────────
-def _find_existing_id(payload: dict) -> str | None:
-    """Find an existing row by slug OR (group_id,start_date,lower(title)) OR link."""
-    try:
-        # 1) by slug
-        got = sb.table("group_events").select("id").eq("slug", payload["slug"]).execute()
-        if got.data:
-            return got.data[0]["id"]
-
-        # 2) by group_id + start_date + lower(title)
-        got2 = (
-            sb.table("group_events")
-            .select("id")
-            .eq("group_id", payload["group_id"])
-            .eq("start_date", payload["start_date"])
-            .filter("lower(title)", "eq", (payload["title"] or "").lower())
-            .execute()
-        )
-        if got2.data:
-            return got2.data[0]["id"]
-
-        # 3) by canonical link, if present
-        if payload.get("link"):
-            got3 = sb.table("group_events").select("id").eq("link", payload["link"]).execute()
-            if got3.data:
-                return got3.data[0]["id"]
-    except APIError as e:
-        print(f"⚠️  Lookup failed for {payload['slug']}: {e}")
-    return None
-
-def get_music_tag_id() -> int | None:
-    try:
-        got = sb.table("tags").select("id,slug,name").eq("slug", "music").execute()
-        if got.data:
-            return got.data[0]["id"]
-        got2 = sb.table("tags").select("id,slug,name").eq("name", "Music").execute()
-        if got2.data:
-            return got2.data[0]["id"]
-    except APIError as e:
-        print(f"⚠️  Could not fetch Music tag id: {e}")
-    return None
-
-def ensure_music_tagging(event_id: str, tag_id: int) -> None:
-    try:
-        existing = (
-            sb.table("taggings")
-            .select("id")
-            .eq("tag_id", tag_id)
-            .eq("taggable_type", "group_events")
-            .eq("taggable_id", str(event_id))
-            .execute()
-        )
-        if existing.data:
-            print("🏷️  Already tagged: Music")
-            return
-        sb.table("taggings").insert({
-            "tag_id": tag_id,
-            "taggable_type": "group_events",
-            "taggable_id": str(event_id),
-        }).execute()
-        print("🏷️  Tagged with Music")
-    except APIError as e:
-        print(f"⚠️  Tagging failed (Music): {e}")
-
-def upsert_group_events(rows: list[dict]) -> None:
+def upsert_group_events(rows: list[dict]) -> list[dict]:
+    """Writes and tags `rows`; returns the rows that could not be written."""
     if not rows:
         print("No events to write.")
-        return
+        return []
 
     music_tag_id = get_music_tag_id()
     if not music_tag_id:
         print("⚠️  Skipping tagging: could not resolve 'Music' tag id.")
 
-    for ev in rows:
-        payload = {
+    payloads = [
+        {
             "group_id": ev["group_id"],
             "user_id": USER_ID,
             "title": ev["title"],
@@ -384,34 +264,23 @@ def upsert_group_events(rows: list[dict]) -> None:
             "slug": ev.get("slug"),
             "link": ev.get("link"),
         }
+        for ev in rows
+    ]
+    ids = write_group_events(sb, payloads)
 
-        gid = _find_existing_id(payload)
-
-        if gid:
-            try:
-                sb.table("group_events") \
-                  .update(payload, returning="representation") \
-                  .eq("id", gid) \
-                  .execute()
-                print(f"♻️  Updated: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Update failed for {payload['slug']}: {e}")
-        else:
-            try:
-                ins = sb.table("group_events") \
-                        .insert(payload, returning="representation") \
-                        .execute()
-                if ins.data:
-                    gid = ins.data[0]["id"]
-                print(f"➕ Inserted: {payload['title']} ({payload['slug']})")
-            except APIError as e:
-                print(f"❌ Insert failed for {payload['slug']}: {e}")
-
-        if music_tag_id and gid:
-            ensure_music_tagging(gid, music_tag_id)
+    if music_tag_id:
+        reconcile_taggings(sb, {("group_events", str(gid)): [music_tag_id] for gid in ids if gid})
+    return [ev for ev, gid in zip(rows, ids) if not gid]
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    rows = scrape_all()
-    print(f"🔎 Found {len(rows)} Philadelphia events total")
-    upsert_group_events(rows)
+    rows, pages = scrape_all()
+    print(f"🔎 Found {len(rows)} Philadelphia events on changed pages")
+    failed = upsert_group_events(rows)
+    # a page is done only once every row on it was written
+    retry = {u for ev in failed for u in ev.get("_pages", [])}
+    for page in pages:
+        if page.url in retry:
+            print(f"↩️  Not marking {page.url} as written; {len(failed)} row(s) failed")
+        else:
+            page.commit()
@@ -7,10 +7,11 @@ from datetime import datetime
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dom import parse_html
+
 # ── Env / Supabase ─────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -141,7 +142,7 @@ def scrape_events() -> list[dict]:
     URL = "https://www.tlaphilly.com/shows"
     r = requests.get(URL, headers=HEADERS, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = parse_html(r.text)
 
     events: list[dict] = []
     for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
@@ -18,13 +18,16 @@ import os
 import re
 import json
 import time
-import requests
 from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 from urllib.parse import urljoin
 
+from scrapekit.dom import parse_html
+from scrapekit.fetch import fetch_text
+from scrapekit.jsonld import iter_blocks, iter_nodes
+
 # ── Setup ──────────────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -58,9 +61,7 @@ def slugify(text: str) -> str:
 
 def get_soup(url: str) -> BeautifulSoup | None:
     try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
+        return parse_html(fetch_text(url, headers=HEADERS, timeout=30))
     except Exception as e:
         print(f"⚠️  Fetch failed {url}: {e}")
         return None
@@ -183,19 +184,12 @@ def fetch_jsonld_from_url(url: str) -> dict | None:
     """
     Fetch a page (e.g., Ticketmaster) and try to extract a JSON-LD Event.
     """
-    soup = get_soup(url)
-    if not soup:
+    try:
+        html = fetch_text(url, headers=HEADERS, timeout=30)
+    except Exception as e:
+        print(f"⚠️  Fetch failed {url}: {e}")
         return None
-    objs = []
-    for s in soup.select('script[type="application/ld+json"]'):
-        try:
-            data = json.loads(s.string or s.get_text(strip=True))
-            if isinstance(data, list):
-                objs.extend(data)
-            elif isinstance(data, dict):
-                objs.append(data)
-        except Exception:
-            continue
+    objs = [node for data in iter_blocks(html) for node in iter_nodes(data)]
     ev = pick_jsonld_event(objs)
     return normalize_event_from_jsonld(ev) if ev else None
 
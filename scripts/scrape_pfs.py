@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 import os
 import re
-import cloudscraper
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
 
+from scrapekit.dom import parse_html
+from scrapekit.ladder import climb
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -32,13 +33,11 @@ def slugify(text: str) -> str:
 MASTER_URL = "https://filmadelphia.org/showtimes/?start_date=6/26/2025"
 
 def scrape_showings(url: str):
-    # Use cloudscraper to bypass basic anti-bot measures
-    scraper = cloudscraper.create_scraper()
-    scraper.headers.update(HEADERS)
-
-    res = scraper.get(url)
-    res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    # Escalates to cloudscraper (or further) only while the site needs it
+    html = climb(url, headers=HEADERS)
+    if html is None:
+        raise RuntimeError(f"Could not fetch {url}")
+    soup = parse_html(html)
 
     showings = []
     for movie_block in soup.select("div.movie-tags"):
@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 import os
 import re
-import time
 import json
-from datetime import datetime, date, timedelta
-from urllib.parse import urlparse
+from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dates import parse_span
+from scrapekit.dom import parse_html
+from scrapekit.ladder import climb
+
 # ── Env & Supabase ─────────────────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -38,94 +39,23 @@ HEADERS = {
 }
 
 EVENT_HREF_RX = re.compile(r"^https://www\.tixr\.com/groups/vinyl/events/[a-z0-9-]+-\d+$", re.I)
-TIME_RX = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*([AP]M)", re.I)
-DATE_TIME_RX = re.compile(
-    r"([A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}).*?(?:at\s*)?(\d{1,2}(?::\d{2})?\s*[AP]M)",
-    re.I,
-)
-MONTHS = {m.lower(): i for i, m in enumerate(
-    ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"], start=1
-)}
 
 def slugify(text: str) -> str:
     s = (text or "").lower().replace("&", " and ")
     return re.sub(r"[^a-z0-9]+", "-", s).strip("-")
 
-# ── Fetch with 403 proxy fallback (preserve scheme) + retries ─────────────────
-def fetch_html(url: str, timeout: int = 20, max_retries: int = 4) -> str | None:
-    def _try(u: str, to: int) -> requests.Response:
-        return requests.get(u, headers=HEADERS, timeout=to)
-
-    backoffs = [0.5, 1.0, 2.0, 3.0]
-    last_err = None
-    for attempt in range(max_retries):
-        try:
-            r = _try(url, timeout)
-            if r.status_code == 403:
-                p = urlparse(url)
-                prox = f"https://r.jina.ai/{p.scheme}://{p.netloc}{p.path}"
-                if p.query:
-                    prox += f"?{p.query}"
-                r = _try(prox, timeout + 10)
-            r.raise_for_status()
-            return r.text
-        except KeyboardInterrupt:
-            raise
-        except Exception as e:
-            last_err = e
-            time.sleep(backoffs[min(attempt, len(backoffs)-1)])
-    print(f"⚠️  fetch_html failed {url}: {last_err}")
-    return None
+# ── Fetch (plain → cloudscraper → r.jina.ai → browser, per-host memory) ──────
+def fetch_html(url: str, timeout: int = 20) -> str | None:
+    return climb(url, headers=HEADERS, timeout=timeout)
 
 # ── Date & time parsing helpers ────────────────────────────────────────────────
-def infer_year(month: int, day: int) -> int:
-    """Pick this year, bump to next year if the date already passed by >60 days."""
-    today = date.today()
-    try:
-        candidate = date(today.year, month, day)
-    except Exception:
-        return today.year
-    if (today - candidate) > timedelta(days=60):
-        return today.year + 1
-    return today.year
-
-def to_24h_time(token: str) -> str | None:
-    m = TIME_RX.search(token or "")
-    if not m:
-        return None
-    hh = int(m.group(1))
-    mm = int(m.group(2) or 0)
-    ampm = m.group(3).upper()
-    if ampm == "PM" and hh != 12:
-        hh += 12
-    if ampm == "AM" and hh == 12:
-        hh = 0
-    return f"{hh:02d}:{mm:02d}:00"
-
 def parse_date_time_block(txt: str) -> tuple[str | None, str | None]:
     """
     Accepts text like 'Fri Oct 17 at 6:00PM' or 'Sat Oct 11 at 10:00PM'
     Returns (start_date ISO, start_time 24h)
     """
-    if not txt:
-        return (None, None)
-    m = DATE_TIME_RX.search(" ".join(txt.split()))
-    if not m:
-        # Try to at least get a time
-        return (None, to_24h_time(txt))
-    date_part = m.group(1)  # e.g., 'Fri Oct 17'
-    time_part = m.group(2)  # e.g., '10:00PM'
-    # Parse month/day
-    try:
-        _dow, mon_txt, day_txt = date_part.split()
-        mon = MONTHS[mon_txt[:3].lower()]
-        day = int(day_txt)
-        yr = infer_year(mon, day)
-        sd = date(yr, mon, day).isoformat()
-    except Exception:
-        sd = None
-    st = to_24h_time(time_part)
-    return (sd, st)
+    span = parse_span(txt)
+    return (span.start_date, span.start_time)
 
 # ── HTML extraction from cards (desktop & mobile) ──────────────────────────────
 def extract_card(a_tag: BeautifulSoup) -> dict | None:
@@ -188,7 +118,7 @@ def extract_card(a_tag: BeautifulSoup) -> dict | None:
     }
 
 def parse_group_page(html: str) -> list[dict]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     rows: list[dict] = []
 
     # First: any JSON-LD blocks with Event(s)
@@ -0,0 +1,7 @@
+"""
+Shared plumbing for the venue scrapers in scripts/.
+
+Each scraper still runs standalone (`python scripts/scrape-bok.py`); the
+modules here are what they share when imported, and what
+scripts/run_scrapers.py wires together when many sources run in one process.
+"""
@@ -0,0 +1,246 @@
+"""
+Shared headless Chromium for the browser-driven scrapers (Playwright).
+
+One browser per process, launched on first use on a background event-loop
+thread. Every caller gets its own BrowserContext (cookies, storage and routes
+isolated) and page; at most MAX_PAGES are open at once, and the browser is
+relaunched after RECYCLE_AFTER contexts so a long combined run doesn't pile up
+renderer memory.
+
+Scrapers hand the pool a coroutine that drives the page:
+
+    async def grab(page):
+        await page.goto(URL, wait_until="domcontentloaded")
+        return await page.content()
+
+    html = with_page(grab, user_agent=UA)          # from sync code
+    html = await awith_page(grab, user_agent=UA)   # from async code
+
+The page is only ever touched on the pool's loop, so sources running on
+different threads (or inside their own asyncio.run) share one warm browser.
+
+Contexts get the LEAN routing profile unless told otherwise: images, media,
+fonts and known tracker hosts are aborted, while documents, scripts and XHR go
+through, so pages (and `networkidle` waits) finish much sooner. A source that
+needs something back adds it to its own allowlist:
+
+    with_page(grab, block=LEAN.allowing("player.vimeo.com"))
+    with_page(grab, block=None)                    # load everything
+
+Sources that name themselves (`with_page(grab, har="craftcoven")`) can be run
+against a recorded HAR instead of the network, to profile startup, waits and
+parsing deterministically offline:
+
+    SCRAPE_HAR=record  python scrape-craftcoven.py   # writes <SCRAPE_HAR_DIR>/craftcoven.har
+    SCRAPE_HAR=replay  python scrape-craftcoven.py   # serves every request from it
+"""
+
+import os
+import atexit
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Awaitable, Callable, FrozenSet, Optional, Tuple, TypeVar
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route, async_playwright
+
+from scrapekit.fetch import host_of
+from scrapekit.paths import CACHE_DIR
+
+T = TypeVar("T")
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+MAX_PAGES = int(os.getenv("SCRAPE_BROWSER_PAGES", "4"))         # concurrent contexts
+RECYCLE_AFTER = int(os.getenv("SCRAPE_BROWSER_RECYCLE", "40"))  # contexts per launch
+HEADLESS = os.getenv("SCRAPE_BROWSER_HEADFUL", "0") != "1"
+HAR_MODE = os.getenv("SCRAPE_HAR", "").strip().lower()            # "", "record" or "replay"
+HAR_DIR = os.getenv("SCRAPE_HAR_DIR") or os.path.join(CACHE_DIR, "har")
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+
+TRACKER_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "adservice.google.com", "connect.facebook.net",
+    "facebook.net", "hotjar.com", "clarity.ms", "segment.io", "segment.com",
+    "fullstory.com", "nr-data.net", "newrelic.com", "sentry.io",
+    "scorecardresearch.com", "quantserve.com", "bat.bing.com", "snap.licdn.com",
+    "analytics.tiktok.com", "frog.wix.com", "stats.wp.com", "static.klaviyo.com",
+)
+
+# ── Routing profiles ───────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class BlockProfile:
+    resource_types: FrozenSet[str] = frozenset({"image", "media", "font"})
+    hosts: Tuple[str, ...] = TRACKER_HOSTS
+    allow: Tuple[str, ...] = ()         # URL substrings that always go through
+
+    def allowing(self, *patterns: str) -> "BlockProfile":
+        return replace(self, allow=self.allow + patterns)
+
+    def blocks(self, url: str, resource_type: str) -> bool:
+        if any(p in url for p in self.allow):
+            return False
+        if resource_type in self.resource_types:
+            return True
+        host = host_of(url)
+        return any(host == h or host.endswith("." + h) for h in self.hosts)
+
+LEAN = BlockProfile()
+
+async def apply_profile(ctx: BrowserContext, profile: BlockProfile) -> None:
+    async def handle(route: Route) -> None:
+        req = route.request
+        if profile.blocks(req.url, req.resource_type):
+            await route.abort()
+        else:
+            await route.fallback()
+    await ctx.route("**/*", handle)
+
+# ── HAR record / replay ────────────────────────────────────────────────────────
+def har_path(source: str) -> str:
+    return os.path.join(HAR_DIR, f"{source}.har")
+
+def _har_options(source: Optional[str]) -> dict:
+    """Extra new_context() options for record mode."""
+    if not source or HAR_MODE != "record":
+        return {}
+    os.makedirs(HAR_DIR, exist_ok=True)
+    return {"record_har_path": har_path(source), "record_har_content": "embed"}
+
+async def _route_from_har(ctx: BrowserContext, source: Optional[str]) -> None:
+    if not source or HAR_MODE != "replay":
+        return
+    path = har_path(source)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No HAR recorded for {source} ({path}); run once with SCRAPE_HAR=record")
+    await ctx.route_from_har(path, not_found="abort")
+
+class _Launch:
+    """One running browser and how much it has been used."""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.uses = 0
+        self.active = 0
+        self.retired = False
+
+class BrowserPool:
+    def __init__(self, max_pages: int = MAX_PAGES, recycle_after: int = RECYCLE_AFTER,
+                 headless: bool = HEADLESS):
+        self.max_pages = max_pages
+        self.recycle_after = recycle_after
+        self.headless = headless
+        self.launches = 0
+        self._pw: Optional[Playwright] = None
+        self._current: Optional[_Launch] = None
+        self._sem = asyncio.Semaphore(max_pages)
+        self._lock = asyncio.Lock()
+
+    async def _acquire(self) -> _Launch:
+        async with self._lock:
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            cur = self._current
+            if cur is None or cur.retired or not cur.browser.is_connected():
+                browser = await self._pw.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+                cur = self._current = _Launch(browser)
+                self.launches += 1
+            cur.uses += 1
+            cur.active += 1
+            if cur.uses >= self.recycle_after:
+                cur.retired = True          # next caller gets a fresh browser
+            return cur
+
+    async def _release(self, launch: _Launch) -> None:
+        launch.active -= 1
+        if launch.retired and launch.active == 0:
+            try:
+                await launch.browser.close()
+            except Exception:
+                pass
+
+    @asynccontextmanager
+    async def page(self, block: Optional[BlockProfile] = LEAN, har: Optional[str] = None,
+                   **context_options: Any) -> AsyncIterator[Page]:
+        """A fresh page in its own context; both are closed on exit (which also flushes a recorded HAR)."""
+        async with self._sem:
+            launch = await self._acquire()
+            ctx = None
+            try:
+                ctx = await launch.browser.new_context(**{**context_options, **_har_options(har)})
+                await _route_from_har(ctx, har)        # before the block profile, which falls back to it
+                if block is not None:
+                    await apply_profile(ctx, block)
+                yield await ctx.new_page()
+            finally:
+                if ctx is not None:
+                    try:
+                        await ctx.close()
+                    except Exception:
+                        pass
+                await self._release(launch)
+
+    async def close(self) -> None:
+        if self._current is not None:
+            try:
+                await self._current.browser.close()
+            except Exception:
+                pass
+            self._current = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
+# ── Background loop ────────────────────────────────────────────────────────────
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool: Optional[BrowserPool] = None
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="scrapekit-browser", daemon=True).start()
+            _loop = loop
+            atexit.register(_shutdown)
+        return _loop
+
+def get_pool() -> BrowserPool:
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+def _shutdown() -> None:
+    if _loop is None or _pool is None or not _loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_pool.close(), _loop).result(timeout=10)
+    except Exception:
+        pass
+
+# ── Public API ─────────────────────────────────────────────────────────────────
+async def _job(fn: Callable[[Page], Awaitable[T]], block: Optional[BlockProfile], har: Optional[str],
+               context_options: dict) -> T:
+    async with get_pool().page(block, har, **context_options) as page:
+        return await fn(page)
+
+def with_page(fn: Callable[[Page], Awaitable[T]], block: Optional[BlockProfile] = LEAN,
+              har: Optional[str] = None, **context_options: Any) -> T:
+    """Run `fn(page)` on a pooled page and block for its result."""
+    coro = _job(fn, block, har, context_options)
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+async def awith_page(fn: Callable[[Page], Awaitable[T]], block: Optional[BlockProfile] = LEAN,
+                     har: Optional[str] = None, **context_options: Any) -> T:
+    loop = _background_loop()
+    coro = _job(fn, block, har, context_options)
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
@@ -0,0 +1,308 @@
+"""
+Date/time parsing for the formats the venue sites actually print.
+
+    parse_time("7:30pm")                        # '19:30:00'
+    parse_time_range("7:30 - 11:30pm")          # ('19:30:00', '23:30:00')
+    parse_date("Fri Oct 3, 2025")               # '2025-10-03'
+    parse_date("Oct 5th")                       # year inferred, see infer_year
+    parse_span("Oct 10 2025 | 7:30 - 11:30pm")  # Span('2025-10-10', '2025-10-10', '19:30:00', '23:30:00')
+    parse_span("Fri. Oct 3, 2025 at 10:00pm - Sat. Oct 4, 2025 at 2:00am EDT")
+    local_parts("2025-11-01T01:15:00Z")         # ('2025-10-31', '21:15:00') in LOCAL_TZ
+    local_parts(1759536000000)                  # epoch milliseconds work too
+
+Every pattern is compiled once at import, and the string-keyed parsers are
+memoized, so a listing that repeats "7:00pm" two hundred times parses it once.
+Dates without a year depend on today's date, so it is part of their cache key;
+a long-running process that crosses midnight doesn't reuse yesterday's years.
+For a whole column of values at a time:
+
+    spans = parse_column(raw_texts, parse_span)     # one result per input, in order
+
+Parsers return None (or a tuple of Nones) instead of raising, so callers can
+keep their own `if not sd: continue` handling. Dates are ISO 'YYYY-MM-DD' and
+times 'HH:MM:SS', the shapes the events tables store.
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+from zoneinfo import ZoneInfo
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+LOCAL_TZ = ZoneInfo("America/New_York")
+ROLLOVER_DAYS = 60          # a month/day this far in the past means next year
+CACHE_SIZE = 4096
+
+MONTH_NAMES = ("january", "february", "march", "april", "may", "june", "july",
+               "august", "september", "october", "november", "december")
+# every prefix from three letters up: "sep", "sept", "septe", ... "september"
+MONTHS: Dict[str, int] = {
+    name[:k]: i for i, name in enumerate(MONTH_NAMES, 1) for k in range(3, len(name) + 1)
+}
+
+T = TypeVar("T")
+
+class Span(NamedTuple):
+    start_date: Optional[str]
+    end_date: Optional[str]
+    start_time: Optional[str]
+    end_time: Optional[str]
+
+EMPTY_SPAN = Span(None, None, None, None)
+
+# ── Patterns ───────────────────────────────────────────────────────────────────
+_MON = r"(?P<mon>[A-Za-z]{3,9})\.?"
+_DAY = r"(?P<day>\d{1,2})(?:st|nd|rd|th)?"
+_YEAR = r"(?P<year>\d{4})"
+
+_TIME_RE = re.compile(
+    r"\b(?P<h>\d{1,2})(?::(?P<m>\d{2}))?(?::\d{2})?\s*(?P<ap>[ap])\.?\s*m\b\.?|\b(?P<word>noon|midnight)\b",
+    re.I,
+)
+_TIME_24_RE = re.compile(r"^\s*(?P<h>[01]?\d|2[0-3]):(?P<m>[0-5]\d)(?::[0-5]\d)?\s*$")
+_BARE_TIME_RE = re.compile(r"^\s*(?P<h>\d{1,2})(?::(?P<m>\d{2}))?\s*$")
+_RANGE_SEP = r"\s*(?:-|–|—|\bto\b|\buntil\b)\s*"
+_RANGE_SPLIT_RE = re.compile(_RANGE_SEP, re.I)
+# a bare 'H:MM' that opens a range ('7:30 - 11:30pm'); it gets its am/pm from the end
+_BARE_RANGE_START_RE = re.compile(rf"\b\d{{1,2}}:\d{{2}}(?={_RANGE_SEP}\d)", re.I)
+_MDY_RE = re.compile(rf"\b{_MON}\s+{_DAY}(?:,?\s*{_YEAR})?\b")
+_DMY_RE = re.compile(rf"\b{_DAY}\s+{_MON}(?:,?\s*{_YEAR})?\b")
+_NUMERIC_RE = re.compile(r"\b(?P<mon>\d{1,2})/(?P<day>\d{1,2})(?:/(?P<year>\d{4}|\d{2}))?\b")
+_ISO_DATE_RE = re.compile(r"\b(?P<year>\d{4})-(?P<mon>\d{2})-(?P<day>\d{2})\b")
+_THROUGH_RE = re.compile(r"\s+(?:through|thru)\s+", re.I)
+_AT_SPLIT_RE = re.compile(r"\s+(?:at|@)\s+|\s*\|\s*", re.I)
+_DASH_RE = re.compile(r"\s*[-–—]\s*")
+_WS_RE = re.compile(r"\s+")
+
+# ── Pieces ─────────────────────────────────────────────────────────────────────
+def month_number(name: str) -> Optional[int]:
+    return MONTHS.get(name.lower().rstrip("."))
+
+def infer_year(month: int, day: int, year: Optional[int] = None, today: Optional[date] = None,
+               rollover_days: int = ROLLOVER_DAYS) -> int:
+    """`year` if given, else this year unless month/day fell more than `rollover_days` ago."""
+    if year:
+        return year + 2000 if year < 100 else year
+    today = today or date.today()
+    try:
+        candidate = date(today.year, month, day)
+    except ValueError:
+        return today.year
+    return today.year + 1 if (today - candidate).days > rollover_days else today.year
+
+def to_24h(hour: int, minute: int = 0, ampm: Optional[str] = None) -> Optional[str]:
+    ap = (ampm or "").lower()[:1]
+    if ap == "p" and hour != 12:
+        hour += 12
+    elif ap == "a" and hour == 12:
+        hour = 0
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+    return f"{hour:02d}:{minute:02d}:00"
+
+def _time_match(m: "re.Match[str]", ampm: Optional[str] = None) -> Optional[str]:
+    if m.group("word"):
+        return "12:00:00" if m.group("word").lower() == "noon" else "00:00:00"
+    return to_24h(int(m.group("h")), int(m.group("m") or 0), m.group("ap") or ampm)
+
+# ── Times ──────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_time(text: Optional[str], ampm: Optional[str] = None) -> Optional[str]:
+    """
+    First time in `text` ('7pm', '7:30 P.M.', 'noon', '19:30') as 'HH:MM:SS'.
+    A bare hour/minute ('7:30') only parses when `ampm` supplies the half of day.
+    """
+    if not text:
+        return None
+    m = _TIME_RE.search(text)
+    if m:
+        return _time_match(m)
+    m = _BARE_TIME_RE.match(text)
+    if m and ampm:
+        return to_24h(int(m.group("h")), int(m.group("m") or 0), ampm)
+    m = _TIME_24_RE.match(text)
+    if m:
+        return to_24h(int(m.group("h")), int(m.group("m")))
+    return None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_time_range(text: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    ('HH:MM:SS', 'HH:MM:SS' or None) from '7:30 - 11:30pm', '10am–2pm', '8pm'.
+    A side without am/pm borrows it from the other side.
+    """
+    if not text:
+        return (None, None)
+    parts = [p for p in _RANGE_SPLIT_RE.split(text.strip(), maxsplit=1) if p.strip()]
+    if not parts:
+        return (None, None)
+    left = _TIME_RE.search(parts[0])
+    right = _TIME_RE.search(parts[1]) if len(parts) > 1 else None
+    if right is None and len(parts) > 1:
+        end = parse_time(parts[1], left.group("ap") if left else None)
+    else:
+        end = _time_match(right) if right else None
+    if left is not None:
+        start = _time_match(left, right.group("ap") if right else None)
+    else:
+        start = parse_time(parts[0], right.group("ap") if right else None)
+    return (start, end)
+
+# ── Dates ──────────────────────────────────────────────────────────────────────
+def _ymd(year: Optional[str], month: int, day: int, default_year: Optional[int],
+         today: date) -> Optional[str]:
+    try:
+        y = infer_year(month, day, int(year) if year else default_year, today)
+        return date(y, month, day).isoformat()
+    except ValueError:
+        return None
+
+def parse_date(text: Optional[str], year: Optional[int] = None) -> Optional[str]:
+    """
+    First date in `text` as 'YYYY-MM-DD'. Takes 'Fri Oct 3, 2025', 'October 10 2025',
+    'Oct 5th', '5 Oct', '10/3/2025', '2025-10-03'. Without a year in the text,
+    `year` is used, else infer_year decides.
+    """
+    return _parse_date(text, year, date.today())
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_date(text: Optional[str], year: Optional[int], today: date) -> Optional[str]:
+    if not text:
+        return None
+    m = _ISO_DATE_RE.search(text)
+    if m:
+        return _ymd(m.group("year"), int(m.group("mon")), int(m.group("day")), year, today)
+    for pattern in (_MDY_RE, _DMY_RE):
+        for m in pattern.finditer(text):
+            mon = month_number(m.group("mon"))
+            if mon:
+                return _ymd(m.group("year"), mon, int(m.group("day")), year, today)
+    m = _NUMERIC_RE.search(text)
+    if m:
+        return _ymd(m.group("year"), int(m.group("mon")), int(m.group("day")), year, today)
+    return None
+
+def parse_span(text: Optional[str], year: Optional[int] = None, rollover: bool = True) -> Span:
+    """
+    Start/end dates and times from one listing string:
+
+        'Oct 10 2025 | 7:30 - 11:30pm'
+        'Fri Oct 3, 2025 at 10:00pm'
+        'Fri. Oct 3, 2025 at 10:00pm - Sat. Oct 4, 2025 at 2:00am EDT'
+        'August 4, 2025 through August 8, 2025'
+
+    With `rollover`, a single day's end time at or before its start time rolls
+    the end date over to the next day ('10 PM - 2 AM'); without it the end date
+    stays on the start date.
+    """
+    return _parse_span(text, year, rollover, date.today())
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_span(text: Optional[str], year: Optional[int], rollover: bool, today: date) -> Span:
+    if not text:
+        return EMPTY_SPAN
+    txt = _WS_RE.sub(" ", text).strip()
+
+    sides = _THROUGH_RE.split(txt, maxsplit=1)
+    if len(sides) == 1:
+        dash = _DASH_RE.split(txt)
+        dated = [i for i, piece in enumerate(dash) if _parse_date(piece, year, today)]
+        if len(dated) >= 2:
+            cut = dated[1]
+            sides = [" - ".join(dash[:cut]), " - ".join(dash[cut:])]
+    if len(sides) == 2:
+        sd, (st, _) = _date_and_times(sides[0], year, today)
+        ed, (et, _) = _date_and_times(sides[1], year, today)
+        return Span(sd, ed or sd, st, et)
+
+    sd, (st, et) = _date_and_times(txt, year, today)
+    if sd is None:
+        return Span(None, None, st, et)
+    ed = sd
+    if rollover and st and et and et <= st:
+        ed = (date.fromisoformat(sd) + timedelta(days=1)).isoformat()
+    return Span(sd, ed, st, et)
+
+def _date_and_times(text: str, year: Optional[int],
+                    today: date) -> Tuple[Optional[str], Tuple[Optional[str], Optional[str]]]:
+    parts = _AT_SPLIT_RE.split(text, maxsplit=1)
+    if len(parts) == 2:
+        return _parse_date(parts[0], year, today), parse_time_range(parts[1])
+    sd = _parse_date(text, year, today)
+    starts = [m.start() for m in (_TIME_RE.search(text), _BARE_RANGE_START_RE.search(text)) if m]
+    return sd, (parse_time_range(text[min(starts):]) if starts else (None, None))
+
+def iso_datetime(day: Optional[str], time: Optional[str] = None) -> Optional[str]:
+    """'YYYY-MM-DDTHH:MM:SS' from parsed pieces; a missing time means midnight."""
+    return f"{day}T{time or '00:00:00'}" if day else None
+
+# ── Instants ───────────────────────────────────────────────────────────────────
+def from_epoch_ms(ms: float, tz: Optional[tzinfo] = None) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).astimezone(tz or LOCAL_TZ)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_iso(text: Optional[str], assume: Optional[tzinfo] = None) -> Optional[datetime]:
+    """
+    An ISO-8601 datetime ('2025-11-01T21:15:00-04:00', '...Z', '...+0000').
+    Naive values get the `assume` tzinfo when one is given.
+    """
+    if not text:
+        return None
+    s = text.strip()
+    if s.endswith(("Z", "z")):
+        s = s[:-1] + "+00:00"
+    elif len(s) > 5 and s[-5] in "+-" and s[-4:].isdigit() and ("T" in s or " " in s):
+        s = s[:-2] + ":" + s[-2:]
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+    if dt.tzinfo is None and assume is not None:
+        dt = dt.replace(tzinfo=assume)
+    return dt
+
+def parse_instant(value: Any, assume: Optional[tzinfo] = None) -> Optional[datetime]:
+    """An aware-if-possible datetime from ISO text, epoch milliseconds, or a datetime."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo or assume is None else value.replace(tzinfo=assume)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return from_epoch_ms(value, timezone.utc)
+    s = str(value).strip()
+    if s.isdigit() and len(s) >= 12:
+        return from_epoch_ms(int(s), timezone.utc)
+    return parse_iso(s, assume)
+
+def local_parts(value: Any, tz: Optional[tzinfo] = None,
+                assume: Optional[tzinfo] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    ('YYYY-MM-DD', 'HH:MM:SS') of an ISO string or epoch-ms value in `tz`
+    (LOCAL_TZ by default). Naive values are read as `assume`, else as `tz`.
+    """
+    tz = tz or LOCAL_TZ
+    dt = parse_instant(value, assume or tz)
+    if dt is None:
+        return (None, None)
+    dt = dt.astimezone(tz)
+    return (dt.date().isoformat(), dt.strftime("%H:%M:%S"))
+
+# ── Batch ──────────────────────────────────────────────────────────────────────
+def parse_column(values: Iterable[Any], parser: Callable[..., T] = parse_span, **kwargs: Any) -> List[T]:
+    """
+    `parser` applied to a whole column, one result per value, in order. Each
+    distinct value is parsed once; listing pages repeat the same strings a lot.
+    """
+    seen: Dict[Any, T] = {}
+    out: List[T] = []
+    for v in values:
+        key = _WS_RE.sub(" ", v).strip() if isinstance(v, str) else v
+        try:
+            hit = seen[key]
+        except KeyError:
+            hit = seen[key] = parser(key, **kwargs)
+        except TypeError:                     # unhashable; parse it directly
+            hit = parser(v, **kwargs)
+        out.append(hit)
+    return out
@@ -0,0 +1,213 @@
+"""
+Shared HTML document factory.
+
+    soup = parse_html(text)                         # bs4 soup on the fastest installed builder
+    doc  = parse_html(text, backend="selectolax")   # select / select_one / get_text only
+    desc = html_text(fragment_or_tag, separator="\\n")
+
+Detail pages that only need one region can skip most of the tree:
+
+    desc = parse_region(text, ".tribe-events-single-event-description", "div.entry-content")
+    text = strip_tags(page)                         # visible text, no tree at all
+
+parse_region cuts the first element matching a simple selector (tag, .class,
+#id, or a combination) out of the raw markup with a tag-level scan and parses
+only that slice; selectors are tried in order, like an `a or b` select_one chain.
+The scan ignores comments and script/style bodies, and void elements (img, br,
+input, …) close themselves.
+
+Backends:
+
+    lxml         bs4 on the lxml builder; same API as before, several times faster
+    html.parser  bs4 on the stdlib parser; the fallback when lxml isn't installed
+    selectolax   the Lexbor engine behind a small Node wrapper (select, select_one,
+                 get_text, get, [], attrs, name); for hot paths that only need CSS
+
+SCRAPE_HTML_PARSER picks the bs4 builder (lxml or html.parser) for every
+scraper; unset, it is lxml when importable, else html.parser. selectolax is
+only reachable through an explicit backend="selectolax", since scrapers that
+walk the tree (find_all, find_next_sibling, decompose, …) need bs4.
+"""
+
+import os
+import re
+import html as htmllib
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from bs4 import BeautifulSoup, Tag
+
+try:
+    import lxml  # noqa: F401
+    _HAVE_LXML = True
+except ImportError:
+    _HAVE_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+BACKENDS = ("lxml", "html.parser", "selectolax")
+BS4_BACKENDS = ("lxml", "html.parser")
+_ENV_BACKEND = os.getenv("SCRAPE_HTML_PARSER")
+if _ENV_BACKEND and _ENV_BACKEND not in BS4_BACKENDS:
+    print(f"⚠️  SCRAPE_HTML_PARSER={_ENV_BACKEND!r} ignored; it selects one of {BS4_BACKENDS}")
+    _ENV_BACKEND = None
+DEFAULT_BACKEND = _ENV_BACKEND or ("lxml" if _HAVE_LXML else "html.parser")
+NON_TEXT = ("script", "style", "template", "noscript")
+
+Markup = Union[str, bytes]
+
+# ── selectolax wrapper ─────────────────────────────────────────────────────────
+class Node:
+    """The slice of the bs4 Tag API the scrapers use, over a selectolax node."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: Any):
+        self._node = node
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def attrs(self) -> Dict[str, Optional[str]]:
+        return dict(self._node.attributes)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._node.attributes.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._node.attributes[key]
+
+    def has_attr(self, key: str) -> bool:
+        return key in self._node.attributes
+
+    def select(self, css: str) -> List["Node"]:
+        return [Node(n) for n in self._node.css(css)]
+
+    def select_one(self, css: str) -> Optional["Node"]:
+        n = self._node.css_first(css)
+        return Node(n) if n is not None else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        parts = []
+        for n in self._node.traverse(include_text=True):
+            if n.tag != "-text" or (n.parent is not None and n.parent.tag in NON_TEXT):
+                continue
+            t = n.text_content or ""
+            if strip:
+                t = t.strip()
+                if not t:
+                    continue
+            parts.append(t)
+        return separator.join(parts)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    def __str__(self) -> str:
+        return self._node.html or ""
+
+# ── Factory ────────────────────────────────────────────────────────────────────
+def parse_html(markup: Markup, backend: Optional[str] = None) -> Any:
+    """A document for `markup`: a BeautifulSoup, or a Node for selectolax."""
+    backend = backend or DEFAULT_BACKEND
+    if backend == "selectolax":
+        if LexborHTMLParser is None:
+            backend = DEFAULT_BACKEND
+        else:
+            return Node(LexborHTMLParser(markup).root)
+    if backend == "lxml" and not _HAVE_LXML:
+        backend = "html.parser"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend {backend!r} (expected one of {BACKENDS})")
+    return BeautifulSoup(markup, backend)
+
+def html_text(markup: Union[Markup, Tag, None], separator: str = " ", strip: bool = True,
+              drop: Iterable[str] = ("script", "style")) -> str:
+    """
+    Visible text of an HTML fragment, or of a Tag already parsed (no re-parse;
+    the dropped elements are removed from it).
+    """
+    if markup is None:
+        return ""
+    node = markup if isinstance(markup, Tag) else parse_html(markup)
+    for tag in node.find_all(list(drop)):
+        tag.decompose()
+    return node.get_text(separator, strip=strip)
+
+# ── Partial parsing ────────────────────────────────────────────────────────────
+_SIMPLE_SEL_RE = re.compile(r"^([A-Za-z][\w-]*)?((?:[.#][\w-]+)*)$")
+_START_TAG_RE = re.compile(r"<([A-Za-z][\w-]*)\b([^>]*)>")
+_ATTR_RE = re.compile(r"""\b(class|id)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_HIDDEN_RE = re.compile(r"(?is)<!--.*?-->|<(script|style|noscript|template)\b.*?</\1\s*>")
+_TAG_RE = re.compile(r"(?s)<[^>]*>")
+_OPAQUE_RE = re.compile(r"(?is)<!--.*?-->|<(script|style)\b[^>]*>(.*?)</\1\s*>")
+VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input",
+                       "link", "meta", "param", "source", "track", "wbr"})
+
+def _compile_selector(selector: str):
+    m = _SIMPLE_SEL_RE.match(selector.strip())
+    if not m:
+        raise ValueError(f"parse_region takes simple selectors (tag.class#id), got {selector!r}")
+    tag = (m.group(1) or "").lower()
+    classes = set(re.findall(r"\.([\w-]+)", m.group(2)))
+    ids = re.findall(r"#([\w-]+)", m.group(2))
+    return tag, classes, (ids[0] if ids else None)
+
+def _matches(name: str, attr_text: str, tag: str, classes: set, id_: Optional[str]) -> bool:
+    if tag and name.lower() != tag:
+        return False
+    attrs = {k.lower(): a or b or c for k, a, b, c in _ATTR_RE.findall(attr_text)}
+    if classes and not classes <= set(attrs.get("class", "").split()):
+        return False
+    return id_ is None or attrs.get("id") == id_
+
+def _mask_opaque(markup: str) -> str:
+    # Comments and script/style bodies blanked out, same length, so offsets
+    # found in the mask slice the original markup.
+    def blank(m: "re.Match[str]") -> str:
+        if m.group(1) is None:                  # comment
+            return " " * len(m.group(0))
+        start, end = m.span(2)                  # keep the script/style tags themselves
+        return markup[m.start():start] + " " * (end - start) + markup[end:m.end()]
+    return _OPAQUE_RE.sub(blank, markup)
+
+def cut_region(markup: Markup, *selectors: str) -> Optional[str]:
+    """Raw markup of the first element matching one of `selectors` (tried in order)."""
+    if isinstance(markup, bytes):
+        markup = markup.decode("utf-8", errors="replace")
+    scan = _mask_opaque(markup)
+    for selector in selectors:
+        tag, classes, id_ = _compile_selector(selector)
+        for m in _START_TAG_RE.finditer(scan):
+            name = m.group(1)
+            if not _matches(name, m.group(2), tag, classes, id_):
+                continue
+            if name.lower() in VOID_TAGS or m.group(2).rstrip().endswith("/"):
+                return markup[m.start():m.end()]
+            depth, pattern = 1, re.compile(rf"<(/?){re.escape(name)}\b[^>]*?(/?)>", re.I)
+            for t in pattern.finditer(scan, m.end()):
+                if t.group(2):
+                    continue
+                depth += -1 if t.group(1) else 1
+                if depth == 0:
+                    return markup[m.start():t.end()]
+            return markup[m.start():]        # unclosed; take the rest
+    return None
+
+def parse_region(markup: Markup, *selectors: str, backend: Optional[str] = None) -> Optional[Any]:
+    """A document for just the first matching region, or None if no selector matched."""
+    region = cut_region(markup, *selectors)
+    return parse_html(region, backend) if region is not None else None
+
+def strip_tags(markup: Markup) -> str:
+    """Visible text of a whole page, whitespace-collapsed, without building a tree."""
+    if isinstance(markup, bytes):
+        markup = markup.decode("utf-8", errors="replace")
+    text = _TAG_RE.sub(" ", _HIDDEN_RE.sub(" ", markup))
+    return " ".join(htmllib.unescape(text).split())
@@ -0,0 +1,194 @@
+"""
+Framework state blobs embedded in HTML (Next.js, Nuxt, Astro, window.__X__ = {...}),
+found by substring search and decoded one subtree at a time.
+
+    state = next_data(html)                          # <script id="__NEXT_DATA__">, or None
+    route = state.get("props", "pageProps", "layoutData", "sitecore", "route")
+    data  = state.get("props", "pageProps", "dehydratedState", "queries", 0, "state", "data")
+
+    for props in astro_islands(html, has_key="events"):
+        events = props.get("events")
+
+    state = nuxt_data(html)                          # Nuxt 3 __NUXT_DATA__ (devalue array, raw)
+    state = assigned_state(html, "__APOLLO_STATE__") # window.__APOLLO_STATE__ = {...};
+
+Nothing builds a DOM or runs a regex over the whole page: the blob is located
+with str.find and only its slice is kept. A State holds that JSON text and,
+for get(*path), walks it structurally: keys are read as it goes, each sibling
+on the way is decoded alone (at json's C speed) only to find where it ends,
+and just the value at `path` is returned, so the whole tree is never held at
+once. load() decodes everything when the whole blob is wanted.
+
+Astro serializes island props as [type, value] pairs; those come back as they
+are, the way the scrapers already index them.
+"""
+
+import re
+import json
+import html as htmllib
+from typing import Any, Iterator, Optional, Union
+
+Markup = Union[str, bytes]
+Key = Union[str, int]
+
+_MISSING = object()
+_DECODER = json.JSONDecoder()
+_WS_RE = re.compile(r"\s*")
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR_RE = re.compile(r"[^,\]}\s]+")
+_PROPS_RE = re.compile(r"""\s(?:data-)?props\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+# ── Lazy JSON ──────────────────────────────────────────────────────────────────
+def _ws(text: str, i: int) -> int:
+    return _WS_RE.match(text, i).end()
+
+def _value_end(text: str, i: int) -> int:
+    """Index just past the JSON value starting at `i`."""
+    c = text[i]
+    if c == '"':
+        return _STRING_RE.match(text, i).end()
+    if c in "{[":
+        # C-speed decode of just this sibling, dropped right away: far faster
+        # than stepping over its tokens in Python, and never the whole blob
+        return _DECODER.raw_decode(text, i)[1]
+    m = _SCALAR_RE.match(text, i)
+    if not m:
+        raise ValueError(f"bad JSON value at {i}")
+    return m.end()
+
+def _child(text: str, i: int, key: Key) -> int:
+    """Start of `key`'s value in the object/array at `i`, or -1."""
+    i = _ws(text, i)
+    if isinstance(key, str):
+        if text[i] != "{":
+            return -1
+        i = _ws(text, i + 1)
+        while text[i] != "}":
+            m = _STRING_RE.match(text, i)
+            if not m:
+                raise ValueError(f"bad JSON key at {i}")
+            raw = m.group()
+            name = raw[1:-1] if "\\" not in raw else json.loads(raw)
+            i = _ws(text, m.end())
+            if text[i] != ":":
+                raise ValueError(f"expected ':' at {i}")
+            i = _ws(text, i + 1)
+            if name == key:
+                return i
+            i = _ws(text, _value_end(text, i))
+            if text[i] == ",":
+                i = _ws(text, i + 1)
+        return -1
+    if text[i] != "[":
+        return -1
+    i = _ws(text, i + 1)
+    n = 0
+    while text[i] != "]":
+        if n == key:
+            return i
+        i = _ws(text, _value_end(text, i))
+        if text[i] == ",":
+            i = _ws(text, i + 1)
+        n += 1
+    return -1
+
+class State:
+    """A JSON blob kept as text; get() decodes only the requested subtree."""
+
+    __slots__ = ("text", "_loaded")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._loaded: Any = _MISSING
+
+    def get(self, *path: Key, default: Any = None) -> Any:
+        if self._loaded is not _MISSING:
+            cur = self._loaded
+            for k in path:
+                try:
+                    cur = cur[k]
+                except (KeyError, IndexError, TypeError):
+                    return default
+            return cur
+        try:
+            i = _ws(self.text, 0)
+            for k in path:
+                i = _child(self.text, i, k)
+                if i < 0:
+                    return default
+            return _DECODER.raw_decode(self.text, i)[0]
+        except (ValueError, IndexError):
+            return default
+
+    def load(self) -> Any:
+        if self._loaded is _MISSING:
+            self._loaded = json.loads(self.text)
+        return self._loaded
+
+    def __contains__(self, needle: str) -> bool:
+        return needle in self.text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+# ── Locating blobs ─────────────────────────────────────────────────────────────
+def _as_text(markup: Markup) -> str:
+    return markup.decode("utf-8", errors="replace") if isinstance(markup, bytes) else markup
+
+def script_json(markup: Markup, script_id: str) -> Optional[State]:
+    """Body of <script id=script_id ...>…</script> as a State, or None."""
+    text = _as_text(markup)
+    for quoted in (f'id="{script_id}"', f"id='{script_id}'", f"id={script_id}"):
+        at = text.find(quoted)
+        while at >= 0:
+            open_at = text.rfind("<", 0, at)
+            if text.startswith("<script", open_at):
+                start = text.find(">", at) + 1
+                end = text.find("</script", start)
+                if start and end > start:
+                    return State(text[start:end].strip())
+            at = text.find(quoted, at + 1)
+    return None
+
+def next_data(markup: Markup) -> Optional[State]:
+    return script_json(markup, "__NEXT_DATA__")
+
+def nuxt_data(markup: Markup) -> Optional[State]:
+    """Nuxt 3's __NUXT_DATA__ payload, else a JSON-literal window.__NUXT__ (Nuxt 2)."""
+    return script_json(markup, "__NUXT_DATA__") or assigned_state(markup, "__NUXT__")
+
+def assigned_state(markup: Markup, name: str) -> Optional[State]:
+    """The JSON literal in `window.NAME = {...}` (or `NAME=[...]`), or None if it isn't JSON."""
+    text = _as_text(markup)
+    at = text.find(name)
+    while at >= 0:
+        i = _ws(text, at + len(name))
+        if text.startswith("=", i) and not text.startswith("==", i):
+            i = _ws(text, i + 1)
+            if text[i:i + 1] in ("{", "["):
+                try:
+                    end = _value_end(text, i)
+                except ValueError:
+                    return None
+                return State(text[i:end])
+        at = text.find(name, at + len(name))
+    return None
+
+def astro_islands(markup: Markup, has_key: Optional[str] = None) -> Iterator[State]:
+    """
+    Props of each <astro-island>, in document order. With `has_key`, islands
+    whose props don't mention that key are skipped before being unescaped.
+    """
+    text = _as_text(markup)
+    wanted = (f"&quot;{has_key}&quot;", f'"{has_key}"', f"&#34;{has_key}&#34;") if has_key else None
+    at = text.find("<astro-island")
+    while at >= 0:
+        end = text.find(">", at)
+        if end < 0:
+            return
+        m = _PROPS_RE.search(text, at, end)
+        if m:
+            raw = m.group(1) if m.group(1) is not None else m.group(2)
+            if wanted is None or any(w in raw for w in wanted):
+                yield State(htmllib.unescape(raw))
+        at = text.find("<astro-island", end)
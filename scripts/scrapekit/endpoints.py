@@ -0,0 +1,154 @@
+"""
+Endpoint discovery for the browser scrapers, so most runs can skip Chromium.
+
+During a browser run, record the responses that actually carry the data:
+
+    async def browse(page):
+        async with record(page, "south-street", keep=is_data, resource_types=("document", "xhr")):
+            ...drive the page as before...
+
+The matching requests (method, URL, body, the few headers that matter) are
+saved as templates under SCRAPE_CACHE_DIR/endpoints/<source>.json. The next
+run replays them with plain HTTP and only opens the browser when that fails:
+
+    bodies = replay("south-street")          # response texts, in recorded order
+    html_doc = stitch(bodies) if bodies else None
+    if not html_doc:
+        html_doc = with_page(browse)          # re-records fresh templates
+
+Templates older than MAX_AGE_DAYS are ignored, so windows baked into a
+recorded request (offsets, date ranges) get refreshed by a browser run.
+SCRAPE_DISCOVER=1 skips replay and forces the browser (and a re-record), as
+does running under SCRAPE_HAR so the browser path is what gets exercised.
+"""
+
+import os
+import json
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from playwright.async_api import Page, Response
+
+from scrapekit.browser import HAR_MODE
+from scrapekit.fetch import FetchError, fetch
+from scrapekit.paths import CACHE_DIR
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+ENDPOINTS_DIR = os.path.join(CACHE_DIR, "endpoints")
+MAX_AGE_DAYS = int(os.getenv("SCRAPE_ENDPOINTS_MAX_AGE", "3"))
+FORCE_DISCOVER = os.getenv("SCRAPE_DISCOVER", "0") == "1"
+DATA_TYPES = ("xhr", "fetch")
+MIN_BYTES = 200
+REPLAY_HEADERS = frozenset({"accept", "content-type", "origin", "referer", "x-requested-with"})
+TIMEOUT = 30
+
+Keep = Callable[[str, str], bool]     # (url, body) -> is this response data?
+
+@dataclass
+class Endpoint:
+    method: str
+    url: str
+    post_data: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+def looks_like_json(url: str, body: str) -> bool:
+    """Default test: a JSON object/array of some size."""
+    text = body.lstrip()
+    if len(text) < MIN_BYTES or text[:1] not in "{[":
+        return False
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+# ── Store ──────────────────────────────────────────────────────────────────────
+def _path(source: str) -> str:
+    return os.path.join(ENDPOINTS_DIR, f"{source}.json")
+
+def save(source: str, endpoints: Sequence[Endpoint]) -> None:
+    os.makedirs(ENDPOINTS_DIR, exist_ok=True)
+    tmp = _path(source) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"recorded_at": time.time(), "endpoints": [asdict(e) for e in endpoints]}, f)
+    os.replace(tmp, _path(source))
+
+def load(source: str) -> Optional[List[Endpoint]]:
+    """Fresh templates for `source`, or None."""
+    try:
+        with open(_path(source), encoding="utf-8") as f:
+            snap = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - snap.get("recorded_at", 0) > MAX_AGE_DAYS * 86400:
+        return None
+    return [Endpoint(**e) for e in snap.get("endpoints") or []] or None
+
+# ── Discovery ──────────────────────────────────────────────────────────────────
+class Recorder:
+    def __init__(self, keep: Keep = looks_like_json, resource_types: Sequence[str] = DATA_TYPES):
+        self.keep = keep
+        self.resource_types = frozenset(resource_types)
+        self._tasks: List["asyncio.Future[Optional[Endpoint]]"] = []
+
+    def on_response(self, resp: Response) -> None:
+        if resp.request.resource_type in self.resource_types and resp.ok:
+            self._tasks.append(asyncio.ensure_future(self._inspect(resp)))
+
+    async def _inspect(self, resp: Response) -> Optional[Endpoint]:
+        try:
+            body = await resp.text()
+            if not self.keep(resp.url, body):
+                return None
+            req = resp.request
+            headers = {k: v for k, v in (await req.all_headers()).items() if k.lower() in REPLAY_HEADERS}
+            return Endpoint(req.method, req.url, req.post_data, headers)
+        except Exception:
+            return None             # redirect, evicted body, closed page
+
+    async def endpoints(self) -> List[Endpoint]:
+        found = await asyncio.gather(*self._tasks)
+        return [e for e in found if e is not None]
+
+@asynccontextmanager
+async def record(page: Page, source: str, keep: Keep = looks_like_json,
+                 resource_types: Sequence[str] = DATA_TYPES) -> AsyncIterator[Recorder]:
+    """Watch `page` while the block runs; save what was kept if it completes."""
+    rec = Recorder(keep, resource_types)
+    page.on("response", rec.on_response)
+    try:
+        yield rec
+    finally:
+        page.remove_listener("response", rec.on_response)
+    found = await rec.endpoints()
+    if found:
+        save(source, found)
+        print(f"🛰️  Recorded {len(found)} data endpoint(s) for {source}")
+
+# ── Replay ─────────────────────────────────────────────────────────────────────
+def replay(source: str) -> Optional[List[str]]:
+    """
+    Response bodies for the recorded endpoints fetched over plain HTTP, in the
+    order they were recorded. None if nothing fresh is recorded or any call
+    fails; the caller should fall back to the browser.
+    """
+    if FORCE_DISCOVER or HAR_MODE:
+        return None
+    endpoints = load(source)
+    if not endpoints:
+        return None
+    bodies = []
+    for ep in endpoints:
+        data = ep.post_data.encode("utf-8") if ep.post_data else None
+        try:
+            r = fetch(ep.url, headers=ep.headers, timeout=TIMEOUT, method=ep.method, data=data)
+            r.raise_for_status()
+        except FetchError as e:
+            print(f"⚠️  Replay failed for {source} ({ep.url}): {e}")
+            return None
+        bodies.append(r.text)
+    print(f"⚡ Replayed {len(bodies)} endpoint(s) for {source} without a browser")
+    return bodies
@@ -0,0 +1,82 @@
+"""
+Concurrent detail-page enrichment for list+detail scrapers.
+
+    rows = enrich_rows(rows, enrich_event, url=lambda r: r["link"])
+
+`enrich` takes one listing row and returns the enriched row (returning None
+means it mutated the row in place). Rows fan out over a thread pool; a
+semaphore per host keeps any one venue at PER_HOST_LIMIT concurrent detail
+fetches, and output order matches input order. If `enrich` raises, `on_error(row, exc)` decides
+what to keep: by default the un-enriched row, or drop it by returning None.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from scrapekit.fetch import PER_HOST_LIMIT, host_of
+
+T = TypeVar("T")
+
+MAX_WORKERS = 8
+
+def _keep_unenriched(row: Any, exc: BaseException) -> Any:
+    print(f"⚠️  Enrichment failed, keeping listing data: {exc}")
+    return row
+
+def enrich_rows(
+    rows: Sequence[T],
+    enrich: Callable[[T], Optional[T]],
+    url: Optional[Callable[[T], Optional[str]]] = None,
+    workers: int = MAX_WORKERS,
+    per_host: int = PER_HOST_LIMIT,
+    on_error: Callable[[T, BaseException], Optional[T]] = _keep_unenriched,
+    label: str = "detail pages",
+) -> List[T]:
+    total = len(rows)
+    if total == 0:
+        return []
+
+    host_sems: Dict[str, threading.Semaphore] = {}
+    sems_lock = threading.Lock()
+
+    def sem_for(row: T) -> Optional[threading.Semaphore]:
+        u = url(row) if url else None
+        if not u:
+            return None
+        host = host_of(u)
+        with sems_lock:
+            if host not in host_sems:
+                host_sems[host] = threading.Semaphore(per_host)
+            return host_sems[host]
+
+    progress = {"done": 0, "last": time.time()}
+    progress_lock = threading.Lock()
+
+    def tick() -> None:
+        with progress_lock:
+            progress["done"] += 1
+            now = time.time()
+            if now - progress["last"] >= 1.0 or progress["done"] == total:
+                print(f"   … {progress['done']}/{total} done")
+                progress["last"] = now
+
+    def one(row: T) -> Optional[T]:
+        sem = sem_for(row)
+        try:
+            if sem:
+                with sem:
+                    out = enrich(row)
+            else:
+                out = enrich(row)
+            return row if out is None else out
+        except Exception as e:
+            return on_error(row, e)
+        finally:
+            tick()
+
+    print(f"🌐 Enriching {total} {label} (workers={min(workers, total)}, per host={per_host})…")
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, total))) as ex:
+        results = list(ex.map(one, rows))
+    return [r for r in results if r is not None]
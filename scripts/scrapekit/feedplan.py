@@ -0,0 +1,151 @@
+"""
+Field extraction for JSON event feeds that learns where each field lives.
+
+    FIELDS = {
+        "link":  Field([("ticketing", "eventUrl"), ("url",)], accept=to_full_url, scan=looks_like_link),
+        "image": Field([("image", "imageUrl"), ("images", 0, "url")], accept=image_url, scan=image_url),
+    }
+    plan = FeedPlan(feed_url, FIELDS)
+    for ev in events:
+        got = plan.extract(ev)            # {"link": ..., "image": ...}; None where nothing matched
+
+A Field lists candidate key paths (dict keys and list indices) in priority
+order, an `accept` that turns a raw value into the field's value (None = not
+usable), and optionally a `scan` predicate over strings. Every record tries
+the candidates in their declared order first: they are a few dict lookups,
+and a record that has a higher-priority path must get it, whatever earlier
+records had. Only when every candidate misses does the plan matter: the paths
+an earlier scan found for this feed are tried next (their value must still
+pass `scan`, not just `accept`), and only if those miss too is every string
+leaf of the record scanned, learning the path that matched.
+
+Learned (scan) paths are kept per feed in SCRAPE_CACHE_DIR/feedplans.json, so
+the next run skips straight to them.
+"""
+
+import os
+import json
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from scrapekit.paths import CACHE_DIR
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+PLANS_PATH = os.path.join(CACHE_DIR, "feedplans.json")
+MAX_PATHS = 4               # learned paths kept per field, most recent last
+
+Key = Union[str, int]
+Path = Tuple[Key, ...]
+
+def _text(v: Any) -> Optional[str]:
+    if isinstance(v, str):
+        s = v.strip()
+        return s or None
+    return None
+
+class Field:
+    def __init__(self, paths: Sequence[Union[Path, str]] = (), accept: Callable[[Any], Any] = _text,
+                 scan: Optional[Callable[[str], Any]] = None):
+        self.paths: List[Path] = [p if isinstance(p, tuple) else (p,) for p in paths]
+        self.accept = accept
+        self.scan = scan
+
+def resolve(obj: Any, path: Sequence[Key]) -> Any:
+    """The value at `path` (dict keys / list indices), or None."""
+    cur = obj
+    for k in path:
+        if isinstance(cur, dict):
+            cur = cur.get(k) if isinstance(k, str) else None
+        elif isinstance(cur, list) and isinstance(k, int):
+            cur = cur[k] if -len(cur) <= k < len(cur) else None
+        else:
+            return None
+        if cur is None:
+            return None
+    return cur
+
+def iter_strings(obj: Any, prefix: Path = ()) -> Iterator[Tuple[Path, str]]:
+    """(path, value) for every string leaf, depth-first in document order."""
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            yield from iter_strings(v, prefix + (k,))
+    elif isinstance(obj, list):
+        for i, v in enumerate(obj):
+            yield from iter_strings(v, prefix + (i,))
+    elif isinstance(obj, str):
+        yield prefix, obj
+
+# ── Store ──────────────────────────────────────────────────────────────────────
+_plans: Optional[Dict[str, Dict[str, List[List[Key]]]]] = None
+_lock = threading.Lock()
+
+def _load() -> Dict[str, Dict[str, List[List[Key]]]]:
+    global _plans
+    if _plans is None:
+        try:
+            with open(PLANS_PATH, encoding="utf-8") as f:
+                _plans = json.load(f)
+        except (OSError, ValueError):
+            _plans = {}
+    return _plans
+
+def _save() -> None:
+    os.makedirs(os.path.dirname(PLANS_PATH), exist_ok=True)
+    tmp = PLANS_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(_plans, f)
+    os.replace(tmp, PLANS_PATH)
+
+# ── Plan ───────────────────────────────────────────────────────────────────────
+class FeedPlan:
+    def __init__(self, feed: str, fields: Mapping[str, Field]):
+        self.feed = feed
+        self.fields = dict(fields)
+        with _lock:
+            stored = _load().get(feed, {})
+        # candidates are always tried first, so a stored candidate path adds nothing
+        self.learned: Dict[str, List[Path]] = {
+            name: [p for p in map(tuple, stored.get(name, [])) if p not in field.paths]
+            for name, field in self.fields.items()
+        }
+
+    def get(self, record: Any, name: str) -> Any:
+        field = self.fields[name]
+        for path in field.paths:
+            value = field.accept(resolve(record, path))
+            if value is not None:
+                return value
+        learned = self.learned[name]
+        for path in learned:
+            raw = resolve(record, path)
+            # a learned path only ever held what the scan matched; hold it to that
+            if field.scan is not None and isinstance(raw, str) and not field.scan(raw):
+                continue
+            value = field.accept(raw)
+            if value is not None:
+                return value
+        # every known path missed: scan the whole record
+        if field.scan is not None:
+            for path, s in iter_strings(record):
+                if path not in learned and field.scan(s):
+                    value = field.accept(s)
+                    if value is not None:
+                        self._learn(name, path)
+                        return value
+        return None
+
+    def extract(self, record: Any) -> Dict[str, Any]:
+        return {name: self.get(record, name) for name in self.fields}
+
+    def _learn(self, name: str, path: Path) -> None:
+        with _lock:
+            learned = self.learned[name]
+            if path in learned:
+                return                  # another thread got there first
+            learned.append(path)
+            del learned[:-MAX_PATHS]
+            _load().setdefault(self.feed, {})[name] = [list(p) for p in learned]
+            try:
+                _save()
+            except OSError as e:
+                print(f"⚠️  Could not save feed plan for {self.feed}: {e}")
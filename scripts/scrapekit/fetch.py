@@ -0,0 +1,209 @@
+"""
+Asyncio HTTP engine shared by the scrapers (aiohttp).
+
+One keep-alive connection pool per process, a semaphore per host so no venue
+sees more than PER_HOST_LIMIT requests at once, a timeout on every request and
+retry with exponential backoff on connection errors, 429 and 5xx.
+
+Blocking scrapers call fetch()/fetch_text()/fetch_many(); the coroutines run on
+a background event-loop thread, so ordinary sync code can still overlap many
+network waits. Async code awaits afetch() instead.
+"""
+
+import atexit
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+from urllib.parse import urlparse
+
+import aiohttp
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+TOTAL_LIMIT = 64          # open sockets across all hosts
+PER_HOST_LIMIT = 4        # concurrent requests to any one venue
+DEFAULT_TIMEOUT = 30      # seconds, whole request
+RETRIES = 3               # extra attempts after the first
+BACKOFF = 0.7             # seconds; doubles each attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+class FetchError(Exception):
+    def __init__(self, url: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{message} ({url})")
+        self.url = url
+        self.status = status
+
+@dataclass
+class Fetched:
+    url: str                      # final URL after redirects
+    status: int
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    charset: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.charset or "utf-8", errors="replace")
+
+    def raise_for_status(self) -> "Fetched":
+        if not self.ok:
+            raise FetchError(self.url, f"HTTP {self.status}", self.status)
+        return self
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+def _clean_headers(headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    # Scrapers send `Connection: close`; drop it so the pool can reuse sockets.
+    out = dict(DEFAULT_HEADERS)
+    for k, v in (headers or {}).items():
+        if k.lower() == "connection" and str(v).lower() == "close":
+            continue
+        out[k] = v
+    return out
+
+# ── Engine ─────────────────────────────────────────────────────────────────────
+class AsyncFetcher:
+    def __init__(self, per_host: int = PER_HOST_LIMIT, total: int = TOTAL_LIMIT,
+                 host_limits: Optional[Dict[str, int]] = None):
+        self.per_host = per_host
+        self.total = total
+        self.host_limits = dict(host_limits or {})
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+
+    def _sem(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.host_limits.get(host, self.per_host))
+            self._host_sems[host] = sem
+        return sem
+
+    async def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.total, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def get(self, url: str, headers: Optional[Mapping[str, str]] = None,
+                  timeout: float = DEFAULT_TIMEOUT, retries: int = RETRIES) -> Fetched:
+        """GET with per-host limiting and retries. Returns the last response, even if 4xx/5xx."""
+        return await self.request("GET", url, headers=headers, timeout=timeout, retries=retries)
+
+    async def request(self, method: str, url: str, headers: Optional[Mapping[str, str]] = None,
+                      data: Optional[bytes] = None, timeout: float = DEFAULT_TIMEOUT,
+                      retries: int = RETRIES) -> Fetched:
+        """Any method, e.g. a recorded POST query; same limiting and retries as get()."""
+        sess = await self.session()
+        hdrs = _clean_headers(headers)
+        last_exc: Optional[BaseException] = None
+        for attempt in range(retries + 1):
+            delay = BACKOFF * (2 ** attempt)
+            try:
+                async with self._sem(host_of(url)):
+                    async with sess.request(method, url, headers=hdrs, data=data,
+                                            timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                        body = await resp.read()
+                        got = Fetched(
+                            url=str(resp.url),
+                            status=resp.status,
+                            body=body,
+                            headers={k: v for k, v in resp.headers.items()},
+                            charset=resp.charset,
+                        )
+                if got.status not in RETRY_STATUSES or attempt == retries:
+                    return got
+                retry_after = got.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, min(float(retry_after), 30.0))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exc = e
+                if attempt == retries:
+                    break
+            await asyncio.sleep(delay)
+        raise FetchError(url, f"{type(last_exc).__name__}: {last_exc}") from last_exc
+
+    async def get_many(self, urls: Iterable[str], **kwargs) -> List[Union[Fetched, BaseException]]:
+        return await asyncio.gather(*(self.get(u, **kwargs) for u in urls), return_exceptions=True)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+# ── Background loop (sync bridge) ──────────────────────────────────────────────
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_fetcher: Optional[AsyncFetcher] = None
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="scrapekit-fetch", daemon=True).start()
+            _loop = loop
+            atexit.register(_shutdown)
+        return _loop
+
+def get_fetcher() -> AsyncFetcher:
+    global _fetcher
+    with _lock:
+        if _fetcher is None:
+            _fetcher = AsyncFetcher()
+        return _fetcher
+
+def set_host_limit(host: str, limit: int) -> None:
+    """Tighten (or loosen) concurrency for one venue, e.g. a fragile WordPress box."""
+    get_fetcher().host_limits[host.lower()] = limit
+
+def run(coro):
+    """Run a coroutine on the shared loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+def _shutdown() -> None:
+    if _loop is None or _fetcher is None or not _loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_fetcher.close(), _loop).result(timeout=5)
+    except Exception:
+        pass
+
+# ── Public API ─────────────────────────────────────────────────────────────────
+def fetch(url: str, headers: Optional[Mapping[str, str]] = None,
+          timeout: float = DEFAULT_TIMEOUT, retries: int = RETRIES,
+          method: str = "GET", data: Optional[bytes] = None) -> Fetched:
+    return run(get_fetcher().request(method, url, headers=headers, data=data,
+                                     timeout=timeout, retries=retries))
+
+def fetch_text(url: str, headers: Optional[Mapping[str, str]] = None,
+               timeout: float = DEFAULT_TIMEOUT, retries: int = RETRIES) -> str:
+    """Drop-in for `requests.get(...); r.raise_for_status(); r.text`."""
+    return fetch(url, headers=headers, timeout=timeout, retries=retries).raise_for_status().text
+
+def fetch_many(urls: Iterable[str], headers: Optional[Mapping[str, str]] = None,
+               timeout: float = DEFAULT_TIMEOUT, retries: int = RETRIES) -> List[Union[Fetched, BaseException]]:
+    """Fetch concurrently (bounded per host); results line up with `urls`."""
+    return run(get_fetcher().get_many(list(urls), headers=headers, timeout=timeout, retries=retries))
+
+async def afetch(url: str, headers: Optional[Mapping[str, str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT, retries: int = RETRIES) -> Fetched:
+    """Await from any event loop; the request itself runs on the shared loop."""
+    coro = get_fetcher().get(url, headers=headers, timeout=timeout, retries=retries)
+    loop = _background_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
@@ -0,0 +1,114 @@
+"""
+Content fingerprints for event rows, so unchanged rows aren't re-upserted.
+
+A fingerprint is a sha1 over the normalized name/title, link, dates, times,
+description and image of the record we are about to write. The fingerprint
+from the last successful write is kept locally (sqlite next to the HTTP cache),
+keyed by (table, conflict key):
+
+    if not is_changed("all_events", record):
+        continue                                  # identical to last write
+    upsert(record)
+    written.append(record)
+    ...
+    remember("all_events", written)               # after the writes succeed
+
+Rows are rewritten anyway once their fingerprint is older than
+REFRESH_AFTER_DAYS, so edits made directly in the DB are eventually healed.
+Set SCRAPE_FORCE_WRITE=1 to ignore fingerprints for a run.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from scrapekit.paths import CACHE_DIR
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+DB_NAME = "fingerprints.sqlite3"
+REFRESH_AFTER_DAYS = 7
+FINGERPRINT_FIELDS = (
+    "name", "title", "link",
+    "start_date", "end_date", "start_time", "end_time",
+    "description", "image", "image_url",
+)
+
+_ws = re.compile(r"\s+")
+
+def _norm(v: Any) -> str:
+    if v is None:
+        return ""
+    return _ws.sub(" ", str(v)).strip()
+
+def fingerprint(record: Dict[str, Any], fields: Sequence[str] = FINGERPRINT_FIELDS) -> str:
+    parts = [f"{f}={_norm(record.get(f))}" for f in fields if f in record]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+# ── Store ──────────────────────────────────────────────────────────────────────
+class FingerprintStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(CACHE_DIR, DB_NAME)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS fingerprints (
+                   tbl         TEXT,
+                   key         TEXT,
+                   fingerprint TEXT,
+                   written_at  REAL,
+                   PRIMARY KEY (tbl, key)
+               )"""
+        )
+        self.force = os.getenv("SCRAPE_FORCE_WRITE", "0") == "1"
+
+    def is_changed(self, table: str, record: Dict[str, Any], key: str = "link",
+                   fields: Sequence[str] = FINGERPRINT_FIELDS) -> bool:
+        k = record.get(key)
+        if self.force or not k:
+            return True
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fingerprint, written_at FROM fingerprints WHERE tbl = ? AND key = ?", (table, str(k))
+            ).fetchone()
+        if not row:
+            return True
+        fp, written_at = row
+        if time.time() - written_at > REFRESH_AFTER_DAYS * 86400:
+            return True
+        return fp != fingerprint(record, fields)
+
+    def remember(self, table: str, records: Iterable[Dict[str, Any]], key: str = "link",
+                 fields: Sequence[str] = FINGERPRINT_FIELDS) -> None:
+        now = time.time()
+        rows = [(table, str(r[key]), fingerprint(r, fields), now) for r in records if r.get(key)]
+        if not rows:
+            return
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO fingerprints (tbl, key, fingerprint, written_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+_store: Optional[FingerprintStore] = None
+_store_lock = threading.Lock()
+
+def get_store() -> FingerprintStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FingerprintStore()
+        return _store
+
+def is_changed(table: str, record: Dict[str, Any], key: str = "link",
+               fields: Sequence[str] = FINGERPRINT_FIELDS) -> bool:
+    return get_store().is_changed(table, record, key, fields)
+
+def remember(table: str, records: Iterable[Dict[str, Any]], key: str = "link",
+             fields: Sequence[str] = FINGERPRINT_FIELDS) -> None:
+    get_store().remember(table, records, key, fields)
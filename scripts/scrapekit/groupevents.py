@@ -0,0 +1,141 @@
+"""
+group_events writer backed by an in-memory index of the group's existing rows.
+
+    ids = write_group_events(sb, payloads)      # aligned with payloads
+    for payload, gid in zip(payloads, ids): ...
+
+Instead of a select (or three) per row, every row of each group_id in the
+batch is fetched once and indexed by slug, (start_date, lower(title)) and
+link. A payload with a slug matches by slug; the title/date and link
+fallbacks only apply when the payload has no slug or the existing row has
+none, so an early and a late show with the same title and distinct slugs
+stay two rows. Matches go out as one bulk update (upsert on id), the rest as
+bulk inserts. Slugs not found in the group get one extra `in_` query, since a
+slug may already belong to another group.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from supabase import Client
+
+from scrapekit.writer import CHUNK_SIZE, bulk_insert, bulk_upsert
+
+PAGE_SIZE = 1000
+INDEX_COLUMNS = "id,group_id,slug,start_date,title,link"
+UNSLUGGED_KEY = "group_id,start_date,start_time,title,link"
+
+Row = Dict[str, Any]
+
+def _title_key(row: Row) -> Tuple[str, str]:
+    return (str(row.get("start_date") or ""), (row.get("title") or "").strip().lower())
+
+class GroupIndex:
+    """Existing group_events rows for one or more groups, looked up in O(1)."""
+
+    def __init__(self) -> None:
+        self.by_slug: Dict[str, Any] = {}
+        # fallback candidates: {"id", "slug"} dicts shared between both maps
+        self.by_title: Dict[Tuple[str, str], List[Row]] = {}
+        self.by_link: Dict[str, List[Row]] = {}
+
+    def add(self, row: Row) -> None:
+        entry = {"id": row["id"], "slug": row.get("slug")}
+        if row.get("slug"):
+            self.by_slug.setdefault(row["slug"], row["id"])
+        if row.get("start_date") and row.get("title"):
+            self.by_title.setdefault(_title_key(row), []).append(entry)
+        if row.get("link"):
+            self.by_link.setdefault(row["link"], []).append(entry)
+
+    def _fallback(self, payload: Row) -> Optional[Row]:
+        slug = payload.get("slug")
+        candidates: List[Row] = []
+        if payload.get("start_date") and payload.get("title"):
+            candidates += self.by_title.get(_title_key(payload), [])
+        if payload.get("link"):
+            candidates += self.by_link.get(payload["link"], [])
+        for entry in candidates:
+            if not slug or not entry["slug"]:
+                return entry
+        return None
+
+    def find(self, payload: Row) -> Optional[Any]:
+        if payload.get("slug") in self.by_slug:
+            return self.by_slug[payload["slug"]]
+        entry = self._fallback(payload)
+        return entry["id"] if entry else None
+
+    def claim(self, payload: Row) -> Optional[Any]:
+        """find(), then record the payload's slug on the matched row, as its update will."""
+        if payload.get("slug") in self.by_slug:
+            return self.by_slug[payload["slug"]]
+        entry = self._fallback(payload)
+        if entry is None:
+            return None
+        if payload.get("slug"):
+            entry["slug"] = payload["slug"]
+            self.by_slug[payload["slug"]] = entry["id"]
+        return entry["id"]
+
+def load_index(client: Client, group_ids: Iterable[Any]) -> GroupIndex:
+    index = GroupIndex()
+    for gid in {g for g in group_ids if g}:
+        start = 0
+        while True:
+            res = (
+                client.table("group_events")
+                .select(INDEX_COLUMNS)
+                .eq("group_id", gid)
+                .order("id")
+                .range(start, start + PAGE_SIZE - 1)
+                .execute()
+            )
+            page = res.data or []
+            for row in page:
+                index.add(row)
+            if len(page) < PAGE_SIZE:
+                break
+            start += PAGE_SIZE
+    return index
+
+def _add_foreign_slugs(client: Client, index: GroupIndex, slugs: Sequence[str]) -> None:
+    for i in range(0, len(slugs), CHUNK_SIZE):
+        res = client.table("group_events").select("id,slug").in_("slug", list(slugs[i:i + CHUNK_SIZE])).execute()
+        for row in res.data or []:
+            index.by_slug.setdefault(row["slug"], row["id"])
+
+def write_group_events(client: Client, payloads: Sequence[Row]) -> List[Optional[Any]]:
+    """Insert or update each payload; returns the group_events id per payload (None on failure)."""
+    if not payloads:
+        return []
+    index = load_index(client, (p.get("group_id") for p in payloads))
+    missing = sorted({p["slug"] for p in payloads if p.get("slug") and p["slug"] not in index.by_slug})
+    if missing:
+        _add_foreign_slugs(client, index, missing)
+
+    updates: List[Row] = []
+    inserts: List[Row] = []
+    slots: List[Tuple[str, int]] = []   # where each payload's result will be
+    unslugged: List[Row] = []
+    for p in payloads:
+        gid = index.claim(p)
+        if gid is not None:
+            slots.append(("update", len(updates)))
+            updates.append({**p, "id": gid})
+        elif p.get("slug"):
+            slots.append(("insert", len(inserts)))
+            inserts.append(p)
+        else:
+            slots.append(("insert_unslugged", len(unslugged)))
+            unslugged.append(p)
+
+    results = {
+        "update": bulk_upsert(client, "group_events", updates, on_conflict="id") if updates else [],
+        "insert": bulk_insert(client, "group_events", inserts, key="slug") if inserts else [],
+        # no slug to tell them apart by; keep one row per event, not one per batch
+        "insert_unslugged": (
+            bulk_insert(client, "group_events", unslugged, key=UNSLUGGED_KEY) if unslugged else []
+        ),
+    }
+    print(f"♻️  Updated {len(updates)} / ➕ Inserted {len(inserts) + len(unslugged)} group_events")
+    return [(results[kind][n] or {}).get("id") for kind, n in slots]
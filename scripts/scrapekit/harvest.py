@@ -0,0 +1,43 @@
+"""
+Single-round-trip extraction from a Playwright page or frame.
+
+    records = await harvest(frame, EVENT_LINK_SELECTORS, JS_HARVEST)
+
+`per_element` is a JS function source, `(el) => ({...})`. It runs in the page
+against every element matching any of the selectors (in selector order, then
+document order). Records are de-duplicated in the page on `key` (fragment
+stripped), first match winning, and the whole list comes back in one payload,
+instead of one CDP call per selector and per element.
+"""
+
+from typing import Any, Dict, List, Sequence
+
+_TEMPLATE = """
+([selectors, key]) => {
+  const one = %s;
+  const seen = new Set();
+  const out = [];
+  for (const sel of selectors) {
+    let nodes;
+    try { nodes = document.querySelectorAll(sel); } catch (e) { continue; }
+    for (const el of nodes) {
+      let rec;
+      try { rec = one(el); } catch (e) { continue; }
+      const k = String((rec && rec[key]) || '').trim().split('#')[0];
+      if (!k || seen.has(k)) continue;
+      seen.add(k);
+      out.push(rec);
+    }
+  }
+  return out;
+}
+"""
+
+_scripts: Dict[str, str] = {}
+
+async def harvest(target: Any, selectors: Sequence[str], per_element: str, key: str = "href") -> List[Dict[str, Any]]:
+    """Run `per_element` over every match of `selectors` in `target` (page or frame)."""
+    script = _scripts.get(per_element)
+    if script is None:
+        script = _scripts[per_element] = _TEMPLATE % per_element.strip()
+    return await target.evaluate(script, [list(selectors), key]) or []
@@ -0,0 +1,210 @@
+"""
+Persistent HTTP cache with conditional GET and page fingerprints.
+
+For every URL we keep the last ETag / Last-Modified, the body (zlib) and a
+sha256 of the body in a small sqlite file under SCRAPE_CACHE_DIR. The next run
+sends If-None-Match / If-Modified-Since; a 304 or an identical body hash means
+the page is unchanged.
+
+    page = fetch_page(LIST_URL, headers=HEADERS)
+    rows = page.parse(parse_listing)      # memoized on the body hash + parser code
+    if page.changed:
+        write(rows)
+        page.commit()                     # only after the DB write succeeded
+
+`page.changed` compares against the hash last *committed*, so a run whose
+writes failed is retried next time even if the site hasn't changed. Parsed
+rows must be JSON-serializable; they are reused only while the body and the
+parser's code (the file defining it, plus scrapekit itself) are unchanged.
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from scrapekit.fetch import DEFAULT_TIMEOUT, FetchError, fetch
+from scrapekit.paths import CACHE_DIR
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+DB_NAME = "http.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url            TEXT PRIMARY KEY,
+    etag           TEXT,
+    last_modified  TEXT,
+    body_hash      TEXT,
+    body           BLOB,
+    charset        TEXT,
+    committed_hash TEXT,
+    fetched_at     REAL
+);
+CREATE TABLE IF NOT EXISTS parsed (
+    url        TEXT,
+    key        TEXT,
+    body_hash  TEXT,            -- body hash + parser fingerprint
+    rows       TEXT,
+    PRIMARY KEY (url, key)
+);
+"""
+
+def body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+_source_hashes: Dict[str, str] = {}
+
+def _source_hash(path: Optional[str]) -> str:
+    if not path:
+        return ""
+    if path not in _source_hashes:
+        try:
+            with open(path, "rb") as f:
+                _source_hashes[path] = body_hash(f.read())
+        except OSError:
+            _source_hashes[path] = ""
+    return _source_hashes[path]
+
+def _kit_hash() -> str:
+    if "scrapekit" not in _source_hashes:
+        here = os.path.dirname(os.path.abspath(__file__))
+        names = sorted(n for n in os.listdir(here) if n.endswith(".py"))
+        _source_hashes["scrapekit"] = body_hash("".join(_source_hash(os.path.join(here, n)) for n in names).encode())
+    return _source_hashes["scrapekit"]
+
+def parser_fingerprint(fn: Callable[..., Any], version: Optional[str] = None) -> str:
+    """
+    Identity of a parse function's code: its qualified name, the source of the
+    file defining it (a lambda wrapping a helper in the same scraper counts),
+    the scrapekit sources it may lean on, and an optional explicit `version`.
+    """
+    target = getattr(fn, "func", fn)              # functools.partial
+    code = getattr(target, "__code__", None)
+    parts = [
+        getattr(target, "__module__", "") or "",
+        getattr(target, "__qualname__", repr(target)),
+        _source_hash(code.co_filename) if code else "",
+        body_hash(code.co_code) if code else "",
+        _kit_hash(),
+        version or "",
+    ]
+    return body_hash("\0".join(parts).encode())
+
+# ── Store ──────────────────────────────────────────────────────────────────────
+class HttpCache:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(CACHE_DIR, DB_NAME)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def lookup(self, url: str) -> Optional[tuple]:
+        with self._lock:
+            cur = self._db.execute(
+                "SELECT etag, last_modified, body_hash, body, committed_hash, charset FROM pages WHERE url = ?", (url,)
+            )
+            return cur.fetchone()
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              digest: str, body: bytes, charset: Optional[str]) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                """INSERT INTO pages (url, etag, last_modified, body_hash, body, charset, fetched_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(url) DO UPDATE SET etag = excluded.etag,
+                       last_modified = excluded.last_modified, body_hash = excluded.body_hash,
+                       body = excluded.body, charset = excluded.charset,
+                       fetched_at = excluded.fetched_at""",
+                (url, etag, last_modified, digest, zlib.compress(body), charset, time.time()),
+            )
+
+    def commit(self, url: str, digest: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("UPDATE pages SET committed_hash = ? WHERE url = ?", (digest, url))
+
+    def parsed(self, url: str, key: str, digest: str) -> Optional[Any]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT rows FROM parsed WHERE url = ? AND key = ? AND body_hash = ?", (url, key, digest)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store_parsed(self, url: str, key: str, digest: str, rows: Any) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO parsed (url, key, body_hash, rows) VALUES (?, ?, ?, ?)",
+                (url, key, digest, json.dumps(rows, default=str)),
+            )
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> HttpCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
+
+# ── Pages ──────────────────────────────────────────────────────────────────────
+@dataclass
+class CachedPage:
+    url: str
+    status: int                 # 200, or 304 when served from the cache
+    body: bytes
+    digest: str
+    committed_hash: Optional[str]
+    charset: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.charset or "utf-8", errors="replace")
+
+    @property
+    def changed(self) -> bool:
+        """True unless this exact body was already written to the DB."""
+        return self.digest != self.committed_hash
+
+    def parse(self, fn: Callable[[str], Any], key: str = "rows", version: Optional[str] = None) -> Any:
+        """fn(text), memoized on the body hash and parser_fingerprint(fn, version)."""
+        cache = get_cache()
+        memo = body_hash(f"{self.digest}:{parser_fingerprint(fn, version)}".encode())
+        rows = cache.parsed(self.url, key, memo)
+        if rows is None:
+            rows = fn(self.text)
+            cache.store_parsed(self.url, key, memo, rows)
+        return rows
+
+    def commit(self) -> None:
+        get_cache().commit(self.url, self.digest)
+        self.committed_hash = self.digest
+
+def fetch_page(url: str, headers: Optional[Mapping[str, str]] = None,
+               timeout: float = DEFAULT_TIMEOUT) -> CachedPage:
+    cache = get_cache()
+    prev = cache.lookup(url)
+    hdrs = dict(headers or {})
+    if prev:
+        etag, last_modified = prev[0], prev[1]
+        if etag:
+            hdrs["If-None-Match"] = etag
+        if last_modified:
+            hdrs["If-Modified-Since"] = last_modified
+
+    got = fetch(url, headers=hdrs, timeout=timeout)
+    if got.status == 304 and prev:
+        return CachedPage(url, 304, zlib.decompress(prev[3]), prev[2], prev[4], prev[5])
+    if got.status == 304:
+        raise FetchError(url, "HTTP 304 without a cached copy", 304)
+    got.raise_for_status()
+
+    digest = body_hash(got.body)
+    cache.store(url, got.headers.get("ETag"), got.headers.get("Last-Modified"), digest, got.body, got.charset)
+    return CachedPage(url, got.status, got.body, digest, prev[4] if prev else None, got.charset)
@@ -0,0 +1,166 @@
+"""
+JSON-LD Event extraction straight from raw HTML, without building a DOM.
+
+    for ev in iter_events(html):              # lazily, one normalized dict per Event
+        ev["title"], ev["start_date"], ev["start_time"], ev["raw"]
+
+    for data in iter_blocks(html): ...        # each parsed <script type="application/ld+json">
+
+The script blocks are found with a regex over the text (str or bytes), and each
+is parsed leniently: HTML comments/CDATA wrappers, entity-escaped quotes,
+trailing commas, raw control characters and Helium's '":@context"' keys are all
+tolerated. Blocks that still don't parse are skipped.
+
+An Event is any node whose @type (string or list) ends in "Event" (MusicEvent,
+TheaterEvent, ComedyEvent, …), found anywhere in the block: top level, lists,
+@graph, or nested under other nodes (a Place's "Events", an ItemList, …).
+Normalized dicts keep the original node under "raw" for source-specific fields.
+"""
+
+import re
+import json
+import html as htmllib
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+_SCRIPT_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.I | re.S,
+)
+_WRAPPER_RE = re.compile(r"^\s*(?:<!--|<!\[CDATA\[)|(?:-->|\]\]>)\s*$")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_BAD_AT_KEY_RE = re.compile(r'"\s*:@')
+
+Markup = Union[str, bytes]
+
+def _loads(text: str) -> Optional[Any]:
+    text = _WRAPPER_RE.sub("", text).strip()
+    if not text:
+        return None
+    for attempt in (
+        lambda t: t,
+        lambda t: _TRAILING_COMMA_RE.sub(r"\1", _BAD_AT_KEY_RE.sub('"@', t)),
+        lambda t: _TRAILING_COMMA_RE.sub(r"\1", _BAD_AT_KEY_RE.sub('"@', htmllib.unescape(t))),
+    ):
+        try:
+            return json.loads(attempt(text), strict=False)
+        except ValueError:
+            continue
+    return None
+
+def iter_blocks(markup: Markup) -> Iterator[Any]:
+    """Each JSON-LD script payload that parses, in document order."""
+    if isinstance(markup, bytes):
+        markup = markup.decode("utf-8", errors="replace")
+    for m in _SCRIPT_RE.finditer(markup):
+        data = _loads(m.group(1))
+        if data is not None:
+            yield data
+
+def _types(node: Dict[str, Any]) -> Tuple[str, ...]:
+    t = node.get("@type") or node.get("type")
+    if isinstance(t, list):
+        return tuple(str(x) for x in t)
+    return (str(t),) if t else ()
+
+def is_event(node: Any) -> bool:
+    return isinstance(node, dict) and any(t.lower().endswith("event") for t in _types(node))
+
+def iter_nodes(data: Any) -> Iterator[Dict[str, Any]]:
+    """Top-level nodes of a block: lists and @graph flattened."""
+    if isinstance(data, list):
+        for item in data:
+            yield from iter_nodes(item)
+    elif isinstance(data, dict):
+        if isinstance(data.get("@graph"), list) and not _types(data):
+            yield from iter_nodes(data["@graph"])
+        else:
+            yield data
+
+def _walk_events(data: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk_events(item)
+    elif isinstance(data, dict):
+        if is_event(data):
+            yield data
+            return                  # an Event's own sub-objects aren't separate listings
+        for v in data.values():
+            if isinstance(v, (dict, list)):
+                yield from _walk_events(v)
+
+# ── Normalization ──────────────────────────────────────────────────────────────
+def _text(v: Any) -> Optional[str]:
+    if isinstance(v, list):
+        v = v[0] if v else None
+    if v is None or isinstance(v, (dict, list)):
+        return None
+    s = htmllib.unescape(str(v)).strip()
+    return s or None
+
+def first_image(v: Any) -> Optional[str]:
+    if isinstance(v, list):
+        for item in v:
+            url = first_image(item)
+            if url:
+                return url
+        return None
+    if isinstance(v, dict):
+        return _text(v.get("url") or v.get("contentUrl") or v.get("@id"))
+    return _text(v)
+
+def split_iso(value: Any) -> Tuple[Optional[str], Optional[str]]:
+    """('YYYY-MM-DD', 'HH:MM:SS' or None) as written, i.e. in the value's own offset."""
+    s = _text(value)
+    if not s:
+        return (None, None)
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        return (s[:10] if re.match(r"\d{4}-\d{2}-\d{2}", s) else None, None)
+    if "T" not in s and " " not in s.strip():
+        return (dt.date().isoformat(), None)
+    return (dt.date().isoformat(), dt.strftime("%H:%M:%S"))
+
+def _location(v: Any) -> Tuple[Optional[str], Optional[str]]:
+    if isinstance(v, list):
+        v = v[0] if v else None
+    if isinstance(v, str):
+        return (_text(v), None)
+    if not isinstance(v, dict):
+        return (None, None)
+    addr = v.get("address")
+    if isinstance(addr, dict):
+        parts = [_text(addr.get(k)) for k in ("streetAddress", "addressLocality", "addressRegion", "postalCode")]
+        address = ", ".join(p for p in parts if p) or None
+    else:
+        address = _text(addr)
+    return (_text(v.get("name")), address)
+
+def normalize(node: Dict[str, Any]) -> Dict[str, Any]:
+    start_date, start_time = split_iso(node.get("startDate"))
+    end_date, end_time = split_iso(node.get("endDate"))
+    venue, address = _location(node.get("location"))
+    url = node.get("url")
+    return {
+        "type": _types(node)[0] if _types(node) else None,
+        "title": _text(node.get("name") or node.get("headline")),
+        "link": _text(url.get("@id") if isinstance(url, dict) else url),
+        "image": first_image(node.get("image")),
+        "description": _text(node.get("description")),
+        "start": _text(node.get("startDate")),
+        "end": _text(node.get("endDate")),
+        "start_date": start_date,
+        "start_time": start_time,
+        "end_date": end_date,
+        "end_time": end_time,
+        "venue": venue,
+        "address": address,
+        "raw": node,
+    }
+
+def iter_events(markup: Markup) -> Iterator[Dict[str, Any]]:
+    """Normalized Event dicts from every JSON-LD block in `markup`, lazily."""
+    for data in iter_blocks(markup):
+        for node in _walk_events(data):
+            yield normalize(node)
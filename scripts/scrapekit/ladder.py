@@ -0,0 +1,203 @@
+"""
+Tiered page fetching: cheapest client first, escalating only when blocked.
+
+    html = climb(URL, headers=HEADERS)                      # None if every tier failed
+    html = climb(URL, accept=lambda t: "astro-island" in t, browse=grab)
+
+Tiers, in order of cost:
+
+    plain         scrapekit.fetch (pooled aiohttp)
+    cloudscraper  solves the basic Cloudflare JS challenge (optional dependency)
+    jina          the r.jina.ai reader proxy, asked for HTML
+    browser       a pooled Playwright page (optional dependency)
+
+With `har="source"` and SCRAPE_HAR set, the ladder goes straight to the
+browser tier, which then records to or replays from that source's HAR (see
+scrapekit.browser), and leaves the per-host memory alone.
+
+Only a bot wall escalates to the next tier: a 401/403/429, a challenge page
+(whatever its status, e.g. Cloudflare's 503), or a page `accept(text)` says
+isn't the real one. Anything else is an outage, not a block: the plain tier
+retries it with backoff (scrapekit.fetch's RETRIES), and if it persists the climb
+stops there, so one transient 5xx doesn't pin the host to a heavier tier.
+404/410 stop the climb too.
+
+The tier that worked is remembered per host (SCRAPE_CACHE_DIR/ladder.json), so
+the next run starts there instead of re-paying for the cheap tiers that fail.
+After RETRY_CHEAPER_DAYS the host starts from the bottom again, so a site that
+drops its bot wall stops costing a browser.
+"""
+
+import os
+import json
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from scrapekit.fetch import DEFAULT_TIMEOUT, fetch, host_of
+from scrapekit.paths import CACHE_DIR
+
+try:
+    from scrapekit.browser import HAR_MODE
+except ImportError:         # no playwright: no browser tier, so nothing to record or replay
+    HAR_MODE = ""
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+TIERS = ("plain", "cloudscraper", "jina", "browser")
+MEMORY_PATH = os.path.join(CACHE_DIR, "ladder.json")
+RETRY_CHEAPER_DAYS = int(os.getenv("SCRAPE_LADDER_RETRY_DAYS", "7"))
+JINA_PREFIX = "https://r.jina.ai/"
+GONE_STATUSES = frozenset({404, 410})
+BLOCK_STATUSES = frozenset({401, 403, 429})
+CHALLENGE_MARKERS = (
+    "cf-browser-verification", "cf_chl_opt", "challenge-platform",
+    "<title>just a moment...</title>", "attention required! | cloudflare",
+    "enable javascript and cookies to continue", "px-captcha", "captcha-delivery.com",
+)
+
+Browse = Callable[[Any], Awaitable[str]]    # async fn(page) -> html
+
+class TierUnavailable(Exception):
+    """The tier's optional dependency isn't installed."""
+
+class Blocked(Exception):
+    """The tier's client gave up on a bot wall (rather than returning its page)."""
+
+def looks_blocked(text: str) -> bool:
+    head = text[:20000].lower()
+    return any(m in head for m in CHALLENGE_MARKERS)
+
+# ── Tiers ──────────────────────────────────────────────────────────────────────
+@dataclass
+class Attempt:
+    url: str
+    headers: Optional[Mapping[str, str]]
+    timeout: float
+    browse: Optional[Browse] = None
+    har: Optional[str] = None
+
+def _plain(a: Attempt) -> Tuple[int, str]:
+    got = fetch(a.url, headers=a.headers, timeout=a.timeout)   # retries 5xx/timeouts with backoff
+    return got.status, got.text
+
+_scraper = None
+_scraper_lock = threading.Lock()
+
+def _cloudscraper(a: Attempt) -> Tuple[int, str]:
+    global _scraper
+    try:
+        import cloudscraper
+    except ImportError as e:
+        raise TierUnavailable("cloudscraper") from e
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = cloudscraper.create_scraper()
+    try:
+        r = _scraper.get(a.url, headers=dict(a.headers or {}), timeout=a.timeout)
+    except getattr(cloudscraper.exceptions, "CloudflareException", ()) as e:
+        raise Blocked(str(e)) from e
+    return r.status_code, r.text
+
+def _jina(a: Attempt) -> Tuple[int, str]:
+    got = fetch(JINA_PREFIX + a.url, headers={**(a.headers or {}), "X-Return-Format": "html"},
+                timeout=a.timeout + 10, retries=1)
+    return got.status, got.text
+
+def _browser(a: Attempt) -> Tuple[int, str]:
+    try:
+        from scrapekit.browser import with_page
+        from scrapekit.settle import settle_dom
+    except ImportError as e:
+        raise TierUnavailable("playwright") from e
+
+    async def grab(page) -> Tuple[int, str]:
+        if a.browse is not None:
+            return 200, await a.browse(page)
+        resp = await page.goto(a.url, wait_until="domcontentloaded", timeout=a.timeout * 1000)
+        await settle_dom(page, timeout_ms=int(a.timeout * 1000))
+        return (resp.status if resp else 200), await page.content()
+
+    ua = {k.lower(): v for k, v in (a.headers or {}).items()}.get("user-agent")
+    return with_page(grab, har=a.har, **({"user_agent": ua} if ua else {}))
+
+TIER_FUNCS = {"plain": _plain, "cloudscraper": _cloudscraper, "jina": _jina, "browser": _browser}
+
+# ── Memory ─────────────────────────────────────────────────────────────────────
+class LadderMemory:
+    def __init__(self, path: str = MEMORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.hosts: Dict[str, Dict[str, Any]] = json.load(f)
+        except (OSError, ValueError):
+            self.hosts = {}
+
+    def _fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return bool(entry) and time.time() - entry.get("at", 0) < RETRY_CHEAPER_DAYS * 86400
+
+    def start(self, host: str, tiers: Sequence[str]) -> int:
+        entry = self.hosts.get(host)
+        if self._fresh(entry) and entry["tier"] in tiers:
+            return tiers.index(entry["tier"])
+        return 0
+
+    def remember(self, host: str, tier: str) -> None:
+        with self._lock:
+            entry = self.hosts.get(host)
+            if entry and entry.get("tier") == tier and self._fresh(entry):
+                return
+            self.hosts[host] = {"tier": tier, "at": time.time()}
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.hosts, f)
+            os.replace(tmp, self.path)
+
+_memory: Optional[LadderMemory] = None
+_memory_lock = threading.Lock()
+
+def get_memory() -> LadderMemory:
+    global _memory
+    with _memory_lock:
+        if _memory is None:
+            _memory = LadderMemory()
+        return _memory
+
+# ── Public API ─────────────────────────────────────────────────────────────────
+def climb(url: str, headers: Optional[Mapping[str, str]] = None, timeout: float = DEFAULT_TIMEOUT,
+          accept: Optional[Callable[[str], bool]] = None, browse: Optional[Browse] = None,
+          tiers: Sequence[str] = TIERS, har: Optional[str] = None) -> Optional[str]:
+    """Page text from the cheapest tier that gets through, or None."""
+    host = host_of(url)
+    memory = get_memory()
+    under_har = bool(har and HAR_MODE)
+    tiers = ("browser",) if under_har else tuple(tiers)
+    attempt = Attempt(url, headers, timeout, browse, har)
+    for name in tiers[memory.start(host, tiers):]:
+        try:
+            status, text = TIER_FUNCS[name](attempt)
+        except TierUnavailable:
+            continue
+        except Blocked as e:
+            print(f"🪜 {host}: {name} was blocked ({e}), escalating")
+            continue
+        except Exception as e:
+            print(f"⚠️  {name} fetch failed for {url}: {e}")
+            return None
+        if status in GONE_STATUSES:
+            print(f"⚠️  {url} returned {status}")
+            return None
+        challenged = looks_blocked(text)
+        if status < 400 and not challenged and (accept is None or accept(text)):
+            if not under_har:
+                memory.remember(host, name)
+            return text
+        if status >= 400 and status not in BLOCK_STATUSES and not challenged:
+            print(f"⚠️  {url} returned HTTP {status} from {name}; not a bot wall, not escalating")
+            return None
+        why = "challenge page" if challenged else ("unexpected page" if status < 400 else f"HTTP {status}")
+        print(f"🪜 {host}: {name} got {why}, escalating")
+    print(f"❌ Every fetch tier failed for {url}")
+    return None
@@ -0,0 +1,14 @@
+"""
+Where scrapekit keeps its local state.
+
+Everything persisted between runs (HTTP cache, fingerprints, venue ids, tag
+snapshot, learned feed plans, ladder memory, HARs) lives under CACHE_DIR.
+This module has no third-party imports, so the lightweight resolvers can use
+it without pulling in the fetch engine.
+"""
+
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "scrapekit")
+CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR") or DEFAULT_CACHE_DIR
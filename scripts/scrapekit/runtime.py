@@ -0,0 +1,117 @@
+"""
+Process-wide state shared by every scraper in a run.
+
+- get_client(url, key): one Supabase client per (url, key) per process
+- get_session(): a requests.Session per thread, all on one pooled transport
+- shared_cache(name): named dicts (tags, venues, …) that live as long as the process
+- install(): route `supabase.create_client` and `requests.get/post/…` through the
+  above, so unmodified scripts share them when loaded by scripts/run_scrapers.py
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+import requests.api
+import supabase as _supabase_pkg
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from supabase import Client
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+POOL_CONNECTIONS = 32   # distinct hosts kept warm
+POOL_MAXSIZE = 16       # sockets per host
+
+_lock = threading.RLock()
+_clients: Dict[Tuple[str, str], Client] = {}
+_adapter: Optional[HTTPAdapter] = None
+_local = threading.local()
+_caches: Dict[str, Dict[Any, Any]] = {}
+_installed = False
+
+_original_create_client = _supabase_pkg.create_client
+_original_request = requests.api.request
+
+# ── Supabase ───────────────────────────────────────────────────────────────────
+def supabase_credentials() -> Tuple[Optional[str], Optional[str]]:
+    """Same lookup the scripts do: service role key first, then SUPABASE_KEY."""
+    load_dotenv()
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+    return url, key
+
+def get_client(url: Optional[str] = None, key: Optional[str] = None, options: Any = None) -> Client:
+    if url is None and key is None:
+        url, key = supabase_credentials()
+    if not url or not key:
+        raise RuntimeError("Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY/KEY")
+    with _lock:
+        client = _clients.get((url, key))
+        if client is None:
+            if options is None:
+                client = _original_create_client(url, key)
+            else:
+                client = _original_create_client(url, key, options)
+            _clients[(url, key)] = client
+        return client
+
+# ── HTTP ───────────────────────────────────────────────────────────────────────
+def _shared_adapter() -> HTTPAdapter:
+    global _adapter
+    with _lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        return _adapter
+
+def get_session() -> requests.Session:
+    """
+    This thread's session. Sources run on their own threads, so each keeps its
+    own cookies and auth, while the connection pool behind them is shared.
+    """
+    sess = getattr(_local, "session", None)
+    if sess is None:
+        sess = requests.Session()
+        adapter = _shared_adapter()
+        sess.mount("http://", adapter)
+        sess.mount("https://", adapter)
+        _local.session = sess
+    return sess
+
+def _drop_connection_close(headers: Any) -> Any:
+    """Scrapers send `Connection: close`; that defeats the pool, so strip it."""
+    if not headers:
+        return headers
+    return {k: v for k, v in headers.items()
+            if not (k.lower() == "connection" and str(v).lower() == "close")}
+
+def _shared_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    kwargs["headers"] = _drop_connection_close(kwargs.get("headers"))
+    return get_session().request(method=method, url=url, **kwargs)
+
+# ── Run-scoped caches ──────────────────────────────────────────────────────────
+def shared_cache(name: str) -> Dict[Any, Any]:
+    with _lock:
+        return _caches.setdefault(name, {})
+
+# ── Wiring ─────────────────────────────────────────────────────────────────────
+def install() -> None:
+    """
+    Patch the two entry points every script uses. `from supabase import
+    create_client` and `requests.get(...)` both resolve at call/import time, so
+    scripts loaded after this share one client and one connection pool.
+    """
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        _supabase_pkg.create_client = get_client
+        requests.api.request = _shared_request
+        _installed = True
+
+def uninstall() -> None:
+    global _installed
+    with _lock:
+        _supabase_pkg.create_client = _original_create_client
+        requests.api.request = _original_request
+        _installed = False
@@ -0,0 +1,87 @@
+"""
+"Settle" waits for the Playwright flows: return as soon as the page has stopped
+changing instead of sleeping a fixed amount.
+
+    await settle_count(page, "article.mec-event-article", min_count=prev + 1)
+    await settle_dom(page, quiet_ms=400)
+    resp = await wait_for_xhr(page, "admin-ajax.php", action=btn.click)
+
+Each takes a page or a frame and has a hard upper bound (timeout_ms). On
+timeout they return what they have (count, False, None) rather than raising,
+so a slow page degrades to the old fixed-sleep behaviour instead of failing.
+"""
+
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Pattern, Union
+
+from playwright.async_api import Frame, Page, Response
+
+POLL_MS = 100
+
+Target = Union[Page, Frame]
+UrlMatch = Union[str, Pattern[str], Callable[[str], bool]]
+
+async def settle_count(target: Target, selector: str, stable_ms: int = 500, timeout_ms: int = 10000,
+                       min_count: int = 1) -> int:
+    """Wait until `selector` matches at least min_count nodes and the count holds for stable_ms."""
+    deadline = time.monotonic() + timeout_ms / 1000
+    last, since = -1, time.monotonic()
+    while True:
+        try:
+            n = await target.locator(selector).count()
+        except Exception:
+            n = -1                  # mid-navigation; treat as a change
+        now = time.monotonic()
+        if n != last:
+            last, since = n, now
+        elif n >= min_count and (now - since) * 1000 >= stable_ms:
+            return n
+        if now >= deadline:
+            return max(last, 0)
+        await asyncio.sleep(POLL_MS / 1000)
+
+_QUIET_JS = """
+([root, quietMs, timeoutMs]) => new Promise(resolve => {
+    const node = document.querySelector(root) || document.documentElement;
+    let timer = null;
+    const done = ok => { obs.disconnect(); clearTimeout(timer); clearTimeout(cap); resolve(ok); };
+    const arm = () => { clearTimeout(timer); timer = setTimeout(() => done(true), quietMs); };
+    const obs = new MutationObserver(arm);
+    obs.observe(node, {childList: true, subtree: true, attributes: true, characterData: true});
+    const cap = setTimeout(() => done(false), timeoutMs);
+    arm();
+})
+"""
+
+async def settle_dom(target: Target, quiet_ms: int = 400, timeout_ms: int = 10000, root: str = "body") -> bool:
+    """Wait until no DOM mutation under `root` for quiet_ms. False if it never went quiet."""
+    try:
+        return bool(await target.evaluate(_QUIET_JS, [root, quiet_ms, timeout_ms]))
+    except Exception:
+        return False                # navigated away or frame detached
+
+def _url_matcher(match: UrlMatch) -> Callable[[str], bool]:
+    if callable(match):
+        return match
+    if isinstance(match, str):
+        return lambda url: match in url
+    return lambda url: bool(match.search(url))
+
+async def wait_for_xhr(page: Page, match: UrlMatch, action: Optional[Callable[[], Awaitable[Any]]] = None,
+                       timeout_ms: int = 15000) -> Optional[Response]:
+    """
+    Wait for a finished response whose URL matches (substring, regex or
+    predicate). With `action`, the listener is armed before it runs, so a fast
+    reply to e.g. a click isn't missed. None on timeout.
+    """
+    matches = _url_matcher(match)
+    try:
+        async with page.expect_response(lambda r: matches(r.url), timeout=timeout_ms) as info:
+            if action is not None:
+                await action()
+        resp = await info.value
+        await resp.finished()
+        return resp
+    except Exception:
+        return None
@@ -0,0 +1,164 @@
+"""
+Incremental crawling from a site's sitemap: fetch only pages that are new or
+whose <lastmod> moved since the last run.
+
+    entries = [e for e in iter_entries(SITEMAP_URL, headers=HEADERS) if is_event(e.loc)]
+    for entry in changed(SOURCE, entries):
+        ...fetch / parse entry.loc...
+        done.append(entry)
+    write(rows)
+    remember(SOURCE, done)                # only after the DB write succeeded
+
+iter_entries streams the sitemap (plain or gzipped, by magic bytes, whatever
+the Content-Type) through an incremental XML parser, one <url> at a time, and
+follows <sitemapindex> children. The lastmod of every entry that was handled
+is kept locally (sqlite next to the HTTP cache), keyed by (source, url).
+
+An entry is due when it was never remembered, its lastmod differs from the
+remembered one, it has no lastmod at all, or it was last handled more than
+REFRESH_AFTER_DAYS ago. SCRAPE_SITEMAP_FULL=1 makes every entry due.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+from typing import Iterable, Iterator, List, Mapping, NamedTuple, Optional
+
+import requests
+
+from scrapekit import runtime
+from scrapekit.fetch import DEFAULT_HEADERS, DEFAULT_TIMEOUT
+from scrapekit.paths import CACHE_DIR
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+DB_NAME = "sitemaps.sqlite3"
+REFRESH_AFTER_DAYS = 7
+MAX_INDEX_DEPTH = 3
+CHUNK_BYTES = 64 * 1024
+FULL_CRAWL = os.getenv("SCRAPE_SITEMAP_FULL", "0") == "1"
+GZIP_MAGIC = b"\x1f\x8b"
+
+class Entry(NamedTuple):
+    loc: str
+    lastmod: Optional[str] = None
+
+# ── Streaming parse ────────────────────────────────────────────────────────────
+def _chunks(url: str, headers: Optional[Mapping[str, str]], timeout: float) -> Iterator[bytes]:
+    sess = runtime.get_session()
+    with sess.get(url, headers={**DEFAULT_HEADERS, **(headers or {})}, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        inflate = None
+        for chunk in r.iter_content(CHUNK_BYTES):   # undoes Content-Encoding, not .xml.gz files
+            if inflate is None:
+                inflate = zlib.decompressobj(16 + zlib.MAX_WBITS) if chunk.startswith(GZIP_MAGIC) else False
+            yield inflate.decompress(chunk) if inflate else chunk
+        if inflate:
+            yield inflate.flush()
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def _child_text(el: ET.Element, name: str) -> Optional[str]:
+    for child in el:
+        if _local(child.tag) == name:
+            return (child.text or "").strip() or None
+    return None
+
+def iter_entries(url: str, headers: Optional[Mapping[str, str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT, _depth: int = 0) -> Iterator[Entry]:
+    """Every <url> in the sitemap at `url` (and, for an index, in its child sitemaps)."""
+    parser = ET.XMLPullParser(events=("end",))
+    children: List[str] = []
+    try:
+        for data in _chunks(url, headers, timeout):
+            parser.feed(data)
+            for _, el in parser.read_events():
+                kind = _local(el.tag)
+                if kind == "url":
+                    loc = _child_text(el, "loc")
+                    if loc:
+                        yield Entry(loc, _child_text(el, "lastmod"))
+                    el.clear()
+                elif kind == "sitemap":
+                    loc = _child_text(el, "loc")
+                    if loc:
+                        children.append(loc)
+                    el.clear()
+        parser.close()
+    except requests.RequestException as e:
+        print(f"⚠️  Sitemap fetch failed {url}: {e}")
+        return
+    except ET.ParseError as e:
+        print(f"⚠️  Sitemap {url} is not well-formed XML ({e}); stopped there")
+    if children and _depth >= MAX_INDEX_DEPTH:
+        print(f"⚠️  Sitemap index nesting too deep at {url}; skipping {len(children)} child sitemap(s)")
+        return
+    for child in children:
+        yield from iter_entries(child, headers, timeout, _depth + 1)
+
+# ── Store ──────────────────────────────────────────────────────────────────────
+class LastmodStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(CACHE_DIR, DB_NAME)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS lastmods (
+                   source     TEXT,
+                   url        TEXT,
+                   lastmod    TEXT,
+                   handled_at REAL,
+                   PRIMARY KEY (source, url)
+               )"""
+        )
+
+    def changed(self, source: str, entries: Iterable[Entry]) -> List[Entry]:
+        entries = list(entries)
+        if FULL_CRAWL:
+            return entries
+        with self._lock:
+            known = {
+                url: (lastmod, at) for url, lastmod, at in self._db.execute(
+                    "SELECT url, lastmod, handled_at FROM lastmods WHERE source = ?", (source,)
+                )
+            }
+        stale_before = time.time() - REFRESH_AFTER_DAYS * 86400
+        due = []
+        for e in entries:
+            prev = known.get(e.loc)
+            if prev is None or not e.lastmod or prev[0] != e.lastmod or prev[1] < stale_before:
+                due.append(e)
+        return due
+
+    def remember(self, source: str, entries: Iterable[Entry]) -> None:
+        now = time.time()
+        rows = [(source, e.loc, e.lastmod, now) for e in entries]
+        if not rows:
+            return
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO lastmods (source, url, lastmod, handled_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+_store: Optional[LastmodStore] = None
+_store_lock = threading.Lock()
+
+def get_store() -> LastmodStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LastmodStore()
+        return _store
+
+def changed(source: str, entries: Iterable[Entry]) -> List[Entry]:
+    """The entries due for a fetch, in sitemap order."""
+    return get_store().changed(source, entries)
+
+def remember(source: str, entries: Iterable[Entry]) -> None:
+    get_store().remember(source, entries)
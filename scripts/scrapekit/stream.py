@@ -0,0 +1,99 @@
+"""
+Streaming scrape → write pipelines built from generator stages.
+
+    def pages():                                   # fetch + parse, one page at a time
+        url = BASE_URL
+        while url:
+            rows, url = scrape_page(url)
+            yield rows
+
+    rows = (r for page in prefetch(pages()) for r in page)
+    for batch, saved in upsert_batches(sb, "all_events", rows, to_row=normalize):
+        ...tag / log the batch...
+
+prefetch runs its source on a background thread, up to `ahead` items in front
+of the consumer, so page N+1 is being fetched while page N's rows are written.
+upsert_batches flushes every `size` rows through scrapekit.writer.bulk_upsert
+as they arrive, instead of after the last page: memory stays at a batch or two,
+and the first rows land while the crawl is still running.
+
+Stages are plain iterators, so a scraper can drop any of them (no prefetch for
+a one-page site, no to_row when rows are already shaped).
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from supabase import Client
+
+from scrapekit.writer import CHUNK_SIZE, Row, bulk_upsert
+
+T = TypeVar("T")
+
+_DONE = object()
+
+# ── Stages ─────────────────────────────────────────────────────────────────────
+def prefetch(items: Iterable[T], ahead: int = 1) -> Iterator[T]:
+    """`items`, produced on a worker thread up to `ahead` items early. Errors re-raise here."""
+    q: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=ahead)
+    stop = threading.Event()
+
+    def put(entry: Tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def pump() -> None:
+        try:
+            for item in items:
+                if not put((True, item)):
+                    return
+            put((True, _DONE))
+        except BaseException as e:
+            put((False, e))
+
+    threading.Thread(target=pump, name="scrapekit-prefetch", daemon=True).start()
+    try:
+        while True:
+            ok, item = q.get()
+            if not ok:
+                raise item
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()                      # consumer stopped early; let the worker exit
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+# ── Write ──────────────────────────────────────────────────────────────────────
+def upsert_batches(client: Client, table: str, items: Iterable[T], on_conflict: str = "link",
+                   size: int = CHUNK_SIZE, to_row: Optional[Callable[[T], Optional[Row]]] = None,
+                   ) -> Iterator[Tuple[List[T], List[Optional[Row]]]]:
+    """
+    Upsert `items` `size` at a time as they stream in, yielding each
+    (batch, saved) pair; `saved` lines up with `batch` like bulk_upsert's result.
+    `to_row` shapes an item into its table row (None drops it).
+    """
+    for batch in batched(_shaped(items, to_row), size):
+        got, rows = [b[0] for b in batch], [b[1] for b in batch]
+        yield got, bulk_upsert(client, table, rows, on_conflict=on_conflict, chunk_size=size)
+
+def _shaped(items: Iterable[T], to_row: Optional[Callable[[T], Optional[Row]]]) -> Iterator[Tuple[T, Row]]:
+    for item in items:
+        row = to_row(item) if to_row is not None else item
+        if row is not None:
+            yield item, row         # type: ignore[misc]
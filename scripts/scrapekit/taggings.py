@@ -0,0 +1,119 @@
+"""
+Set-based taggings reconciliation for a whole run.
+
+Collect the tags each event should have while writing events, then reconcile
+them in one go:
+
+    desired = {}
+    desired[("all_events", str(event_id))] = {music_id, comedy_id}
+    ...
+    done = reconcile_taggings(sb, desired)        # prune=False: add-only
+    remember("all_events", [r for r in written if key(r) not in done.failed])
+
+Existing taggings for every (taggable_type, taggable_id) in `desired` are read
+with one `in_` query per CHUNK_SIZE ids, and only the difference is written:
+one bulk insert for missing rows and, with prune=True, one bulk delete (by
+taggings.id) for rows that are no longer wanted. Rows that already match are
+left untouched, so re-running a scraper doesn't churn the table.
+
+Failed reads and writes are reported per taggable in `failed`, so callers can
+hold back anything (e.g. row fingerprints) that would stop the next run from
+retrying them.
+"""
+
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Set, Tuple
+
+from postgrest.exceptions import APIError
+from supabase import Client
+
+CHUNK_SIZE = 200
+
+Key = Tuple[str, str]  # (taggable_type, taggable_id)
+
+class Reconciled(NamedTuple):
+    inserted: int
+    deleted: int
+    failed: Set[Key]   # taggables whose taggings may not match `desired`
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def fetch_existing(client: Client, keys: Iterable[Key],
+                   chunk_size: int = CHUNK_SIZE) -> Dict[Key, Dict[int, List[int]]]:
+    """{(type, id): {tag_id: [taggings.id, ...]}} for the given taggables."""
+    by_type: Dict[str, List[str]] = {}
+    for ttype, tid in keys:
+        by_type.setdefault(ttype, []).append(tid)
+
+    out: Dict[Key, Dict[int, List[int]]] = {}
+    for ttype, ids in by_type.items():
+        for chunk in _chunks(sorted(set(ids)), chunk_size):
+            res = (
+                client.table("taggings")
+                .select("id,taggable_id,tag_id")
+                .eq("taggable_type", ttype)
+                .in_("taggable_id", chunk)
+                .execute()
+            )
+            for row in res.data or []:
+                tags = out.setdefault((ttype, str(row["taggable_id"])), {})
+                tags.setdefault(int(row["tag_id"]), []).append(row["id"])
+    return out
+
+def reconcile_taggings(client: Client, desired: Mapping[Key, Iterable[int]], prune: bool = False,
+                       chunk_size: int = CHUNK_SIZE) -> Reconciled:
+    """
+    Make taggings match `desired`. With prune=False tags are only added; with
+    prune=True tags not listed for a taggable are removed (an empty set clears
+    it). Duplicate rows for the same tag are collapsed when pruning.
+    Returns (inserted, deleted, failed).
+    """
+    wanted: Dict[Key, Set[int]] = {
+        (ttype, str(tid)): {int(t) for t in tags if t}
+        for (ttype, tid), tags in desired.items()
+    }
+    if not wanted:
+        return Reconciled(0, 0, set())
+
+    try:
+        existing = fetch_existing(client, wanted.keys(), chunk_size)
+    except APIError as e:
+        print(f"⚠️  Could not read existing taggings: {e}")
+        return Reconciled(0, 0, set(wanted))
+
+    to_insert = []
+    to_delete: List[int] = []
+    owner: Dict[int, Key] = {}   # taggings.id -> taggable, for failed deletes
+    unchanged = 0
+    for (ttype, tid), tags in wanted.items():
+        have = existing.get((ttype, tid), {})
+        for tag in sorted(tags - have.keys()):
+            to_insert.append({"tag_id": tag, "taggable_type": ttype, "taggable_id": tid})
+        unchanged += len(tags & have.keys())
+        if prune:
+            for tag, row_ids in have.items():
+                for row_id in (row_ids if tag not in tags else row_ids[1:]):
+                    to_delete.append(row_id)
+                    owner[row_id] = (ttype, tid)
+
+    inserted = deleted = 0
+    failed: Set[Key] = set()
+    for chunk in _chunks(to_insert, chunk_size):
+        try:
+            client.table("taggings").insert(chunk).execute()
+            inserted += len(chunk)
+        except APIError as e:
+            print(f"⚠️  Taggings insert failed for {len(chunk)} rows: {e}")
+            failed.update((r["taggable_type"], r["taggable_id"]) for r in chunk)
+    for chunk in _chunks(to_delete, chunk_size):
+        try:
+            client.table("taggings").delete().in_("id", chunk).execute()
+            deleted += len(chunk)
+        except APIError as e:
+            print(f"⚠️  Taggings delete failed for {len(chunk)} rows: {e}")
+            failed.update(owner[row_id] for row_id in chunk)
+
+    print(f"🏷️  Taggings: +{inserted} −{deleted} ({unchanged} already in place"
+          + (f", {len(failed)} taggables failed)" if failed else ")"))
+    return Reconciled(inserted, deleted, failed)
@@ -0,0 +1,130 @@
+"""
+Process-wide tag id resolver.
+
+    tags = get_tags(sb)
+    music_id = tags.id("music")            # slug …
+    music_id = tags.id("Music")            # … or case-insensitive name
+
+The whole tags table is read once per process and kept in
+runtime.shared_cache("tags"), so every source loaded by run_scrapers.py shares
+one copy. It is also written to a JSON snapshot under SCRAPE_CACHE_DIR; a
+snapshot younger than SNAPSHOT_TTL seconds is used instead of the DB, so
+separate processes (and back-to-back workflow runs) skip the query too. A miss
+against a snapshot triggers one live reload, in case the tag was just created.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from supabase import Client
+
+from scrapekit import runtime
+from scrapekit.paths import CACHE_DIR
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, "tags.json")
+SNAPSHOT_TTL = int(os.getenv("SCRAPE_TAGS_TTL", "3600"))
+PAGE_SIZE = 1000
+
+def _fold(s: Any) -> str:
+    return " ".join(str(s or "").split()).lower()
+
+class TagResolver:
+    def __init__(self, client: Client, snapshot_path: str = SNAPSHOT_PATH, ttl: int = SNAPSHOT_TTL):
+        self.client = client
+        self.snapshot_path = snapshot_path
+        self.ttl = ttl
+        self.rows: List[Dict[str, Any]] = []
+        self.by_slug: Dict[str, int] = {}
+        self.by_name: Dict[str, int] = {}
+        self.live = False
+        self._lock = threading.Lock()
+        self._load()
+
+    # ── Loading ────────────────────────────────────────────────────────────────
+    def _index(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+        self.by_slug = {_fold(r["slug"]): r["id"] for r in rows if r.get("slug")}
+        self.by_name = {_fold(r["name"]): r["id"] for r in rows if r.get("name")}
+
+    def _read_snapshot(self) -> Optional[List[Dict[str, Any]]]:
+        try:
+            if time.time() - os.path.getmtime(self.snapshot_path) > self.ttl:
+                return None
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_snapshot(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+            tmp = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            os.replace(tmp, self.snapshot_path)
+        except OSError as e:
+            print(f"⚠️  Could not write tags snapshot: {e}")
+
+    def _fetch(self) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        start = 0
+        while True:
+            res = (
+                self.client.table("tags")
+                .select("id,slug,name")
+                .order("id")
+                .range(start, start + PAGE_SIZE - 1)
+                .execute()
+            )
+            page = res.data or []
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+            start += PAGE_SIZE
+
+    def _load(self) -> None:
+        rows = self._read_snapshot()
+        if rows is None:
+            self.reload()
+        else:
+            self._index(rows)
+
+    def reload(self) -> None:
+        rows = self._fetch()
+        self._index(rows)
+        self.live = True
+        self._write_snapshot(rows)
+        print(f"🏷️  Loaded {len(rows)} tags")
+
+    # ── Lookup ─────────────────────────────────────────────────────────────────
+    def _get(self, key: str) -> Optional[int]:
+        k = _fold(key)
+        return self.by_slug.get(k) or self.by_name.get(k)
+
+    def id(self, key: str) -> Optional[int]:
+        """Tag id by slug or case-insensitive name, or None."""
+        tid = self._get(key)
+        if tid is None and not self.live:
+            with self._lock:
+                if not self.live:
+                    self.reload()
+            tid = self._get(key)
+        return tid
+
+    def ids(self, keys: Iterable[str]) -> List[int]:
+        """Ids for the keys that exist, deduped, in input order."""
+        out = [self.id(k) for k in keys]
+        return list(dict.fromkeys(t for t in out if t is not None))
+
+_resolver_lock = threading.Lock()
+
+def get_tags(client: Optional[Client] = None) -> TagResolver:
+    cache = runtime.shared_cache("tags")
+    with _resolver_lock:
+        if "resolver" not in cache:
+            cache["resolver"] = TagResolver(client or runtime.get_client())
+        return cache["resolver"]
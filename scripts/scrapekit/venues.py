@@ -0,0 +1,154 @@
+"""
+Memoized, batched venue resolution.
+
+    ids = resolve_venues(sb, [{"name": n, "address": a} for n, a in distinct])
+    rec["venue_id"] = ids[ev["venue_name"]]
+
+    venue_id = resolve_venue(sb, {"name": VENUE_NAME, "address": VENUE_ADDR})
+
+All venues a run needs go out in one bulk upsert (on the venues unique key,
+`name` unless told otherwise) before the event writes, and name→id is
+memoized for the process in runtime.shared_cache("venues").
+
+Ids are also kept locally (sqlite under SCRAPE_CACHE_DIR) with a hash of the
+payload they were written with: a venue whose payload hasn't changed within
+REFRESH_AFTER_DAYS isn't sent at all, so single-venue scrapers usually make no
+venue round trip. SCRAPE_FORCE_WRITE=1 bypasses the local cache.
+
+A venue that couldn't be written maps to None in resolve_venues, and
+resolve_venue raises VenueError for it: never send that None as an event's
+venue_id, which would wipe the venue an existing event already has.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from supabase import Client
+
+from scrapekit import runtime
+from scrapekit.paths import CACHE_DIR
+from scrapekit.writer import bulk_upsert
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+DB_NAME = "venues.sqlite3"
+REFRESH_AFTER_DAYS = 7
+
+Venue = Union[str, Mapping[str, Any]]
+
+class VenueError(RuntimeError):
+    """A venue the caller needs could not be resolved to an id."""
+
+def _payload_hash(payload: Mapping[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+# ── Store ──────────────────────────────────────────────────────────────────────
+class VenueStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(CACHE_DIR, DB_NAME)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS venues (
+                   conflict    TEXT,
+                   key         TEXT,
+                   venue_id    TEXT,
+                   payload     TEXT,
+                   written_at  REAL,
+                   PRIMARY KEY (conflict, key)
+               )"""
+        )
+        self.force = os.getenv("SCRAPE_FORCE_WRITE", "0") == "1"
+
+    def get(self, conflict: str, key: str, payload: Mapping[str, Any]) -> Optional[Any]:
+        if self.force:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT venue_id, payload, written_at FROM venues WHERE conflict = ? AND key = ?", (conflict, key)
+            ).fetchone()
+        if not row:
+            return None
+        venue_id, digest, written_at = row
+        if digest != _payload_hash(payload) or time.time() - written_at > REFRESH_AFTER_DAYS * 86400:
+            return None
+        return json.loads(venue_id)
+
+    def put(self, conflict: str, rows: Iterable[Tuple[str, Any, Mapping[str, Any]]]) -> None:
+        now = time.time()
+        data = [(conflict, key, json.dumps(vid), _payload_hash(p), now) for key, vid, p in rows]
+        if not data:
+            return
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO venues (conflict, key, venue_id, payload, written_at) VALUES (?, ?, ?, ?, ?)",
+                data,
+            )
+
+_store: Optional[VenueStore] = None
+_store_lock = threading.Lock()
+
+def get_store() -> VenueStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = VenueStore()
+        return _store
+
+# ── Resolution ─────────────────────────────────────────────────────────────────
+def resolve_venues(client: Client, venues: Iterable[Venue], on_conflict: str = "name") -> Dict[str, Any]:
+    """
+    {key: venue id} for every venue (a name, or a payload dict containing the
+    on_conflict column). Ids that couldn't be resolved map to None.
+    """
+    payloads: Dict[str, Mapping[str, Any]] = {}
+    for v in venues:
+        p = {"name": v} if isinstance(v, str) else v
+        key = p.get(on_conflict)
+        if key:
+            payloads[str(key)] = p
+
+    memo = runtime.shared_cache("venues")
+    store = get_store()
+    out: Dict[str, Any] = {}
+    pending = []
+    for key, p in payloads.items():
+        h = (on_conflict, key, _payload_hash(p))
+        if h in memo:
+            out[key] = memo[h]
+            continue
+        vid = store.get(on_conflict, key, p)
+        if vid is not None:
+            out[key] = memo[h] = vid
+        else:
+            pending.append(dict(p))
+
+    if pending:
+        saved = bulk_upsert(client, "venues", pending, on_conflict=on_conflict)
+        written = []
+        for p, row in zip(pending, saved):
+            key = str(p[on_conflict])
+            vid = row.get("id") if row else None
+            out[key] = vid
+            if vid is not None:
+                memo[(on_conflict, key, _payload_hash(payloads[key]))] = vid
+                written.append((key, vid, payloads[key]))
+        store.put(on_conflict, written)
+    return out
+
+def resolve_venue(client: Client, venue: Venue, on_conflict: str = "name") -> Any:
+    """The venue's id; raises VenueError if it can't be resolved."""
+    p = {"name": venue} if isinstance(venue, str) else venue
+    key = p.get(on_conflict)
+    if not key:
+        raise VenueError(f"Venue has no {on_conflict}: {p!r}")
+    vid = resolve_venues(client, [p], on_conflict).get(str(key))
+    if vid is None:
+        raise VenueError(f"Could not resolve venue {key!r}")
+    return vid
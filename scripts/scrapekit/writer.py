@@ -0,0 +1,95 @@
+"""
+Bulk, chunked upserts for all_events (and any table with a unique key).
+
+    saved = bulk_upsert(sb, "all_events", records, on_conflict="link")
+    for rec, row in zip(records, saved):
+        if row: ...row["id"]...
+
+Rows are sent CHUNK_SIZE at a time with returning=representation, and the
+returned rows are mapped back to the input by the conflict key, so the result
+lines up with `rows` (None where a row could not be written). A failing chunk
+is bisected and retried until the bad row(s) are isolated, so one malformed
+record costs log(n) extra round trips instead of the whole batch.
+
+Rows are grouped by their set of columns before chunking: PostgREST fills
+columns missing from a bulk row with NULL, which would wipe e.g. a start_time
+that a per-row upsert would have left alone. bulk_insert does the same with a
+plain INSERT, for tables whose natural key isn't a unique constraint.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from supabase import Client
+
+CHUNK_SIZE = 200
+
+Row = Dict[str, Any]
+
+def _key(row: Row, cols: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple("" if row.get(c) is None else str(row.get(c)) for c in cols)
+
+def _send(client: Client, table: str, chunk: List[Row], on_conflict: Optional[str],
+          cols: Tuple[str, ...]) -> Dict[Tuple[str, ...], Row]:
+    if on_conflict:
+        q = client.table(table).upsert(chunk, on_conflict=on_conflict, returning="representation")
+    else:
+        q = client.table(table).insert(chunk, returning="representation")
+    data = q.execute().data or []
+    out = {_key(r, cols): r for r in data}
+    # Fall back to position if the DB normalized a key value we can't match
+    if len(out) < len(chunk) and len(data) == len(chunk):
+        for src, got in zip(chunk, data):
+            out.setdefault(_key(src, cols), got)
+    return out
+
+def _send_bisecting(client: Client, table: str, chunk: List[Row], on_conflict: Optional[str],
+                    cols: Tuple[str, ...]) -> Dict[Tuple[str, ...], Row]:
+    try:
+        return _send(client, table, chunk, on_conflict, cols)
+    except Exception as e:
+        if len(chunk) == 1:
+            label = chunk[0].get("name") or chunk[0].get("title") or _key(chunk[0], cols)
+            print(f"❌ {'Upsert' if on_conflict else 'Insert'} failed for {label}: {e}")
+            return {}
+        mid = len(chunk) // 2
+        print(f"⚠️  Chunk of {len(chunk)} failed ({e}); retrying as {mid} + {len(chunk) - mid}")
+        out = _send_bisecting(client, table, chunk[:mid], on_conflict, cols)
+        out.update(_send_bisecting(client, table, chunk[mid:], on_conflict, cols))
+        return out
+
+def _write(client: Client, table: str, rows: Sequence[Row], on_conflict: Optional[str],
+           key: str, chunk_size: int) -> Tuple[List[Optional[Row]], int]:
+    cols = tuple(c.strip() for c in key.split(","))
+
+    # One row per key (Postgres rejects a chunk that hits a key twice);
+    # the last occurrence wins, as it would have with per-row writes.
+    unique: Dict[Tuple[str, ...], Row] = {}
+    for r in rows:
+        unique[_key(r, cols)] = r
+
+    shapes: Dict[Tuple[str, ...], List[Row]] = {}
+    for r in unique.values():
+        shapes.setdefault(tuple(sorted(r)), []).append(r)
+
+    saved: Dict[Tuple[str, ...], Row] = {}
+    requests = 0
+    for group in shapes.values():
+        for i in range(0, len(group), chunk_size):
+            saved.update(_send_bisecting(client, table, group[i:i + chunk_size], on_conflict, cols))
+            requests += 1
+    return [saved.get(_key(r, cols)) for r in rows], requests
+
+def bulk_upsert(client: Client, table: str, rows: Sequence[Row], on_conflict: str = "link",
+                chunk_size: int = CHUNK_SIZE) -> List[Optional[Row]]:
+    result, requests = _write(client, table, rows, on_conflict, on_conflict, chunk_size)
+    ok = sum(1 for r in result if r)
+    print(f"📦 Upserted {ok}/{len(rows)} rows into {table} in {requests} request(s)")
+    return result
+
+def bulk_insert(client: Client, table: str, rows: Sequence[Row], key: str = "slug",
+                chunk_size: int = CHUNK_SIZE) -> List[Optional[Row]]:
+    """Like bulk_upsert for tables without a usable unique key; `key` only maps results back."""
+    result, requests = _write(client, table, rows, None, key, chunk_size)
+    ok = sum(1 for r in result if r)
+    print(f"📦 Inserted {ok}/{len(rows)} rows into {table} in {requests} request(s)")
+    return result
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# scrapekit lives next to the scraper scripts, which import it as a top-level package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
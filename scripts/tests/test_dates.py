@@ -0,0 +1,181 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from scrapekit.dates import (
+    Span,
+    infer_year,
+    local_parts,
+    month_number,
+    parse_column,
+    parse_date,
+    parse_instant,
+    parse_span,
+    parse_time,
+    parse_time_range,
+)
+
+def inferred(month: int, day: int) -> str:
+    return date(infer_year(month, day), month, day).isoformat()
+
+# ── Formats named in the request ───────────────────────────────────────────────
+@pytest.mark.parametrize("text, expected", [
+    ("Fri Oct 3, 2025 at 10:00pm", Span("2025-10-03", "2025-10-03", "22:00:00", None)),
+    ("Oct 10 2025 | 7:30 - 11:30pm", Span("2025-10-10", "2025-10-10", "19:30:00", "23:30:00")),
+    ("Oct 10 2025 7:30 - 11:30pm", Span("2025-10-10", "2025-10-10", "19:30:00", "23:30:00")),
+    ("7:30 - 11:30pm", Span(None, None, "19:30:00", "23:30:00")),
+])
+def test_request_formats(text, expected):
+    assert parse_span(text) == expected
+
+def test_time_range_borrows_ampm():
+    assert parse_time_range("7:30 - 11:30pm") == ("19:30:00", "23:30:00")
+    assert parse_time_range("10am–2pm") == ("10:00:00", "14:00:00")
+    assert parse_time_range("8pm") == ("20:00:00", None)
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025-11-01T21:15:00-04:00", ("2025-11-01", "21:15:00")),
+    ("2025-11-01T01:15:00Z", ("2025-10-31", "21:15:00")),
+    ("2025-11-01T01:15:00+0000", ("2025-10-31", "21:15:00")),
+    (1759536000000, ("2025-10-03", "20:00:00")),
+    ("1759536000000", ("2025-10-03", "20:00:00")),
+    (None, (None, None)),
+    ("not a date", (None, None)),
+])
+def test_local_parts(value, expected):
+    assert local_parts(value) == expected
+
+def test_parse_instant_keeps_aware_datetimes():
+    dt = datetime(2025, 11, 1, 1, 15, tzinfo=timezone.utc)
+    assert parse_instant(dt) is dt
+
+def test_parse_column_one_result_per_value():
+    texts = ["Oct 10 2025 | 7:30 - 11:30pm", "Oct  10 2025 | 7:30 - 11:30pm", None, "Oct 11 2025"]
+    got = parse_column(texts)
+    assert len(got) == 4
+    assert got[0] == got[1] == Span("2025-10-10", "2025-10-10", "19:30:00", "23:30:00")
+    assert got[2] == Span(None, None, None, None)
+    assert got[3].start_date == "2025-10-11"
+    assert parse_column(["7pm", "7pm"], parse_time) == ["19:00:00", "19:00:00"]
+
+# ── Pieces ─────────────────────────────────────────────────────────────────────
+def test_month_number():
+    assert month_number("SEPT") == 9
+    assert month_number("Sep.") == 9
+    assert month_number("october") == 10
+    assert month_number("Marathons") is None
+    assert month_number("Fr") is None
+
+def test_infer_year_rollover():
+    today = date(2025, 12, 20)
+    assert infer_year(1, 5, today=today) == 2026
+    assert infer_year(12, 1, today=today) == 2025
+    assert infer_year(12, 1, today=today, rollover_days=3) == 2026
+    assert infer_year(10, 5, year=25, today=today) == 2025
+
+@pytest.mark.parametrize("text, ampm, expected", [
+    ("7pm", None, "19:00:00"),
+    ("7:30 P.M.", None, "19:30:00"),
+    ("12:00 AM", None, "00:00:00"),
+    ("12pm", None, "12:00:00"),
+    ("noon", None, "12:00:00"),
+    ("19:30", None, "19:30:00"),
+    ("7:30", "p", "19:30:00"),
+    ("7:30", None, "07:30:00"),
+    ("", None, None),
+])
+def test_parse_time(text, ampm, expected):
+    assert parse_time(text, ampm) == expected
+
+@pytest.mark.parametrize("text, year, expected", [
+    ("Fri Oct 3, 2025", None, "2025-10-03"),
+    ("October 10 2025", None, "2025-10-10"),
+    ("5 Oct 2025", None, "2025-10-05"),
+    ("10/3/2025", None, "2025-10-03"),
+    ("2025-10-03", None, "2025-10-03"),
+    ("Thursday, May 1", 2025, "2025-05-01"),
+    ("Feb 30, 2025", None, None),
+    ("TBA", None, None),
+])
+def test_parse_date(text, year, expected):
+    assert parse_date(text, year) == expected
+
+def test_parse_date_infers_year():
+    assert parse_date("Oct 5th") == inferred(10, 5)
+
+# ── Replaced per-script helpers ────────────────────────────────────────────────
+@pytest.mark.parametrize("text, expected", [
+    # craftcoven parse_dt_from_text
+    ("Sun Oct 5th 12:00 AM - 4:00 PM", (inferred(10, 5), inferred(10, 5), "00:00:00", "16:00:00")),
+    ("Next Event Wed Oct 8th 6:30 PM - 8:30 PM", (inferred(10, 8), inferred(10, 8), "18:30:00", "20:30:00")),
+    ("Fri Oct 3, 2025 7 PM - 10 PM", ("2025-10-03", "2025-10-03", "19:00:00", "22:00:00")),
+    ("Fri Oct 3, 2025 10 PM - 2 AM", ("2025-10-03", "2025-10-04", "22:00:00", "02:00:00")),
+    # scrape_latinvibes parse_datetime_block
+    ("Fri. Oct 3, 2025 at 10:00pm - Sat. Oct 4, 2025 at 2:00am EDT",
+     ("2025-10-03", "2025-10-04", "22:00:00", "02:00:00")),
+    # upsert_fi_events _split_date_and_times
+    ("Oct 10 2025 | 7:30 - 11:30pm", ("2025-10-10", "2025-10-10", "19:30:00", "23:30:00")),
+    ("Oct 10 2025 | 7:30pm - 11:30pm", ("2025-10-10", "2025-10-10", "19:30:00", "23:30:00")),
+    ("Oct 10 2025 | 10am - 2pm", ("2025-10-10", "2025-10-10", "10:00:00", "14:00:00")),
+    ("Oct 10 2025", ("2025-10-10", "2025-10-10", None, None)),
+    ("August 4, 2025 through August 8, 2025", ("2025-08-04", "2025-08-08", None, None)),
+])
+def test_parse_span_replaces_script_helpers(text, expected):
+    assert tuple(parse_span(text)) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    # upsert_fi_events keeps the end date on the start date (rollover=False)
+    ("Oct 10 2025 | 9pm - 1am", ("2025-10-10", "2025-10-10", "21:00:00", "01:00:00")),
+    ("Oct 10 2025 | 7:30 - 11:30", ("2025-10-10", "2025-10-10", "07:30:00", "11:30:00")),
+    ("Sep 5 2025 | 11 - 1pm", ("2025-09-05", "2025-09-05", "23:00:00", "13:00:00")),
+    ("Oct 10 2025 | 7:30 - 11:30pm", ("2025-10-10", "2025-10-10", "19:30:00", "23:30:00")),
+])
+def test_parse_span_without_rollover(text, expected):
+    assert tuple(parse_span(text, rollover=False)) == expected
+
+def test_parse_span_rolls_over_by_default():
+    assert parse_span("Oct 10 2025 | 9pm - 1am") == Span("2025-10-10", "2025-10-11", "21:00:00", "01:00:00")
+
+def test_time_range_without_ampm_keeps_end():
+    assert parse_time_range("7:30 - 11:30") == ("07:30:00", "11:30:00")
+
+def test_inferred_years_follow_today(monkeypatch):
+    import scrapekit.dates as dates
+
+    class Frozen(date):
+        current = date(2025, 12, 31)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(dates, "date", Frozen)
+    assert parse_date("Dec 1") == "2025-12-01"
+    assert parse_span("Dec 1 | 7pm").start_date == "2025-12-01"
+    Frozen.current = date(2026, 3, 1)    # a long-running process, months later
+    assert parse_date("Dec 1") == "2026-12-01"
+    assert parse_span("Dec 1 | 7pm").start_date == "2026-12-01"
+
+def test_vinyl_date_time_block():
+    span = parse_span("Fri Oct 17 at 6:00PM")
+    assert (span.start_date, span.start_time) == (inferred(10, 17), "18:00:00")
+
+def test_south_street_card_date_and_times():
+    assert parse_date("10 Oct") == inferred(10, 10)
+    assert parse_time("6:30 PM") == "18:30:00"
+    assert parse_time("6 PM") == "18:00:00"
+
+def test_black_squirrel_time_range():
+    assert parse_time_range("8pm - 11pm") == ("20:00:00", "23:00:00")
+    assert parse_time_range("8:00 PM – 12:00 AM") == ("20:00:00", "00:00:00")
+
+def test_fpc_and_ansp_dates_and_times():
+    assert parse_date("Monday, June 30", 2025) == "2025-06-30"
+    assert parse_date("Friday, April 25", 2025) == "2025-04-25"
+    assert parse_date("October 5, 2025") == "2025-10-05"
+    assert parse_time_range("7:00 pm - 11:00 pm") == ("19:00:00", "23:00:00")
+    assert parse_time_range("10:00 AM - 4:00 PM") == ("10:00:00", "16:00:00")
+
+def test_helium_naive_utc_and_stateside_z():
+    assert local_parts("2025-11-01T01:15:00", assume=timezone.utc) == ("2025-10-31", "21:15:00")
+    assert local_parts("2025-10-04T00:00:00Z") == ("2025-10-03", "20:00:00")
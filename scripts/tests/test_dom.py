@@ -0,0 +1,39 @@
+import pytest
+
+from scrapekit.dom import BS4_BACKENDS, DEFAULT_BACKEND, cut_region, html_text, strip_tags
+
+PAGE = """<html><body>
+<!-- <div class="rhp-event-info">commented out</div> -->
+<script>var tpl = '<div class="rhp-event-info">template</div>';</script>
+<style>.rhp-event-info:after { content: "<div>" }</style>
+<img class="rhp-event-thumb" src="a.png" alt="">
+<div class="rhp-event-info"><div>Doors 7pm</div><script>if (a < b) document.write("</div>")</script>Show 8pm</div>
+<p>after</p>
+</body></html>"""
+
+def test_cut_region_skips_comments_and_script_style_bodies():
+    region = cut_region(PAGE, "div.rhp-event-info")
+    assert region.startswith('<div class="rhp-event-info"><div>Doors 7pm</div>')
+    assert region.endswith("Show 8pm</div>")
+
+def test_cut_region_void_elements_close_themselves():
+    assert cut_region(PAGE, ".rhp-event-thumb") == '<img class="rhp-event-thumb" src="a.png" alt="">'
+    assert cut_region("<br/><p id=x>hi</p>", "p#x") == "<p id=x>hi</p>"
+
+def test_cut_region_can_still_cut_a_script():
+    assert cut_region(PAGE, "script") == \
+        "<script>var tpl = '<div class=\"rhp-event-info\">template</div>';</script>"
+
+@pytest.mark.parametrize("selectors, expected", [
+    (("section.missing", "p"), "<p>after</p>"),
+    (("section.missing",), None),
+])
+def test_cut_region_tries_selectors_in_order(selectors, expected):
+    assert cut_region(PAGE, *selectors) == expected
+
+def test_strip_tags_drops_hidden_text():
+    assert strip_tags(PAGE) == "Doors 7pm Show 8pm after"
+
+def test_default_backend_is_a_bs4_builder():
+    assert DEFAULT_BACKEND in BS4_BACKENDS
+    assert html_text("<p>Doors <script>x()</script>7pm</p>") == "Doors 7pm"
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from scrapekit.embedded import State, assigned_state, astro_islands, next_data, script_json
+
+DOC = {
+    "props": {
+        "pageProps": {
+            "skip": {"a": [1, {"b": "]}\""}], "c": "}"},
+            "route": {"name": "Show", "fields": {"Date": {"value": "2025-10-04T00:00:00Z"}}},
+        },
+    },
+    "list": [{"x": 1}, "two", 3.5, None, True],
+}
+
+@pytest.fixture(params=["compact", "spaced", "indented"])
+def doc_text(request):
+    if request.param == "compact":
+        return json.dumps(DOC, separators=(",", ":"))
+    if request.param == "spaced":
+        return json.dumps(DOC)
+    return "\n  " + json.dumps(DOC, indent=4) + "\n"
+
+def test_get_walks_any_formatting(doc_text):
+    state = State(doc_text)
+    assert state.get("props", "pageProps", "route", "name") == "Show"
+    assert state.get("props", "pageProps", "route", "fields", "Date", "value") == "2025-10-04T00:00:00Z"
+    assert state.get("list", 0, "x") == 1
+    assert state.get("list", 2) == 3.5
+    assert state.get("list", 3, default="d") is None
+    assert state.get("list", 4) is True
+    assert state.get() == DOC
+
+def test_skips_siblings_holding_closing_characters(doc_text):
+    state = State(doc_text)
+    assert state.get("props", "pageProps", "skip", "a", 1, "b") == ']}"'
+    assert state.get("props", "pageProps", "skip", "c") == "}"
+    assert state.get("props", "pageProps", "route", "name") == "Show"
+
+def test_escaped_keys():
+    text = '{"a\\"b": 1, "caf\\u00e9": 2, "tab\\t": {"x": 3}, "plain": 4}'
+    state = State(text)
+    assert state.get('a"b') == 1
+    assert state.get("café") == 2
+    assert state.get("tab\t", "x") == 3
+    assert state.get("plain") == 4
+
+def test_missing_paths_return_default(doc_text):
+    state = State(doc_text)
+    assert state.get("nope") is None
+    assert state.get("props", "nope", "deeper", default={}) == {}
+    assert state.get("list", 9, default="d") == "d"
+    assert state.get("list", "x", default="d") == "d"       # key into an array
+    assert state.get("props", 0, default="d") == "d"        # index into an object
+    assert state.get("props", "pageProps", "route", "name", "x", default="d") == "d"
+    assert State("{broken").get("a", default="d") == "d"
+
+def test_loaded_state_answers_from_memory():
+    state = State(json.dumps(DOC))
+    assert state.load() == DOC
+    assert state.get("list", 1) == "two"
+    assert state.get("list", 9, default="d") == "d"
+
+def test_next_data_script():
+    html = ('<html><script id="other">{}</script>'
+            '<script id="__NEXT_DATA__" type="application/json">\n'
+            + json.dumps(DOC) + "\n</script></html>")
+    state = next_data(html)
+    assert state.get("props", "pageProps", "route", "name") == "Show"
+    assert next_data("<div id=\"__NEXT_DATA__\"></div>") is None
+    assert script_json(html.encode(), "__NEXT_DATA__").get("list", 1) == "two"
+
+def test_assigned_state_skips_comparisons():
+    html = ("<script>if (window.__APOLLO_STATE__ == null) {}\n"
+            "window.__APOLLO_STATE__ = {\"Event:1\": {\"name\": \"a}b\"}};\n</script>")
+    state = assigned_state(html, "__APOLLO_STATE__")
+    assert state.get("Event:1", "name") == "a}b"
+    assert assigned_state("window.__X__ = init();", "__X__") is None
+    assert assigned_state("window.__X__=[1,2]", "__X__").get(1) == 2
+
+def test_astro_island_props_are_unescaped():
+    props = {"events": [0, [[0, {"name": [0, "Tom & Jerry's \"Live\""], "start": [0, "2025-10-10"]}]]]}
+    escaped = json.dumps(props).replace("&", "&amp;").replace('"', "&quot;").replace("'", "&#39;")
+    html = ('<astro-island uid="1" props="{&quot;nav&quot;:[0,1]}"></astro-island>'
+            f'<astro-island uid="2" component-url="/x.js" props="{escaped}"></astro-island>')
+    islands = list(astro_islands(html, has_key="events"))
+    assert len(islands) == 1
+    event = islands[0].get("events", 1, 0, 1)
+    assert event["name"] == [0, "Tom & Jerry's \"Live\""]
+    assert islands[0].get("events", 1, 0, 1, "start", 1) == "2025-10-10"
+    assert len(list(astro_islands(html))) == 2
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from scrapekit import feedplan
+from scrapekit.feedplan import FeedPlan, Field, iter_strings, resolve
+
+@pytest.fixture(autouse=True)
+def plans_path(tmp_path, monkeypatch):
+    path = tmp_path / "feedplans.json"
+    monkeypatch.setattr(feedplan, "PLANS_PATH", str(path))
+    monkeypatch.setattr(feedplan, "_plans", None)
+    return path
+
+def link(v):
+    return v if isinstance(v, str) and v.startswith("https://") else None
+
+def looks_like_link(s):
+    return s.startswith("https://")
+
+FIELDS = {"link": Field([("ticketing", "eventUrl"), "url"], accept=link, scan=looks_like_link)}
+
+def test_resolve_and_iter_strings():
+    rec = {"a": [{"b": "x"}, "y"], "n": 1}
+    assert resolve(rec, ("a", 0, "b")) == "x"
+    assert resolve(rec, ("a", 5)) is None
+    assert resolve(rec, ("n", "b")) is None
+    assert list(iter_strings(rec)) == [(("a", 0, "b"), "x"), (("a", 1), "y")]
+
+def test_candidates_in_declared_order():
+    plan = FeedPlan("feed", FIELDS)
+    assert plan.get({"url": "https://b"}, "link") == "https://b"
+    assert plan.get({"url": "https://b", "ticketing": {"eventUrl": "https://a"}}, "link") == "https://a"
+
+def test_scan_path_never_beats_a_candidate(plans_path):
+    plan = FeedPlan("feed", FIELDS)
+    first = {"venue": {"website": "https://venue"}}
+    assert plan.get(first, "link") == "https://venue"
+    assert plan.learned["link"] == [("venue", "website")]
+
+    later = [
+        {"venue": {"website": "https://venue"}, "ticketing": {"eventUrl": "https://e/2"}},
+        {"venue": {"website": "https://venue"}, "ticketing": {"eventUrl": "https://e/3"}},
+    ]
+    assert [plan.get(r, "link") for r in later] == ["https://e/2", "https://e/3"]
+
+    # the next run starts from the stored plan and still prefers the candidates
+    assert json.loads(plans_path.read_text()) == {"feed": {"link": [["venue", "website"]]}}
+    feedplan._plans = None
+    rerun = FeedPlan("feed", FIELDS)
+    assert [rerun.get(r, "link") for r in later] == ["https://e/2", "https://e/3"]
+    assert rerun.get(first, "link") == "https://venue"
+
+def test_learned_scan_path_used_before_rescanning(monkeypatch):
+    plan = FeedPlan("feed", FIELDS)
+    assert plan.get({"x": {"y": "https://1"}}, "link") == "https://1"
+    monkeypatch.setattr(feedplan, "iter_strings", lambda rec: pytest.fail("rescanned"))
+    assert plan.get({"x": {"y": "https://2"}, "z": "https://other"}, "link") == "https://2"
+
+def test_stored_candidate_paths_are_ignored(plans_path):
+    plans_path.write_text(json.dumps({"feed": {"link": [["url"], ["x"]]}}))
+    plan = FeedPlan("feed", FIELDS)
+    assert plan.learned["link"] == [("x",)]
+    rec = {"url": "https://u", "ticketing": {"eventUrl": "https://t"}, "x": "https://x"}
+    assert plan.get(rec, "link") == "https://t"
+
+def test_no_match_returns_none():
+    plan = FeedPlan("feed", {"title": Field(["title"])})
+    assert plan.extract({"title": "  "}) == {"title": None}
+    assert plan.extract({"title": " Show "}) == {"title": "Show"}
+
+def test_learned_path_value_must_still_pass_scan():
+    # permissive accept, like union-transfer's link_url: any string becomes a URL
+    fields = {"link": Field(["url"], accept=lambda v: f"https://site/{v}" if isinstance(v, str) else None,
+                            scan=looks_like_link)}
+    plan = FeedPlan("feed", fields)
+    assert plan.get({"promo": {"cta": "https://tix/e/1"}}, "link") == "https://site/https://tix/e/1"
+    assert plan.learned["link"] == [("promo", "cta")]
+    assert plan.get({"promo": {"cta": "Buy now"}, "slug": "abc"}, "link") is None
+    # falls through to a fresh scan instead of taking the plain text
+    rec = {"promo": {"cta": "Buy now"}, "tickets": "https://tix/e/2"}
+    assert plan.get(rec, "link") == "https://site/https://tix/e/2"
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+from scrapekit.jsonld import first_image, is_event, iter_blocks, iter_events, iter_nodes, split_iso
+
+def ld(payload: str) -> str:
+    return f'<script type="application/ld+json">{payload}</script>'
+
+EVENT = {"@type": "MusicEvent", "name": "Show", "startDate": "2025-10-10T20:00:00-04:00"}
+
+# ── Lenient parsing ────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("payload", [
+    json.dumps(EVENT),
+    "<!--\n" + json.dumps(EVENT) + "\n-->",
+    "<![CDATA[" + json.dumps(EVENT) + "]]>",
+    "\n  <![CDATA[\n" + json.dumps(EVENT) + "\n]]>\n",
+    json.dumps(EVENT).replace('"', "&quot;"),
+    '{"@type": "MusicEvent", "name": "Show", "startDate": "2025-10-10T20:00:00-04:00",}',
+    '[{"@type": "MusicEvent", "name": "Show", "startDate": "2025-10-10T20:00:00-04:00"},]',
+    '{"@type": "MusicEvent", "name": "Show", "startDate": "2025-10-10T20:00:00-04:00", "description": "line\none"}',
+])
+def test_tolerated_malformations(payload):
+    events = list(iter_events(ld(payload)))
+    assert [(e["type"], e["title"], e["start_date"], e["start_time"]) for e in events] == [
+        ("MusicEvent", "Show", "2025-10-10", "20:00:00"),
+    ]
+
+def test_helium_at_keys():
+    payload = '{":@context": "https://schema.org", ":@type": "ComedyEvent", "name": "Set",}'
+    assert list(iter_blocks(ld(payload))) == [
+        {"@context": "https://schema.org", "@type": "ComedyEvent", "name": "Set"},
+    ]
+
+def test_unparseable_blocks_are_skipped():
+    html = ld("{not json") + ld("") + "<script type='application/ld+json'>[1, 2]</script>"
+    assert list(iter_blocks(html)) == [[1, 2]]
+    assert list(iter_blocks(html.encode())) == [[1, 2]]
+
+def test_script_tag_variants():
+    html = ('<script type="text/javascript">{"@type": "Event"}</script>'
+            '<SCRIPT data-x="1" type=application/ld+json >{"@type": "Event", "name": "A"}</SCRIPT >')
+    assert [e["title"] for e in iter_events(html)] == ["A"]
+
+# ── Finding events ─────────────────────────────────────────────────────────────
+def test_graph_lists_and_nested_events():
+    graph = {"@context": "https://schema.org", "@graph": [
+        {"@type": "WebPage", "name": "Page"},
+        {"@type": ["Thing", "TheaterEvent"], "name": "Play", "subEvent": {"@type": "Event", "name": "inner"}},
+    ]}
+    item_list = {"@type": "ItemList", "itemListElement": [
+        {"@type": "ListItem", "item": {"@type": "Event", "name": "Listed"}},
+    ]}
+    html = ld(json.dumps(graph)) + ld(json.dumps([item_list, {"@type": "Organization"}]))
+    assert [e["title"] for e in iter_events(html)] == ["Play", "Listed"]
+
+def test_iter_nodes_flattens_lists_and_graph():
+    data = [{"@graph": [{"@type": "A"}, [{"@type": "B"}]]}, {"@type": "C", "@graph": [{"@type": "D"}]}]
+    assert [n["@type"] for n in iter_nodes(data)] == ["A", "B", "C"]
+
+def test_is_event():
+    assert is_event({"@type": "ComedyEvent"})
+    assert is_event({"@type": ["Thing", "event"]})
+    assert not is_event({"@type": "Place"})
+    assert not is_event("Event")
+
+# ── Normalization ──────────────────────────────────────────────────────────────
+def test_normalized_fields():
+    node = {
+        "@type": "Event",
+        "name": "Tom &amp; Jerry",
+        "url": {"@id": "https://x/e/1"},
+        "image": [{"url": ""}, {"contentUrl": "https://x/i.jpg"}],
+        "startDate": "2025-10-10",
+        "endDate": "2025-10-11T01:00:00Z",
+        "location": {"name": "Hall", "address": {"streetAddress": "1 Main St", "addressLocality": "Philadelphia",
+                                                 "addressRegion": "PA", "postalCode": "19107"}},
+    }
+    ev = next(iter_events(ld(json.dumps(node))))
+    assert ev["title"] == "Tom & Jerry"
+    assert ev["link"] == "https://x/e/1"
+    assert ev["image"] == "https://x/i.jpg"
+    assert (ev["start_date"], ev["start_time"]) == ("2025-10-10", None)
+    assert (ev["end_date"], ev["end_time"]) == ("2025-10-11", "01:00:00")
+    assert ev["venue"] == "Hall"
+    assert ev["address"] == "1 Main St, Philadelphia, PA, 19107"
+    assert ev["raw"]["name"] == "Tom &amp; Jerry"
+
+def test_split_iso_and_first_image():
+    assert split_iso("2025-10-10T20:00:00-04:00") == ("2025-10-10", "20:00:00")
+    assert split_iso("2025-10-10 nonsense") == ("2025-10-10", None)
+    assert split_iso(None) == (None, None)
+    assert first_image(["", "https://x/a.png"]) == "https://x/a.png"
+    assert first_image({"@id": "https://x/b.png"}) == "https://x/b.png"
+
+# ── Shapes the replaced per-script parsers handled ─────────────────────────────
+def test_helium_place_with_events():
+    place = ('{":@context": "http://schema.org", ":@type": "Place", "name": "Helium Comedy Club",'
+             ' "Events": [{":@type": "ComedyEvent", "name": "Headliner", "url": "/events/1",'
+             ' "startDate": "2025-11-01T01:15:00"},]}')
+    blocks = [node for data in iter_blocks(ld(place) + ld('[{"@type": "Organization"}]'))
+              for node in iter_nodes(data)]
+    assert [b["@type"] for b in blocks] == ["Place", "Organization"]
+    assert blocks[0]["Events"][0]["name"] == "Headliner"
+    # the Place itself isn't an event; its Events are
+    assert [e["title"] for e in iter_events(ld(place))] == ["Headliner"]
+
+def test_philly700_quot_escaped_event_list():
+    items = [
+        {"@type": "SocialEvent", "name": "Trivia", "startDate": "2025-10-03T19:00:00-04:00"},
+        {"@type": ["Event"], "name": "Karaoke", "startDate": "2025-10-04T21:00:00-04:00"},
+        {"@type": "Organization", "name": "Philly 700"},
+    ]
+    html = ld(json.dumps(items).replace('"', "&quot;"))
+    assert [e["raw"]["name"] for e in iter_events(html)] == ["Trivia", "Karaoke"]
+
+def test_south_street_plain_events_only():
+    html = (ld(json.dumps({"@type": "Event", "name": "Block Party", "startDate": "2025-09-20"}))
+            + ld(json.dumps([{"@type": "Event", "name": "Sidewalk Sale"}, {"@type": "MusicEvent", "name": "Gig"},
+                             {"@type": "Organization", "name": "South Street"}])))
+    assert [e["raw"]["name"] for e in iter_events(html) if e["type"] == "Event"] == ["Block Party", "Sidewalk Sale"]
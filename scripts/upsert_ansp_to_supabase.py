@@ -2,11 +2,13 @@
 import os
 import requests
 import urllib.parse
-from bs4 import BeautifulSoup
-from dateutil import parser
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from scrapekit.dates import iso_datetime, parse_date, parse_time_range
+from scrapekit.dom import parse_html
+from scrapekit.stream import prefetch, upsert_batches
+
 # -----------------------------------------------------------------------------
 # CONFIG
 # -----------------------------------------------------------------------------
@@ -19,6 +21,7 @@ SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 BASE_URL = "https://ansp.org/programs-and-events/events/"
+BATCH_SIZE = 25         # about one listing page, so rows land while the crawl runs
 
 # -----------------------------------------------------------------------------
 # SCRAPER
@@ -26,7 +29,7 @@ BASE_URL = "https://ansp.org/programs-and-events/events/"
 def scrape_page(url):
     resp = requests.get(url)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = parse_html(resp.text)
     events = []
 
     for li in soup.select("ul.events-list > li"):
@@ -41,27 +44,24 @@ def scrape_page(url):
 
         raw_date = info.select_one(".event-date").get_text(strip=True)
         raw_time = info.select_one(".event-time").get_text(strip=True)
-        # split times
-        try:
-            start_t, end_t = [t.strip() for t in raw_time.split("-", 1)]
-        except ValueError:
-            start_t = raw_time.strip()
-            end_t = start_t
-
-        # parse start/end into datetime
+        start_t, end_t = parse_time_range(raw_time)
+        end_t = end_t or start_t
+
+        # parse start/end
         if "through" in raw_date:
             # multi-day event
             start_str, end_str = [d.strip() for d in raw_date.split("through", 1)]
-            dt_start = parser.parse(f"{start_str} {start_t}")
-            dt_end   = parser.parse(f"{end_str} {end_t}")
         else:
             # single-day event
-            dt_start = parser.parse(f"{raw_date} {start_t}")
-            dt_end   = parser.parse(f"{raw_date} {end_t}")
+            start_str = end_str = raw_date
+        start_d = parse_date(start_str)
+        if not start_d:
+            print(f"⚠️  Unparseable date {raw_date!r} for {name}")
+            continue
 
         # ISO 8601 strings
-        date_iso     = dt_start.isoformat()
-        end_date_iso = dt_end.isoformat()
+        date_iso     = iso_datetime(start_d, start_t)
+        end_date_iso = iso_datetime(parse_date(end_str) or start_d, end_t)
 
         venue = info.select_one(".event-location").get_text(" ", strip=True)
         neighborhood = "Center City"
@@ -99,29 +99,27 @@ def get_next_page_url(soup):
 # -----------------------------------------------------------------------------
 # MAIN
 # -----------------------------------------------------------------------------
-def main():
-    url = BASE_URL
-    all_events = []
-
+def scrape_pages(url):
+    """Each page's events, following the pager; one page is fetched at a time."""
     while url:
         print(f"Scraping: {url}")
         evts, soup = scrape_page(url)
-        all_events.extend(evts)
         url = get_next_page_url(soup)
+        yield evts
 
-    print(f"Found {len(all_events)} events. Upserting to Supabase...")
-    for evt in all_events:
-        res = (
-            supabase
-            .table("neighbor_events")
-            .upsert(evt, on_conflict=["event_uid"])
-            .execute()
-        )
-        if getattr(res, "error", None):
-            err = res.error
-            print("  ⚠️", getattr(err, "message", err))
-        else:
-            print(f"  ↳ upserted: {evt['name']}")
+def main():
+    # the next page is fetched while the current one is being written
+    events = (evt for evts in prefetch(scrape_pages(BASE_URL)) for evt in evts)
+    total = 0
+    for batch, saved in upsert_batches(supabase, "neighbor_events", events, on_conflict="event_uid",
+                                       size=BATCH_SIZE):
+        for evt, row in zip(batch, saved):
+            if row:
+                print(f"  ↳ upserted: {evt['name']}")
+            else:
+                print(f"  ⚠️ failed: {evt['name']}")
+        total += len(batch)
+    print(f"Found {total} events.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,10 +2,14 @@
 import os
 import re
 import requests
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 from dotenv import load_dotenv
-from datetime import datetime
+
+from scrapekit.dates import parse_span
+from scrapekit.dom import parse_html
+from scrapekit.fingerprint import is_changed, remember
+from scrapekit.venues import resolve_venues
+from scrapekit.writer import bulk_upsert
 
 # ── Load environment variables (mirrors your working pattern) ───────────
 load_dotenv()
@@ -37,90 +41,11 @@ def slugify(text: str) -> str:
     slug = re.sub(r'[^a-z0-9]+', '-', slug)
     return slug.strip('-')
 
-def _parse_date_str(s: str) -> str | None:
-    s = s.strip()
-    # Accept "Oct 10 2025", "Oct 10, 2025", "October 10 2025", "October 10, 2025"
-    fmts = ["%b %d %Y", "%b %d, %Y", "%B %d %Y", "%B %d, %Y"]
-    for f in fmts:
-        try:
-            return datetime.strptime(s, f).date().isoformat()
-        except Exception:
-            continue
-    return None
-
-_TIME_RE = re.compile(
-    r"^\s*(?P<h>\d{1,2})(:(?P<m>\d{2}))?\s*(?P<ampm>[ap]\s*\.?\s*m\.?)?\s*$",
-    re.IGNORECASE,
-)
-
-def _to_24h(h: int, m: int, ampm: str | None) -> str:
-    if ampm:
-        a = ampm.lower().replace(".", "").replace(" ", "")
-        if a in ("pm",) and h != 12:
-            h += 12
-        if a in ("am",) and h == 12:
-            h = 0
-    return f"{h:02d}:{m:02d}:00"
-
-def _parse_time_token(tok: str, fallback_ampm: str | None) -> tuple[str | None, str | None]:
-    """Return (hh:mm:ss, ampm_used) from a token like '7:30', '7:30pm', '10am'."""
-    tok = tok.strip()
-    m = _TIME_RE.match(tok)
-    if not m:
-        return None, fallback_ampm
-    h = int(m.group("h"))
-    mm = int(m.group("m") or 0)
-    ampm = m.group("ampm")
-    if not ampm:
-        ampm = fallback_ampm  # inherit from the other side if missing
-    return _to_24h(h, mm, ampm), ampm
-
-def _split_date_and_times(raw: str) -> tuple[str | None, str | None, str | None, str | None]:
-    """
-    Parses FI’s raw date/time text into (start_date, end_date, start_time, end_time).
-    Handles:
-      - 'Oct 10 2025 | 7:30 - 11:30pm'
-      - 'Oct 10 2025 | 7:30pm - 11:30pm'
-      - 'Oct 10 2025'
-      - 'August 4, 2025 through August 8, 2025'
-    """
-    txt = " ".join(raw.split())  # collapse whitespace
-    lower = txt.lower()
-    # Normalize unicode dashes to hyphen
-    txt = txt.replace("–", "-").replace("—", "-")
-    if "through" in lower:
-        left, right = re.split(r"\bthrough\b", txt, flags=re.IGNORECASE, maxsplit=1)
-        sd = _parse_date_str(left.strip().rstrip("|").strip())
-        ed = _parse_date_str(right.strip())
-        return sd, ed, None, None
-
-    # No range: maybe "date | times" or just "date"
-    if "|" in txt:
-        date_part, time_part = [p.strip() for p in txt.split("|", 1)]
-    else:
-        date_part, time_part = txt.strip(), ""
-
-    sd = _parse_date_str(date_part)
-    ed = sd  # single-day default
-
-    st = et = None
-    if time_part:
-        # e.g. "7:30 - 11:30pm" or "7:30pm-11:30pm" or "10am - 2pm" or "7:30pm"
-        time_part = time_part.replace("–", "-").replace("—", "-")
-        if "-" in time_part:
-            left_t, right_t = [p.strip() for p in time_part.split("-", 1)]
-            # parse right first to capture am/pm for inheritance
-            et, ampm = _parse_time_token(right_t, fallback_ampm=None)
-            st, _ = _parse_time_token(left_t, fallback_ampm=ampm)
-        else:
-            st, _ = _parse_time_token(time_part, fallback_ampm=None)
-    return sd, ed, st, et
-
 # ── Scrape & parse events (mirrors your working flow) ───────────────────
 def scrape_events():
     res = requests.get(LIST_URL, headers=HEADERS, timeout=30)
     res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = parse_html(res.text)
 
     events = []
     for row in soup.select(".view-events-calendar .views-row"):
@@ -136,7 +61,8 @@ def scrape_events():
         if not dt_tag:
             continue
         raw_dt = dt_tag.get_text(" ", strip=True)
-        start_date, end_date, start_time, end_time = _split_date_and_times(raw_dt)
+        # FI lists late shows as '9pm - 1am' on one date; keep end_date on it
+        start_date, end_date, start_time, end_time = parse_span(raw_dt, rollover=False)
         if not start_date:
             continue  # must have at least a start date
 
@@ -171,17 +97,9 @@ def scrape_events():
 
 # ── Upsert into all_events (mirrors your working pattern) ───────────────
 def upsert_data(events):
+    pending = []
+    skipped = 0
     for ev in events:
-        print(f"⏳ Processing: {ev['title']}")
-
-        # Upsert venue and get its ID
-        v = (
-            supabase.table("venues")
-            .upsert({"name": ev["venue_name"]}, on_conflict=["name"], returning="representation")
-            .execute()
-        )
-        venue_id = v.data[0]["id"] if v.data else None
-
         record = {
             "name":        ev["title"],
             "link":        ev["link"],
@@ -189,7 +107,6 @@ def upsert_data(events):
             "start_date":  ev["start_date"],
             "end_date":    ev["end_date"],
             "description": ev["description"],
-            "venue_id":    venue_id,
             "source":      SOURCE,
             "slug":        ev["slug"],
         }
@@ -198,8 +115,30 @@ def upsert_data(events):
         if ev["end_time"]:
             record["end_time"]   = ev["end_time"]
 
-        supabase.table("all_events").upsert(record, on_conflict=["link"]).execute()
-        print(f"✅ Upserted: {ev['title']}")
+        # Identical to what we last wrote → no round trips at all
+        if not is_changed("all_events", record):
+            skipped += 1
+            continue
+
+        pending.append((ev, record))
+
+    # All distinct venues in one batch, then the events
+    venue_ids = resolve_venues(supabase, {ev["venue_name"] for ev, _ in pending})
+    records = []
+    for ev, record in pending:
+        venue_id = venue_ids.get(ev["venue_name"])
+        if venue_id is None:
+            # retried next run; a NULL venue_id would wipe the row's venue
+            print(f"⚠️  Skipping {ev['title']}: venue {ev['venue_name']!r} not resolved")
+            continue
+        record["venue_id"] = venue_id
+        records.append(record)
+
+    saved = bulk_upsert(supabase, "all_events", records, on_conflict="link")
+    written = [rec for rec, row in zip(records, saved) if row]
+    remember("all_events", written)
+    if skipped:
+        print(f"♻️  Skipped {skipped} unchanged events")
 
 # ── Main ────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
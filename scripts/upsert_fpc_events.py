@@ -3,11 +3,13 @@ import os
 import re
 import requests
 import urllib.parse
-from bs4 import BeautifulSoup
-from dateutil import parser
+from datetime import date
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from scrapekit.dates import iso_datetime, parse_date, parse_time_range
+from scrapekit.dom import parse_html
+
 # -----------------------------------------------------------------------------
 # CONFIG
 # -----------------------------------------------------------------------------
@@ -34,28 +36,20 @@ def parse_date_time(date_raw: str, time_raw: str):
       "7:00 pm - 11:00 pm"
     into two ISO‑8601 datetime strings: (start_iso, end_iso).
     """
-    # split date range
+    # split date range; a date without a year is read as this year
+    year = date.today().year
     if " - " in date_raw or " through " in date_raw:
         parts = re.split(r"\s*-\s*|\sthrough\s", date_raw)
-        start_dt = parser.parse(parts[0])
-        end_dt   = parser.parse(parts[1])
+        start_d = parse_date(parts[0], year)
+        end_d   = parse_date(parts[1], year)
     else:
-        start_dt = parser.parse(date_raw)
-        end_dt   = start_dt
+        start_d = end_d = parse_date(date_raw, year)
+    if not start_d:
+        return None, None
 
     # attach times if present
-    if time_raw:
-        times = [t.strip() for t in time_raw.split(" - ")]
-        try:
-            t0 = parser.parse(times[0])
-            start_dt = start_dt.replace(hour=t0.hour, minute=t0.minute)
-            if len(times) > 1:
-                t1 = parser.parse(times[1])
-                end_dt = end_dt.replace(hour=t1.hour, minute=t1.minute)
-        except Exception:
-            pass
-
-    return start_dt.isoformat(), end_dt.isoformat()
+    start_t, end_t = parse_time_range(time_raw)
+    return iso_datetime(start_d, start_t), iso_datetime(end_d or start_d, end_t)
 
 # -----------------------------------------------------------------------------
 # SCRAPER
@@ -63,7 +57,7 @@ def parse_date_time(date_raw: str, time_raw: str):
 def scrape_fpc_events():
     resp = requests.get(CALENDAR_URL)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = parse_html(resp.text)
 
     events = []
     for art in soup.select("article.the-event"):
@@ -84,6 +78,9 @@ def scrape_fpc_events():
 
         # normalize to ISO‑8601
         start_iso, end_iso = parse_date_time(date_raw, time_raw)
+        if not start_iso:
+            print(f"⚠️  Unparseable date {date_raw!r} for {name}")
+            continue
 
         # description
         desc_el = art.select_one(".desc p")
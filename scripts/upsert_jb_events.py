@@ -4,11 +4,12 @@ import re
 import certifi
 from datetime import datetime
 import cloudscraper
-from bs4 import BeautifulSoup
 from dateutil import parser
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from scrapekit.dom import parse_html
+
 # ── Load environment variables ─────────────────────────────────────────────────
 load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -42,7 +43,7 @@ def scrape_jb_events():
     resp = scraper.get(JB_URL, headers=HEADERS, verify=certifi.where())
     resp.raise_for_status()
 
-    soup     = BeautifulSoup(resp.text, "html.parser")
+    soup     = parse_html(resp.text)
     wrappers = soup.select("div.eventWrapper")
     print(f"   Found {len(wrappers)} event wrappers.")
 